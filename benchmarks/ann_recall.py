@@ -0,0 +1,94 @@
+"""
+    Measure recall@k and latency of approximate nearest neighbor index (IvfIndex) of word embeddings against exact
+    search. Either a word2vec binary file or synthetic clustered vectors are used.
+
+    >>> python benchmarks/ann_recall.py --vocab-size 200000 --nprobe 1 4 16 64
+    >>> python benchmarks/ann_recall.py --model-path GoogleNews-vectors-negative300.bin --max-num-vector 1000000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import nlpaug.util.math.normalization as normalization
+from nlpaug.model.word_embs import IvfIndex, Word2vec
+
+
+def build_vectors(vocab_size, emb_size, num_cluster=1000, seed=2019):
+    # Random vectors have no neighborhood structure. Clustered vectors are closer to real embeddings.
+    rng = np.random.RandomState(seed)
+    centers = rng.standard_normal((num_cluster, emb_size)).astype(np.float32)
+    vectors = centers[rng.randint(num_cluster, size=vocab_size)]
+    vectors += 1.5 * rng.standard_normal((vocab_size, emb_size)).astype(np.float32)
+    return normalization.l2_norm(vectors).astype(np.float32)
+
+
+def exact_search(vectors, query, k):
+    scores = np.dot(vectors, query)
+    top_ids = np.argpartition(-scores, k - 1)[:k]
+    return top_ids[np.argsort(-scores[top_ids])]
+
+
+def measure(search_fx, queries):
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append(search_fx(query))
+    return results, (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure recall and latency of word embeddings ANN index')
+    parser.add_argument('--model-path', help='Path of word2vec binary file. Synthetic vectors are used if omitted')
+    parser.add_argument('--max-num-vector', type=int, help='Maximum number of vector loaded from model file')
+    parser.add_argument('--vocab-size', type=int, default=100000, help='Number of synthetic vector')
+    parser.add_argument('--emb-size', type=int, default=100, help='Size of synthetic vector')
+    parser.add_argument('--num-list', type=int, help='Number of clusters of index')
+    parser.add_argument('--nprobe', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32], help='Values of nprobe')
+    parser.add_argument('--k', type=int, default=10, help='Number of neighbors')
+    parser.add_argument('--num-query', type=int, default=200, help='Number of query')
+    parser.add_argument('--output', help='Path of JSON result')
+    args = parser.parse_args(argv)
+
+    if args.model_path:
+        model = Word2vec()
+        model.read(args.model_path, max_num_vector=args.max_num_vector)
+        vectors = model.normalized_vectors
+    else:
+        vectors = build_vectors(args.vocab_size, args.emb_size)
+
+    start = time.perf_counter()
+    index = IvfIndex.build(vectors, num_list=args.num_list)
+    build_sec = time.perf_counter() - start
+    print('vectors {} x {}  lists {}  build {:.1f} s'.format(len(vectors), vectors.shape[1], index.num_list,
+                                                            build_sec))
+
+    rng = np.random.RandomState(2019)
+    queries = vectors[rng.choice(len(vectors), min(args.num_query, len(vectors)), replace=False)]
+    exact_results, exact_ms = measure(lambda query: exact_search(vectors, query, args.k), queries)
+    print('{:<12} recall@{} {:>6.3f}  latency {:>8.3f} ms'.format('exact', args.k, 1.0, exact_ms))
+
+    results = []
+    for nprobe in args.nprobe:
+        index_results, index_ms = measure(lambda query: index.search(query, args.k, nprobe=nprobe), queries)
+        recall = np.mean([len(set(expected) & set(actual)) / len(expected)
+                          for expected, actual in zip(exact_results, index_results)])
+        results.append({'nprobe': nprobe, 'recall': float(recall), 'latency_ms': index_ms,
+                        'speedup': exact_ms / index_ms})
+        print('{:<12} recall@{} {:>6.3f}  latency {:>8.3f} ms  speedup {:>6.1f}x'.format(
+            'nprobe={}'.format(nprobe), args.k, recall, index_ms, exact_ms / index_ms))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'num_vector': len(vectors), 'emb_size': int(vectors.shape[1]), 'num_list': index.num_list,
+                       'k': args.k, 'build_sec': build_sec, 'exact_latency_ms': exact_ms, 'results': results},
+                      f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
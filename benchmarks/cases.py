@@ -0,0 +1,122 @@
+"""
+    Benchmark cases. Each case creates an augmenter (or flow) from local fixtures and declares type of input.
+"""
+
+import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.word as naw
+import nlpaug.augmenter.sentence as nas
+import nlpaug.augmenter.audio as naa
+import nlpaug.augmenter.spectrogram as nasp
+import nlpaug.flow as naf
+
+TEXT = 'text'
+AUDIO = 'audio'
+SPECTROGRAM = 'spectrogram'
+
+SAMPLING_RATE = 16000
+
+
+class Case:
+    """
+    :param str name: Unique name of case. It is the key of result in JSON output
+    :param str group: Module of augmenter (char, word, sentence, audio, spectrogram or flow)
+    :param str input_type: Either 'text', 'audio' or 'spectrogram'
+    :param func factory: Function which accepts Fixtures and returns augmenter
+    :param bool pretrained: If True, augmenter needs pre-trained model (downloaded from internet). It is skipped
+        unless it is requested explicitly.
+    """
+
+    def __init__(self, name, group, input_type, factory, pretrained=False):
+        self.name = name
+        self.group = group
+        self.input_type = input_type
+        self.factory = factory
+        self.pretrained = pretrained
+
+
+def _char_cases():
+    cases = [
+        Case('char.ocr.substitute', 'char', TEXT, lambda f: nac.OcrAug()),
+        Case('char.keyboard.substitute', 'char', TEXT, lambda f: nac.KeyboardAug()),
+    ]
+    for action in ['insert', 'substitute', 'swap', 'delete']:
+        cases.append(Case('char.random.' + action, 'char', TEXT, lambda f, a=action: nac.RandomCharAug(action=a)))
+    return cases
+
+
+def _word_cases():
+    cases = [
+        Case('word.wordnet.substitute', 'word', TEXT, lambda f: naw.WordNetAug()),
+        Case('word.synonym_wordnet.substitute', 'word', TEXT, lambda f: naw.SynonymAug(aug_src='wordnet')),
+        Case('word.synonym_ppdb.substitute', 'word', TEXT,
+             lambda f: naw.SynonymAug(aug_src='ppdb', model_path=f.ppdb_path)),
+        Case('word.antonym.substitute', 'word', TEXT, lambda f: naw.AntonymAug()),
+        Case('word.spelling.substitute', 'word', TEXT, lambda f: naw.SpellingAug(dict_path=f.spelling_path)),
+        Case('word.split.split', 'word', TEXT, lambda f: naw.SplitAug()),
+    ]
+    for action in ['swap', 'substitute', 'delete']:
+        cases.append(Case('word.random.' + action, 'word', TEXT, lambda f, a=action: naw.RandomWordAug(action=a)))
+    for action in ['insert', 'substitute']:
+        cases.append(Case('word.tfidf.' + action, 'word', TEXT,
+                          lambda f, a=action: naw.TfIdfAug(model_path=f.tfidf_dir, action=a)))
+        for model_type in ['word2vec', 'glove', 'fasttext']:
+            cases.append(Case('word.word_embs_{}.{}'.format(model_type, action), 'word', TEXT,
+                              lambda f, a=action, m=model_type: naw.WordEmbsAug(
+                                  model_type=m, model_path=getattr(f, m + '_path'), action=a, force_reload=True)))
+        cases.append(Case('word.context_word_embs.' + action, 'word', TEXT,
+                          lambda f, a=action: naw.ContextualWordEmbsAug(action=a), pretrained=True))
+    return cases
+
+
+def _sentence_cases():
+    return [
+        Case('sentence.context_word_embs.insert', 'sentence', TEXT,
+             lambda f: nas.ContextualWordEmbsForSentenceAug(), pretrained=True)
+    ]
+
+
+def _audio_cases():
+    return [
+        Case('audio.crop.delete', 'audio', AUDIO, lambda f: naa.CropAug(sampling_rate=SAMPLING_RATE)),
+        Case('audio.loudness.substitute', 'audio', AUDIO, lambda f: naa.LoudnessAug()),
+        Case('audio.mask.substitute', 'audio', AUDIO, lambda f: naa.MaskAug(sampling_rate=SAMPLING_RATE)),
+        Case('audio.noise.substitute', 'audio', AUDIO, lambda f: naa.NoiseAug()),
+        Case('audio.pitch.substitute', 'audio', AUDIO, lambda f: naa.PitchAug(sampling_rate=SAMPLING_RATE)),
+        Case('audio.shift.substitute', 'audio', AUDIO, lambda f: naa.ShiftAug(sampling_rate=SAMPLING_RATE)),
+        Case('audio.speed.substitute', 'audio', AUDIO, lambda f: naa.SpeedAug()),
+    ]
+
+
+def _spectrogram_cases():
+    return [
+        Case('spectrogram.frequency_masking.substitute', 'spectrogram', SPECTROGRAM,
+             lambda f: nasp.FrequencyMaskingAug(mask_factor=40)),
+        Case('spectrogram.time_masking.substitute', 'spectrogram', SPECTROGRAM,
+             lambda f: nasp.TimeMaskingAug(mask_factor=20)),
+    ]
+
+
+def _flow_cases():
+    def text_flow(f):
+        return [nac.RandomCharAug(action='insert'), naw.RandomWordAug(action='swap'),
+                naw.SpellingAug(dict_path=f.spelling_path)]
+
+    def audio_flow(f):
+        return [naa.NoiseAug(), naa.LoudnessAug(), naa.ShiftAug(sampling_rate=SAMPLING_RATE)]
+
+    def spectrogram_flow(f):
+        return [nasp.FrequencyMaskingAug(mask_factor=40), nasp.TimeMaskingAug(mask_factor=20)]
+
+    return [
+        Case('flow.sequential.text', 'flow', TEXT, lambda f: naf.Sequential(text_flow(f))),
+        Case('flow.sometimes.text', 'flow', TEXT, lambda f: naf.Sometimes(text_flow(f), pipeline_p=0.5)),
+        Case('flow.sequential.audio', 'flow', AUDIO, lambda f: naf.Sequential(audio_flow(f))),
+        Case('flow.sometimes.audio', 'flow', AUDIO, lambda f: naf.Sometimes(audio_flow(f), pipeline_p=0.5)),
+        Case('flow.sequential.spectrogram', 'flow', SPECTROGRAM, lambda f: naf.Sequential(spectrogram_flow(f))),
+        Case('flow.sometimes.spectrogram', 'flow', SPECTROGRAM,
+             lambda f: naf.Sometimes(spectrogram_flow(f), pipeline_p=0.5)),
+    ]
+
+
+def get_cases():
+    return _char_cases() + _word_cases() + _sentence_cases() + _audio_cases() + _spectrogram_cases() + _flow_cases()
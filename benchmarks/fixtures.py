@@ -0,0 +1,136 @@
+"""
+    Synthetic inputs and tiny model files for benchmark. Everything is generated locally from a fixed seed so that
+    benchmark runs offline and results are comparable across runs.
+"""
+
+import os
+import random
+import numpy as np
+
+import nlpaug.model.word_stats as nmws
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'to', 'vi', 'de', 'po', 'qu', 'ze', 'fa', 'gi', 'ho', 'ju']
+
+
+def build_vocab(size=2000, seed=2019):
+    rng = random.Random(seed)
+    vocab = set()
+    while len(vocab) < size:
+        vocab.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(vocab)
+
+
+def build_texts(vocab, num_item, length, seed=2019):
+    """
+    :param list vocab: Words of synthetic text
+    :param int num_item: Number of text
+    :param int length: Number of words per text
+    """
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(num_item):
+        tokens = [rng.choice(vocab) for _ in range(length)]
+        tokens[0] = tokens[0].capitalize()
+        texts.append(' '.join(tokens) + ' .')
+    return texts
+
+
+def build_audios(num_item, length, sampling_rate=16000, seed=2019):
+    """
+    :param int length: Duration in millisecond
+    """
+    rng = np.random.RandomState(seed)
+    size = int(sampling_rate * length / 1000)
+    t = np.arange(size, dtype=np.float32) / sampling_rate
+    audios = []
+    for _ in range(num_item):
+        freq = rng.uniform(100, 1000)
+        audio = 0.5 * np.sin(2 * np.pi * freq * t) + 0.01 * rng.standard_normal(size)
+        audios.append(audio.astype(np.float32))
+    return audios
+
+
+def build_spectrograms(num_item, length, num_freq=128, seed=2019):
+    """
+    :param int length: Number of time step
+    """
+    rng = np.random.RandomState(seed)
+    return [rng.uniform(0, 1, (num_freq, length)).astype(np.float32) for _ in range(num_item)]
+
+
+def write_word2vec(file_path, vocab, emb_size=25, seed=2019):
+    rng = np.random.RandomState(seed)
+    with open(file_path, 'wb') as f:
+        f.write('{} {}\n'.format(len(vocab), emb_size).encode('utf-8'))
+        for word in vocab:
+            f.write(word.encode('utf-8') + b' ')
+            f.write(rng.standard_normal(emb_size).astype(np.float32).tobytes())
+
+
+def write_glove(file_path, vocab, emb_size=25, seed=2019):
+    # GloVe reader assumes dimension is multiple of 25
+    rng = np.random.RandomState(seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for word in vocab:
+            f.write(word + ' ' + ' '.join('{:.6f}'.format(v) for v in rng.standard_normal(emb_size)) + '\n')
+
+
+def write_fasttext(file_path, vocab, emb_size=25, seed=2019):
+    rng = np.random.RandomState(seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('{} {}\n'.format(len(vocab), emb_size))
+        for word in vocab:
+            f.write(word + ' ' + ' '.join('{:.6f}'.format(v) for v in rng.standard_normal(emb_size)) + '\n')
+
+
+def write_tfidf(model_dir, texts):
+    tfidf_model = nmws.TfIdf()
+    tfidf_model.train([text.split(' ') for text in texts])
+    tfidf_model.save(model_dir)
+
+
+def write_spelling(file_path, vocab, seed=2019):
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for word in vocab:
+            misspellings = {word[:-1] + c for c in rng.sample('aeiou', 2)}
+            f.write(word + ' ' + ' '.join(sorted(misspellings)) + '\n')
+
+
+def write_ppdb(file_path, vocab, seed=2019):
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for word in vocab:
+            for paraphrase in rng.sample(vocab, 3):
+                f.write('[NN] ||| {} ||| {} ||| AGigaSim=0.8 PPDB2.0Score=3.5 ||| 0-0 ||| ForwardEntailment\n'.format(
+                    word, paraphrase))
+
+
+class Fixtures:
+    """
+    Generate model files (word embeddings, TF-IDF, spelling and PPDB dictionary) under fixture_dir.
+
+    :param str fixture_dir: Directory of generated model files
+    :param int vocab_size: Number of words of synthetic vocabulary
+    """
+
+    def __init__(self, fixture_dir, vocab_size=2000):
+        self.fixture_dir = fixture_dir
+        self.vocab = build_vocab(vocab_size)
+
+        self.word2vec_path = os.path.join(fixture_dir, 'word2vec.bin')
+        self.glove_path = os.path.join(fixture_dir, 'glove.txt')
+        self.fasttext_path = os.path.join(fixture_dir, 'fasttext.vec')
+        self.tfidf_dir = fixture_dir
+        self.spelling_path = os.path.join(fixture_dir, 'spelling_en.txt')
+        self.ppdb_path = os.path.join(fixture_dir, 'ppdb.txt')
+
+    def build(self):
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        write_word2vec(self.word2vec_path, self.vocab)
+        write_glove(self.glove_path, self.vocab)
+        write_fasttext(self.fasttext_path, self.vocab)
+        write_tfidf(self.tfidf_dir, build_texts(self.vocab, 500, 20))
+        write_spelling(self.spelling_path, self.vocab)
+        write_ppdb(self.ppdb_path, self.vocab)
+        return self
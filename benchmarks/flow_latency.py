@@ -0,0 +1,99 @@
+"""
+    Compare latency of flow (and its augmenters) with another checkout of nlpaug, e.g. the last release. Each checkout
+    is measured in its own interpreter and rounds alternate between them so that both see same machine load. Global
+    random state is seeded before every repeat so that both checkouts draw same random numbers if their augmenters do.
+
+    >>> git worktree add /tmp/nlpaug-baseline <commit of baseline>
+    >>> python benchmarks/flow_latency.py --baseline-path /tmp/nlpaug-baseline --threshold 0.15
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import timeit
+
+TEXT = 'The quick brown fox jumps over the lazy dog'
+PACKAGE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def measure(package_path, number, repeat, text_length):
+    """
+    :return: dict of case name and best latency (in microsecond) of package in package_path
+    """
+    sys.path.insert(0, package_path)
+    import nlpaug.augmenter.char as nac
+    import nlpaug.augmenter.word as naw
+    import nlpaug.flow as naf
+
+    text = ' '.join([TEXT] * text_length)
+    augs = [nac.KeyboardAug(), naw.RandomWordAug(action='swap'), nac.OcrAug()]
+    flow = naf.Sequential(augs)
+    cases = [(aug.name, lambda aug=aug: aug.augment(text), number) for aug in augs]
+    cases.append(('flow.n1', lambda: flow.augment(text), number))
+    cases.append(('flow.n10', lambda: flow.augment(text, n=10), max(1, number // 10)))
+
+    results = {}
+    for name, fx, num in cases:
+        best = float('inf')
+        for _ in range(repeat):
+            random.seed(2019)
+            best = min(best, timeit.timeit(fx, number=num) / num)
+        results[name] = best * 1e6
+    return results
+
+
+def run_worker(package_path, args):
+    command = [sys.executable, os.path.abspath(__file__), '--worker', package_path, '--number', str(args.number),
+               '--repeat', str(args.repeat), '--text-length', str(args.text_length)]
+    return json.loads(subprocess.check_output(command).decode('utf-8'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare flow latency with another checkout of nlpaug')
+    parser.add_argument('--baseline-path', help='Path of baseline checkout (directory which contains nlpaug)')
+    parser.add_argument('--threshold', type=float, default=0.15, help='Allowed relative slowdown of flow')
+    parser.add_argument('--rounds', type=int, default=5, help='Number of alternating rounds per checkout')
+    parser.add_argument('--number', type=int, default=2000, help='Number of calls per repeat')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of repeat per round')
+    parser.add_argument('--text-length', type=int, default=1, help='Number of sentences (9 words) per text')
+    parser.add_argument('--output', help='Path of JSON result')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.number, args.repeat, args.text_length)))
+        return 0
+
+    paths = {'current': PACKAGE_PATH}
+    if args.baseline_path:
+        paths['baseline'] = os.path.abspath(args.baseline_path)
+
+    # Best of all rounds
+    results = {key: {} for key in paths}
+    for _ in range(args.rounds):
+        for key, path in paths.items():
+            for name, latency in run_worker(path, args).items():
+                results[key][name] = min(latency, results[key].get(name, float('inf')))
+
+    is_regressed = False
+    for name, latency in results['current'].items():
+        line = '{:<16} {:>10.1f} us'.format(name, latency)
+        if 'baseline' in results:
+            ratio = latency / results['baseline'][name]
+            line += '  baseline {:>10.1f} us  ratio {:.2f}'.format(results['baseline'][name], ratio)
+            if name.startswith('flow.') and ratio > 1 + args.threshold:
+                line += '  REGRESSION'
+                is_regressed = True
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 1 if is_regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
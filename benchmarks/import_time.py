@@ -0,0 +1,81 @@
+"""
+    Measure import time of nlpaug in fresh interpreter. Each scenario is compared with eager loading (all submodules
+    are imported by star import, same as before lazy loading) so that the speedup of lazy loading is visible. Heavy
+    dependencies which are loaded by each scenario are reported as well.
+
+    >>> python benchmarks/import_time.py --output import_time.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ['torch', 'transformers', 'nltk', 'librosa', 'matplotlib', 'requests']
+
+SCENARIOS = [
+    ('nlpaug', 'import nlpaug'),
+    ('char.RandomCharAug', 'import nlpaug.augmenter.char as nac; nac.RandomCharAug()'),
+    ('word.RandomWordAug', 'import nlpaug.augmenter.word as naw; naw.RandomWordAug()'),
+    ('audio.NoiseAug', 'import nlpaug.augmenter.audio as naa; naa.NoiseAug()'),
+    ('spectrogram.FrequencyMaskingAug',
+     'import nlpaug.augmenter.spectrogram as nas; nas.FrequencyMaskingAug(mask_factor=10)'),
+    ('flow.Sequential', 'import nlpaug.flow as naf; naf.Sequential()'),
+]
+
+EAGER_IMPORT = '; '.join('from {} import *'.format(package) for package in [
+    'nlpaug.util', 'nlpaug.augmenter.char', 'nlpaug.augmenter.word', 'nlpaug.augmenter.sentence',
+    'nlpaug.augmenter.audio', 'nlpaug.augmenter.spectrogram', 'nlpaug.model.audio', 'nlpaug.model.char',
+    'nlpaug.model.lang_models', 'nlpaug.model.spectrogram', 'nlpaug.model.word_dict', 'nlpaug.model.word_embs',
+    'nlpaug.model.word_stats'])
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(','.join(m for m in {heavy_modules!r} if m in sys.modules))
+"""
+
+
+def measure(code, repeat):
+    elapses = []
+    loaded_modules = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', PROBE.format(code=code, heavy_modules=HEAVY_MODULES)], cwd=ROOT_DIR,
+            stderr=subprocess.DEVNULL, universal_newlines=True)
+        elapsed, modules = output.split('\n')[-3:-1]
+        elapses.append(float(elapsed))
+        loaded_modules = [m for m in modules.split(',') if m]
+    return float(np.median(elapses)) * 1000, loaded_modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure import time of nlpaug')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of fresh interpreter per scenario')
+    parser.add_argument('--output', help='Path of JSON result')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, code in SCENARIOS:
+        lazy_ms, lazy_modules = measure(code, args.repeat)
+        eager_ms, eager_modules = measure(EAGER_IMPORT + '; ' + code, args.repeat)
+        results[name] = {
+            'lazy_ms': lazy_ms, 'eager_ms': eager_ms, 'speedup': eager_ms / lazy_ms,
+            'lazy_heavy_modules': lazy_modules, 'eager_heavy_modules': eager_modules
+        }
+        print('{:<35} lazy {:>8.1f} ms  eager {:>8.1f} ms  speedup {:>5.1f}x  heavy modules: {}'.format(
+            name, lazy_ms, eager_ms, eager_ms / lazy_ms, ','.join(lazy_modules) or '-'))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'python_version': sys.version.split()[0], 'results': results}, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
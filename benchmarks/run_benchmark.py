@@ -0,0 +1,193 @@
+"""
+    Measure throughput, latency and peak memory of augmenters and flows.
+
+    >>> python benchmarks/run_benchmark.py --output result.json
+    >>> python benchmarks/run_benchmark.py --output result.json --baseline baseline.json --threshold 0.2
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import nlpaug
+from fixtures import Fixtures, build_texts, build_audios, build_spectrograms
+from cases import get_cases, TEXT, AUDIO, SPECTROGRAM, SAMPLING_RATE
+
+SCHEMA_VERSION = 1
+
+
+def build_inputs(fixtures, input_type, num_item, text_length, audio_length, spectrogram_length):
+    if input_type == TEXT:
+        return build_texts(fixtures.vocab, num_item, text_length)
+    if input_type == AUDIO:
+        return build_audios(num_item, audio_length, sampling_rate=SAMPLING_RATE)
+    if input_type == SPECTROGRAM:
+        return build_spectrograms(num_item, spectrogram_length)
+    raise ValueError('Unknown input type [{}]'.format(input_type))
+
+
+def measure(aug, inputs, num_warmup, num_memory_item):
+    for data in inputs[:num_warmup]:
+        aug.augment(data)
+
+    latencies = []
+    start = time.perf_counter()
+    for data in inputs:
+        item_start = time.perf_counter()
+        aug.augment(data)
+        latencies.append(time.perf_counter() - item_start)
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc slows down execution so peak memory is measured in a separated pass
+    tracemalloc.start()
+    for data in inputs[:num_memory_item]:
+        aug.augment(data)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'status': 'ok',
+        'num_item': len(inputs),
+        'throughput': len(inputs) / elapsed,
+        'latency_p50_ms': float(np.percentile(latencies, 50)),
+        'latency_p99_ms': float(np.percentile(latencies, 99)),
+        'latency_mean_ms': float(latencies.mean()),
+        'peak_memory_kb': peak_memory / 1024,
+    }
+
+
+def run(args):
+    fixture_dir = args.fixture_dir or tempfile.mkdtemp(prefix='nlpaug_benchmark_')
+    try:
+        results = run_cases(args, Fixtures(fixture_dir, vocab_size=args.vocab_size).build())
+    finally:
+        if args.fixture_dir is None:
+            shutil.rmtree(fixture_dir, ignore_errors=True)
+
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'meta': {
+            'nlpaug_version': nlpaug.__version__,
+            'python_version': platform.python_version(),
+            'numpy_version': np.__version__,
+            'platform': platform.platform(),
+            'num_item': args.num_item,
+            'text_length': args.text_length,
+            'audio_length': args.audio_length,
+            'spectrogram_length': args.spectrogram_length,
+            'vocab_size': args.vocab_size,
+        },
+        'results': results
+    }
+
+
+def run_cases(args, fixtures):
+    results = {}
+    for case in get_cases():
+        if args.filter and not any(fnmatch.fnmatch(case.name, pattern) for pattern in args.filter):
+            continue
+        if case.pretrained and not args.include_pretrained:
+            results[case.name] = {'status': 'skipped', 'reason': 'Pre-trained model is required'}
+            continue
+
+        try:
+            setup_start = time.perf_counter()
+            aug = case.factory(fixtures)
+            setup_time = time.perf_counter() - setup_start
+
+            inputs = build_inputs(fixtures, case.input_type, args.num_item, args.text_length, args.audio_length,
+                                  args.spectrogram_length)
+            result = measure(aug, inputs, args.num_warmup, args.num_memory_item)
+            result['setup_time_s'] = setup_time
+        except (ImportError, LookupError, OSError) as e:
+            # Missing optional library or corpus (e.g. nltk wordnet)
+            result = {'status': 'skipped', 'reason': '{}: {}'.format(type(e).__name__, str(e).strip()[:200])}
+        except Exception as e:
+            # Report failure of single case instead of aborting whole benchmark
+            result = {'status': 'error', 'reason': '{}: {}'.format(type(e).__name__, str(e).strip()[:200])}
+
+        results[case.name] = result
+        if args.verbose:
+            if result['status'] == 'ok':
+                print('{:<45} {:>10.1f} items/s  p50 {:>8.3f} ms  p99 {:>8.3f} ms  peak {:>10.1f} KB'.format(
+                    case.name, result['throughput'], result['latency_p50_ms'], result['latency_p99_ms'],
+                    result['peak_memory_kb']))
+            else:
+                print('{:<45} {} ({})'.format(case.name, result['status'], result['reason'].split('\n')[0]))
+
+    return results
+
+
+def compare(current, baseline, threshold):
+    """
+    :param dict current: Result of this run
+    :param dict baseline: Stored result
+    :param float threshold: Allowed relative slowdown (e.g. 0.2 means 20%)
+    :return: List of regression. Throughput drop, p99 latency or peak memory increase beyond threshold are reported.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or result['status'] != 'ok' or base['status'] != 'ok':
+            continue
+
+        if result['throughput'] < base['throughput'] * (1 - threshold):
+            regressions.append((name, 'throughput', base['throughput'], result['throughput']))
+        for metric in ['latency_p99_ms', 'peak_memory_kb']:
+            if result[metric] > base[metric] * (1 + threshold):
+                regressions.append((name, metric, base[metric], result[metric]))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark nlpaug augmenters and flows')
+    parser.add_argument('--output', help='Path of JSON result')
+    parser.add_argument('--baseline', help='Path of JSON result to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed relative regression')
+    parser.add_argument('--filter', nargs='*', help='Glob patterns of case name (e.g. "word.*")')
+    parser.add_argument('--num-item', type=int, default=200)
+    parser.add_argument('--num-warmup', type=int, default=10)
+    parser.add_argument('--num-memory-item', type=int, default=20)
+    parser.add_argument('--text-length', type=int, default=30, help='Number of words per text')
+    parser.add_argument('--audio-length', type=int, default=1000, help='Duration of audio in millisecond')
+    parser.add_argument('--spectrogram-length', type=int, default=400, help='Number of time step of spectrogram')
+    parser.add_argument('--vocab-size', type=int, default=2000)
+    parser.add_argument('--fixture-dir', help='Directory of generated fixtures. Default is a temporary directory')
+    parser.add_argument('--include-pretrained', action='store_true',
+                        help='Include augmenters which need pre-trained model (network access is required)')
+    parser.add_argument('--quiet', dest='verbose', action='store_false')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    result = run(args)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        for name, metric, base_value, value in regressions:
+            print('Regression: {} {} {:.3f} -> {:.3f}'.format(name, metric, base_value, value))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
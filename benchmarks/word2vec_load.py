@@ -0,0 +1,123 @@
+"""
+    Measure load time of word2vec binary file by Word2vec.read and compare it with byte by byte reader of nlpaug 0.0.10
+    (and with memory mapped binary format). Loaded vocabulary and vectors are verified to be identical.
+
+    >>> python benchmarks/word2vec_load.py --vocab-size 300000 --emb-size 300
+    >>> python benchmarks/word2vec_load.py --model-path GoogleNews-vectors-negative300.bin --max-num-vector 500000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nlpaug.model.word_embs import Word2vec
+
+
+def read_legacy(file_path, max_num_vector=None):
+    # Reader of nlpaug 0.0.10
+    i2w, w2i, w2v = {}, {}, {}
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        vocab_size, emb_size = map(int, header.split())
+        if max_num_vector is not None:
+            vocab_size = min(max_num_vector, vocab_size)
+
+        vectors = np.zeros((vocab_size, emb_size), dtype=np.float32)
+        binary_len = np.dtype(np.float32).itemsize * emb_size
+        for _ in range(vocab_size):
+            word = []
+            while True:
+                ch = f.read(1)
+                if ch == b' ':
+                    word = ''.join(word)
+                    break
+                if ch != '\n':
+                    word.append(ch.decode('cp437'))
+            values = np.frombuffer(f.read(binary_len), dtype=np.float32)
+
+            vectors[len(i2w)] = values
+            i2w[len(i2w)] = word
+            w2i[word] = len(w2i)
+            w2v[word] = values
+    return vectors, i2w, w2i
+
+
+def write_word2vec(file_path, vocab_size, emb_size, seed=2019):
+    rng = np.random.RandomState(seed)
+    with open(file_path, 'wb') as f:
+        f.write('{} {}\n'.format(vocab_size, emb_size).encode('utf-8'))
+        for i in range(vocab_size):
+            # Same layout as GoogleNews model: vector is followed by new line
+            f.write('word_{}'.format(i).encode('utf-8') + b' ')
+            f.write(rng.standard_normal(emb_size).astype(np.float32).tobytes() + b'\n')
+
+
+def measure(fx, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fx()
+        elapsed.append(time.perf_counter() - start)
+    return result, min(elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure load time of word2vec binary file')
+    parser.add_argument('--model-path', help='Path of word2vec binary file. Synthetic file is used if omitted')
+    parser.add_argument('--max-num-vector', type=int, help='Maximum number of vector loaded')
+    parser.add_argument('--vocab-size', type=int, default=100000, help='Number of synthetic vector')
+    parser.add_argument('--emb-size', type=int, default=300, help='Size of synthetic vector')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of load per reader')
+    parser.add_argument('--skip-legacy', action='store_true', help='Do not run byte by byte reader')
+    parser.add_argument('--output', help='Path of JSON result')
+    args = parser.parse_args(argv)
+
+    dir_path = tempfile.mkdtemp()
+    try:
+        if args.model_path:
+            # Binary format is written next to model file. Use a link so that it is created in temporary directory.
+            file_path = os.path.join(dir_path, os.path.basename(args.model_path))
+            os.symlink(os.path.abspath(args.model_path), file_path)
+        else:
+            file_path = os.path.join(dir_path, 'word2vec.bin')
+            write_word2vec(file_path, args.vocab_size, args.emb_size)
+
+        def read():
+            model = Word2vec(skip_check=True)
+            model.read(file_path, max_num_vector=args.max_num_vector)
+            return model
+
+        model, read_sec = measure(read, args.repeat)
+        results = {'num_vector': len(model.vectors), 'emb_size': model.emb_size, 'read_sec': read_sec}
+        print('vectors {} x {}'.format(len(model.vectors), model.emb_size))
+        print('{:<12} {:>8.2f} s'.format('read', read_sec))
+
+        if not args.skip_legacy:
+            (vectors, i2w, w2i), legacy_sec = measure(lambda: read_legacy(file_path, args.max_num_vector), 1)
+            is_identical = i2w == model.i2w and w2i == model.w2i and np.array_equal(vectors, model.vectors)
+            results.update({'legacy_read_sec': legacy_sec, 'speedup': legacy_sec / read_sec,
+                            'is_identical': is_identical})
+            print('{:<12} {:>8.2f} s  speedup {:.1f}x  identical {}'.format(
+                'legacy', legacy_sec, legacy_sec / read_sec, is_identical))
+
+        model.save_binary(file_path)
+        _, binary_sec = measure(read, args.repeat)
+        results['binary_read_sec'] = binary_sec
+        print('{:<12} {:>8.2f} s'.format('binary', binary_sec))
+    finally:
+        shutil.rmtree(dir_path)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
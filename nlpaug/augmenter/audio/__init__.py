@@ -1,9 +1,13 @@
 from __future__ import absolute_import
-from nlpaug.augmenter.audio.audio_augmenter import *
-from nlpaug.augmenter.audio.noise import *
-from nlpaug.augmenter.audio.shift import *
-from nlpaug.augmenter.audio.speed import *
-from nlpaug.augmenter.audio.pitch import *
-from nlpaug.augmenter.audio.loudness import *
-from nlpaug.augmenter.audio.crop import *
-from nlpaug.augmenter.audio.mask import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'audio_augmenter': ['AudioAugmenter'],
+    'noise': ['NoiseAug'],
+    'shift': ['ShiftAug'],
+    'speed': ['SpeedAug'],
+    'pitch': ['PitchAug'],
+    'loudness': ['LoudnessAug'],
+    'crop': ['CropAug'],
+    'mask': ['MaskAug'],
+})
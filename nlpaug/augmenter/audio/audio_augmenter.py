@@ -2,6 +2,7 @@ import numpy as np
 
 from nlpaug.util import Method
 from nlpaug import Augmenter
+from nlpaug.util.dedup import array_dedup_key
 
 
 class AudioAugmenter(Augmenter):
@@ -22,3 +23,7 @@ class AudioAugmenter(Augmenter):
             if np.array_equal(d, data):
                 return True
         return False
+
+    @classmethod
+    def get_dedup_key(cls, data):
+        return array_dedup_key(data)
@@ -1,7 +1,143 @@
+class Augment:
+    """
+    One edit of augmented text. Original text is transformed to augmented text by replacing original[pos:pos +
+    len(original)] with new.
 
+    :param int pos: Character offset of edit in original text
+    :param str original: Replaced text. Empty string means insertion.
+    :param str new: Replacement. Empty string means deletion.
+    """
+    __slots__ = ('pos', 'original', 'new')
 
-class Augment:
     def __init__(self, pos, original, new):
         self.pos = pos
         self.original = original
         self.new = new
+
+    def to_tuple(self):
+        return self.pos, self.original, self.new
+
+    def __eq__(self, other):
+        return isinstance(other, Augment) and self.to_tuple() == other.to_tuple()
+
+    def __hash__(self):
+        return hash(self.to_tuple())
+
+    def __repr__(self):
+        return 'Augment(pos={}, original={!r}, new={!r})'.format(self.pos, self.original, self.new)
+
+    def __getstate__(self):
+        return self.to_tuple()
+
+    def __setstate__(self, state):
+        self.pos, self.original, self.new = state
+
+
+def get_edits(original, augmented):
+    """
+    Align space separated tokens of original and augmented text in one linear pass. Augmenters tokenize text by space
+    so that substitution and swap keep number of tokens, and insertion (deletion) keeps original (augmented) tokens
+    in order. Changed part which cannot be aligned this way is returned as one edit.
+
+    :param str original: Original text
+    :param str augmented: Augmented text
+    :return: List of Augment (sorted by position) which transforms original to augmented
+    """
+    if original == augmented:
+        return []
+
+    original_tokens = original.split(' ')
+    augmented_tokens = augmented.split(' ')
+    offsets = [0]
+    for token in original_tokens:
+        offsets.append(offsets[-1] + len(token) + 1)
+
+    # Skip common head and tail
+    start = 0
+    max_start = min(len(original_tokens), len(augmented_tokens))
+    while start < max_start and original_tokens[start] == augmented_tokens[start]:
+        start += 1
+    original_end, augmented_end = len(original_tokens), len(augmented_tokens)
+    while original_end > start and augmented_end > start and \
+            original_tokens[original_end - 1] == augmented_tokens[augmented_end - 1]:
+        original_end -= 1
+        augmented_end -= 1
+
+    if original_end - start == augmented_end - start:
+        # Substitution and swap. Tokens are mapped one to one.
+        return [Augment(offsets[i], original_tokens[i], augmented_tokens[j])
+                for i, j in zip(range(start, original_end), range(start, augmented_end))
+                if original_tokens[i] != augmented_tokens[j]]
+
+    if original_end - start > augmented_end - start:
+        edits = _align_subsequence(original_tokens, start, original_end, augmented_tokens, start, augmented_end,
+                                   offsets, is_deletion=True)
+    else:
+        edits = _align_subsequence(augmented_tokens, start, augmented_end, original_tokens, start, original_end,
+                                   offsets, is_deletion=False)
+    if edits is not None:
+        return edits
+
+    # Replace whole changed part
+    return [Augment(offsets[start], ' '.join(original_tokens[start:original_end]),
+                    ' '.join(augmented_tokens[start:augmented_end]))]
+
+
+def _align_subsequence(tokens, start, end, sub_tokens, sub_start, sub_end, offsets, is_deletion):
+    """
+    Greedily match sub_tokens[sub_start:sub_end] against tokens[start:end]. Unmatched tokens are deleted from (or
+    inserted into) original text.
+
+    :return: List of Augment. None if sub_tokens is not a subsequence of tokens.
+    """
+    unmatched_runs = []
+    j = sub_start
+    for i in range(start, end):
+        if j < sub_end and tokens[i] == sub_tokens[j]:
+            j += 1
+            continue
+        if unmatched_runs and unmatched_runs[-1][1] == i:
+            unmatched_runs[-1][1] = i + 1
+        else:
+            # Position of run in the other text
+            unmatched_runs.append([i, i + 1, j])
+    if j < sub_end:
+        return None
+
+    edits = []
+    for run_start, run_end, other_idx in unmatched_runs:
+        text = ' '.join(tokens[run_start:run_end])
+        if is_deletion:
+            # Remove run with its following (or preceding if it is the last token) space
+            if run_end < len(tokens):
+                edits.append(Augment(offsets[run_start], text + ' ', ''))
+            elif run_start > 0:
+                edits.append(Augment(offsets[run_start] - 1, ' ' + text, ''))
+            else:
+                return None
+        else:
+            # Insert run before token other_idx of original text (or after the last token)
+            if other_idx < len(offsets) - 1:
+                edits.append(Augment(offsets[other_idx], '', text + ' '))
+            else:
+                edits.append(Augment(offsets[-1] - 1, '', ' ' + text))
+    return edits
+
+
+def apply_edits(original, edits):
+    """
+    :param str original: Original text
+    :param list edits: List of Augment (or (pos, original, new) tuple) returned by get_edits
+    :return: Augmented text
+    """
+    edits = [edit if isinstance(edit, Augment) else Augment(*edit) for edit in edits]
+    outputs = []
+    start = 0
+    for edit in sorted(edits, key=lambda e: e.pos):
+        if edit.pos < start or original[edit.pos:edit.pos + len(edit.original)] != edit.original:
+            raise ValueError('{} does not match original text'.format(edit))
+        outputs.append(original[start:edit.pos])
+        outputs.append(edit.new)
+        start = edit.pos + len(edit.original)
+    outputs.append(original[start:])
+    return ''.join(outputs)
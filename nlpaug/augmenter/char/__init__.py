@@ -1,5 +1,9 @@
 from __future__ import absolute_import
-from nlpaug.augmenter.char.char_augmenter import *
-from nlpaug.augmenter.char.ocr import *
-from nlpaug.augmenter.char.random import *
-from nlpaug.augmenter.char.keyboard import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'char_augmenter': ['CharAugmenter'],
+    'ocr': ['OcrAug'],
+    'random': ['RandomCharAug'],
+    'keyboard': ['KeyboardAug'],
+})
@@ -1,9 +1,16 @@
 from nlpaug.util import Method
 from nlpaug import Augmenter
+from nlpaug.util.dedup import text_dedup_key
 from nlpaug.util import WarningException, WarningName, WarningCode, WarningMessage
+from nlpaug.util.instrumentation import Counter
+from nlpaug.util.text.token_filter import StopwordIndex
+from nlpaug.util.text.token_sequence import TokenSequence, is_token_mode
 
 
 class CharAugmenter(Augmenter):
+    # Derived from stopwords
+    CACHE_IGNORED_ATTRS = Augmenter.CACHE_IGNORED_ATTRS + ['stopword_index']
+
     def __init__(self, action, name='Char_Aug', min_char=2, aug_char_min=1, aug_char_max=10, aug_char_p=0.3,
                  aug_word_min=1, aug_word_max=10, aug_word_p=0.3, tokenizer=None, reverse_tokenizer=None,
                  stopwords=None, device='cpu', verbose=0):
@@ -22,8 +29,20 @@ class CharAugmenter(Augmenter):
         self.reverse_tokenizer = reverse_tokenizer or self._reverse_tokenizer
         self.stopwords = stopwords
 
+    @property
+    def stopwords(self):
+        return self._stopwords
+
+    @stopwords.setter
+    def stopwords(self, stopwords):
+        # Compiled once instead of searching list for every token
+        self._stopwords = stopwords
+        self.stopword_index = StopwordIndex(stopwords)
+
     @classmethod
     def _tokenizer(cls, text):
+        if isinstance(text, TokenSequence):
+            return list(text)
         return text.split(' ')
 
     @classmethod
@@ -32,8 +51,13 @@ class CharAugmenter(Augmenter):
 
     @classmethod
     def _reverse_tokenizer(cls, tokens):
+        if is_token_mode():
+            return TokenSequence.from_tokens(tokens)
         return ' '.join(tokens)
 
+    def accepts_token_sequence(self):
+        return self._is_default_tokenizer()
+
     @classmethod
     def clean(cls, data):
         return data.strip()
@@ -45,6 +69,10 @@ class CharAugmenter(Augmenter):
                 return True
         return False
 
+    @classmethod
+    def get_dedup_key(cls, data):
+        return text_dedup_key(data)
+
     def skip_aug(self, token_idxes, tokens):
         return token_idxes
 
@@ -55,17 +83,18 @@ class CharAugmenter(Augmenter):
                 return None
 
         aug_cnt = self._generate_aug_cnt(len(tokens), aug_min, aug_max, aug_p)
-        idxes = [i for i, t in enumerate(tokens)]
+        idxes = list(range(len(tokens)))
         if mode == Method.WORD:
-            # skip stopwords
-            idxes = [i for i in idxes if self.stopwords is None or tokens[i] not in self.stopwords]
-            # skip short word
+            # skip short word and stopwords
             idxes = [i for i in idxes if len(tokens[i]) >= self.min_char]
+            if self.stopword_index:
+                idxes = [i for i in idxes if tokens[i] not in self.stopword_index]
 
         elif mode == Method.CHAR:
             idxes = self.skip_aug(idxes, tokens)
 
         if len(idxes) == 0:
+            self.instrumentation.incr(self.name, Counter.OOV_SKIPS)
             if self.verbose > 0:
                 exception = WarningException(name=WarningName.OUT_OF_VOCABULARY,
                                              code=WarningCode.WARNING_CODE_002, msg=WarningMessage.NO_WORD)
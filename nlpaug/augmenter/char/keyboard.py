@@ -22,7 +22,8 @@ class KeyboardAug(CharAugmenter):
     :param int aug_word_max: Maximum number of word will be augmented. If None is passed, number of augmentation is
         calculated via aup_word_p. If calculated result from aug_p is smaller than aug_max, will use calculated result
         from aug_word_p. Otherwise, using aug_max.
-    :param list stopwords: List of words which will be skipped from augment operation.
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive
+        (e.g. "The" is skipped if "the" is given).
     :param func tokenizer: Customize tokenization process
     :param func reverse_tokenizer: Customize reverse of tokenization process
     :param bool special_char: Include special character
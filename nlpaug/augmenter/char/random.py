@@ -36,7 +36,8 @@ class RandomCharAug(CharAugmenter):
         only consider adjacent character (within same word). 'middle' means swap action consider adjacent character but
         not the first and last character of word. 'random' means swap action will be executed without constraint.
     :param str spec_char: Special character may be included in augmented data.
-    :param list stopwords: List of words which will be skipped from augment operation.
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive
+        (e.g. "The" is skipped if "the" is given).
     :param func tokenizer: Customize tokenization process
     :param func reverse_tokenizer: Customize reverse of tokenization process
     :param str name: Name of this augmenter.
@@ -1,3 +1,8 @@
 from __future__ import absolute_import
-from nlpaug.augmenter.sentence.sentence_augmenter import *
-from nlpaug.augmenter.sentence.context_word_embs_sentence import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'sentence_augmenter': ['SentenceAugmenter'],
+    'context_word_embs_sentence': ['XLNET_MODEL', 'GPT2_MODEL', 'init_xlnet_model', 'init_gpt2_model',
+        'ContextualWordEmbsForSentenceAug'],
+})
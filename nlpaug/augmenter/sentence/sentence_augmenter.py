@@ -1,5 +1,6 @@
 from nlpaug.util import Method
 from nlpaug import Augmenter
+from nlpaug.util.dedup import text_dedup_key
 
 
 class SentenceAugmenter(Augmenter):
@@ -30,3 +31,7 @@ class SentenceAugmenter(Augmenter):
             if d == data:
                 return True
         return False
+
+    @classmethod
+    def get_dedup_key(cls, data):
+        return text_dedup_key(data)
@@ -1,4 +1,8 @@
 from __future__ import absolute_import
-from nlpaug.augmenter.spectrogram.spectrogram_augmenter import *
-from nlpaug.augmenter.spectrogram.frequency_masking import *
-from nlpaug.augmenter.spectrogram.time_masking import *
\ No newline at end of file
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'spectrogram_augmenter': ['SpectrogramAugmenter'],
+    'frequency_masking': ['FrequencyMaskingAug'],
+    'time_masking': ['TimeMaskingAug'],
+})
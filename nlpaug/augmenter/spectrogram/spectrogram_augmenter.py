@@ -2,6 +2,7 @@ import numpy as np
 
 from nlpaug.util import Method
 from nlpaug import Augmenter
+from nlpaug.util.dedup import array_dedup_key
 
 
 class SpectrogramAugmenter(Augmenter):
@@ -20,3 +21,7 @@ class SpectrogramAugmenter(Augmenter):
             if np.array_equal(d, data):
                 return True
         return False
+
+    @classmethod
+    def get_dedup_key(cls, data):
+        return array_dedup_key(data)
@@ -1,11 +1,16 @@
 from __future__ import absolute_import
-from nlpaug.augmenter.word.word_augmenter import *
-from nlpaug.augmenter.word.wordnet import *
-from nlpaug.augmenter.word.random import *
-from nlpaug.augmenter.word.word_embs import *
-from nlpaug.augmenter.word.tfidf import *
-from nlpaug.augmenter.word.spelling import *
-from nlpaug.augmenter.word.context_word_embs import *
-from nlpaug.augmenter.word.synonym import *
-from nlpaug.augmenter.word.antonym import *
-from nlpaug.augmenter.word.split import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'word_augmenter': ['WordAugmenter'],
+    'wordnet': ['WordNetAug'],
+    'random': ['RandomWordAug'],
+    'word_embs': ['WORD2VEC_MODEL', 'GLOVE_MODEL', 'FASTTEXT_MODEL', 'model_types', 'init_word2vec_model',
+        'init_glove_model', 'init_fasttext_model', 'WordEmbsAug'],
+    'tfidf': ['TFIDF_MODEL', 'init_tfidf_model', 'TfIdfAug'],
+    'spelling': ['SPELLING_ERROR_MODEL', 'init_spelling_error_model', 'SpellingAug'],
+    'context_word_embs': ['BERT_MODEL', 'XLNET_MODEL', 'init_bert_model', 'init_xlnet_model', 'ContextualWordEmbsAug'],
+    'synonym': ['PPDB_MODEL', 'init_ppdb_model', 'SynonymAug'],
+    'antonym': ['AntonymAug'],
+    'split': ['SplitAug'],
+})
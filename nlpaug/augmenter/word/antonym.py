@@ -4,6 +4,7 @@
 
 from nlpaug.augmenter.word import WordAugmenter
 from nlpaug.util import Action, PartOfSpeech, WarningException, WarningName, WarningCode, WarningMessage
+from nlpaug.util.instrumentation import Counter
 import nlpaug.model.word_dict as nmw
 
 
@@ -17,7 +18,8 @@ class AntonymAug(WordAugmenter):
     :param int aug_max: Maximum number of word will be augmented. If None is passed, number of augmentation is
         calculated via aup_p. If calculated result from aug_p is smaller than aug_max, will use calculated result from
         aug_p. Otherwise, using aug_max.
-    :param list stopwords: List of words which will be skipped from augment operation.
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive
+        (e.g. "The" is skipped if "the" is given).
     :param func tokenizer: Customize tokenization process
     :param func reverse_tokenizer: Customize reverse of tokenization process
     :param str name: Name of this augmenter
@@ -50,6 +52,7 @@ class AntonymAug(WordAugmenter):
         word_idxes = self.pre_skip_aug(tokens, tuple_idx=0)
         word_idxes = self.skip_aug(word_idxes, tokens)
         if len(word_idxes) == 0:
+            self.instrumentation.incr(self.name, Counter.OOV_SKIPS)
             if self.verbose > 0:
                 exception = WarningException(name=WarningName.OUT_OF_VOCABULARY,
                                              code=WarningCode.WARNING_CODE_002, msg=WarningMessage.NO_WORD)
@@ -2,11 +2,10 @@
     Augmenter that apply operation (word level) to textual input based on contextual word embeddings.
 """
 
-import string
-
 from nlpaug.augmenter.word import WordAugmenter
 import nlpaug.model.lang_models as nml
 from nlpaug.util.action import Action
+from nlpaug.util.text.token_filter import PUNCTUATION_TOKENS
 
 BERT_MODEL = {}
 XLNET_MODEL = {}
@@ -66,7 +65,8 @@ class ContextualWordEmbsAug(WordAugmenter):
     :param int aug_max: Maximum number of word will be augmented. If None is passed, number of augmentation is
         calculated via aup_p. If calculated result from aug_p is smaller than aug_max, will use calculated result from
         aug_p. Otherwise, using aug_max.
-    :param list stopwords: List of words which will be skipped from augment operation.
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive
+        (e.g. "The" is skipped if "the" is given).
     :param bool skip_unknown_word: Do not substitute unknown word (e.g. AAAAAAAAAAA)
     :param str device: Use either cpu or gpu. Default value is None, it uses GPU if having. While possible values are
         'cuda' and 'cpu'.
@@ -125,7 +125,7 @@ class ContextualWordEmbsAug(WordAugmenter):
                     token2subword[i].append(subword_pos)
                     subword_pos += 1
                 elif self.model_type in ['xlnet'] and self.model.SUBWORD_PREFIX not in subword and \
-                        subword not in string.punctuation:
+                        subword not in PUNCTUATION_TOKENS:
                     token2subword[i].append(subword_pos)
                     subword_pos += 1
                 else:
@@ -4,6 +4,7 @@
 
 from nlpaug.augmenter.word import WordAugmenter
 from nlpaug.util import Action, WarningException, WarningName, WarningCode, WarningMessage
+from nlpaug.util.instrumentation import Counter
 import nlpaug.model.word_stats as nmws
 
 TFIDF_MODEL = {}
@@ -38,7 +39,8 @@ class TfIdfAug(WordAugmenter):
         calculated via aup_p. If calculated result from aug_p is smaller than aug_max, will use calculated result from
         aug_p. Otherwise, using aug_max.
     :param int aug_n : Deprecated. Use top_k as alternative. Top n similar word for lucky draw
-    :param list stopwords: List of words which will be skipped from augment operation.
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive
+        (e.g. "The" is skipped if "the" is given).
     :param func tokenizer: Customize tokenization process
     :param func reverse_tokenizer: Customize reverse of tokenization process
     :param str name: Name of this augmenter
@@ -77,6 +79,7 @@ class TfIdfAug(WordAugmenter):
         word_idxes = self.skip_aug(word_idxes, tokens)
 
         if len(word_idxes) == 0:
+            self.instrumentation.incr(self.name, Counter.OOV_SKIPS)
             if self.verbose > 0:
                 exception = WarningException(name=WarningName.OUT_OF_VOCABULARY,
                                              code=WarningCode.WARNING_CODE_002, msg=WarningMessage.NO_WORD)
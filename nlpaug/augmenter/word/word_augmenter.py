@@ -1,11 +1,16 @@
-import string
-
 from nlpaug.util import Method
 from nlpaug import Augmenter
+from nlpaug.util.dedup import text_dedup_key
 from nlpaug.util import WarningException, WarningName, WarningCode, WarningMessage
+from nlpaug.util.instrumentation import Counter
+from nlpaug.util.text.token_filter import StopwordIndex
+from nlpaug.util.text.token_sequence import TokenSequence, is_token_mode
 
 
 class WordAugmenter(Augmenter):
+    # Derived from stopwords
+    CACHE_IGNORED_ATTRS = Augmenter.CACHE_IGNORED_ATTRS + ['stopword_index']
+
     def __init__(self, action, name='Word_Aug', aug_min=1, aug_max=10, aug_p=0.3, stopwords=None,
                  tokenizer=None, reverse_tokenizer=None, device='cpu', verbose=0):
         super().__init__(
@@ -16,15 +21,33 @@ class WordAugmenter(Augmenter):
         self.reverse_tokenizer = reverse_tokenizer or self._reverse_tokenizer
         self.stopwords = stopwords
 
+    @property
+    def stopwords(self):
+        return self._stopwords
+
+    @stopwords.setter
+    def stopwords(self, stopwords):
+        # Compiled once instead of searching list for every token
+        self._stopwords = stopwords
+        self.stopword_index = StopwordIndex(stopwords)
+
     @classmethod
     def _tokenizer(cls, text):
-        return [t for t in text.split(' ') if len(t) > 0]
+        # filter(None, ...) drops empty tokens
+        if isinstance(text, TokenSequence):
+            return list(filter(None, text))
+        return list(filter(None, text.split(' ')))
         # return text.split(' ')
 
     @classmethod
     def _reverse_tokenizer(cls, tokens):
+        if is_token_mode():
+            return TokenSequence.from_tokens(tokens)
         return ' '.join(tokens)
 
+    def accepts_token_sequence(self):
+        return self._is_default_tokenizer()
+
     @classmethod
     def clean(cls, data):
         return data.strip()
@@ -33,22 +56,17 @@ class WordAugmenter(Augmenter):
         return token_idxes
 
     def pre_skip_aug(self, tokens, tuple_idx=None):
-        results = []
-        for token_idx, token in enumerate(tokens):
-            if tuple_idx is not None:
-                _token = token[tuple_idx]
-            else:
-                _token = token
-            # skip punctuation
-            if _token in string.punctuation:
-                continue
-            # skip stopwords
-            if self.stopwords is not None and _token in self.stopwords:
-                continue
-
-            results.append(token_idx)
-
-        return results
+        return self.pre_skip_aug_batch([tokens], tuple_idx=tuple_idx)[0]
+
+    def pre_skip_aug_batch(self, batch_tokens, tuple_idx=None):
+        """
+        :param list batch_tokens: List of tokenized texts
+        :param int tuple_idx: Index of word if token is tuple (e.g. (word, part of speech))
+        :return: List of token indexes per text which are neither punctuation nor stopwords
+        """
+        if tuple_idx is not None:
+            batch_tokens = [[token[tuple_idx] for token in tokens] for tokens in batch_tokens]
+        return self.stopword_index.get_eligible_idxes(batch_tokens)
 
     @classmethod
     def is_duplicate(cls, dataset, data):
@@ -57,6 +75,10 @@ class WordAugmenter(Augmenter):
                 return True
         return False
 
+    @classmethod
+    def get_dedup_key(cls, data):
+        return text_dedup_key(data)
+
     @classmethod
     def align_capitalization(cls, src_token, dest_token):
         # For whole word is upper case
@@ -73,6 +95,7 @@ class WordAugmenter(Augmenter):
         word_idxes = self.pre_skip_aug(tokens)
         word_idxes = self.skip_aug(word_idxes, tokens)
         if len(word_idxes) == 0:
+            self.instrumentation.incr(self.name, Counter.OOV_SKIPS)
             if self.verbose > 0:
                 exception = WarningException(name=WarningName.OUT_OF_VOCABULARY,
                                              code=WarningCode.WARNING_CODE_002, msg=WarningMessage.NO_WORD)
@@ -2,8 +2,11 @@
     Augmenter that apply operation to textual input based on word embeddings.
 """
 
+import threading
+
 from nlpaug.augmenter.word import WordAugmenter
 from nlpaug.util import Action
+from nlpaug.util.random_stream import call_with_seed, generate_seeds
 import nlpaug.model.word_embs as nmw
 from nlpaug.util.exception.warning import WarningMessage
 
@@ -11,6 +14,8 @@ from nlpaug.util.exception.warning import WarningMessage
 WORD2VEC_MODEL = None
 GLOVE_MODEL = {}
 FASTTEXT_MODEL = {}
+# Candidates predicted by WordEmbsAug.augment_batch for current thread
+_local = threading.local()
 model_types = ['word2vec', 'glove', 'fasttext']
 
 
@@ -74,7 +79,8 @@ class WordEmbsAug(WordAugmenter):
         calculated via aup_p. If calculated result from aug_p is smaller than aug_max, will use calculated result from
         aug_p. Otherwise, using aug_max.
     :param int aug_n : Deprecated. Use top_k as alternative. Top n similar word for lucky draw
-    :param list stopwords: List of words which will be skipped from augment operation.
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive
+        (e.g. "The" is skipped if "the" is given).
     :param func tokenizer: Customize tokenization process
     :param func reverse_tokenizer: Customize reverse of tokenization process
     :param bool force_reload: If True, model will be loaded every time while it takes longer time for initialization.
@@ -149,6 +155,54 @@ class WordEmbsAug(WordAugmenter):
 
         return self.reverse_tokenizer(results)
 
+    def augment_batch(self, data, n=1, num_thread=1, backend=None, seed=None):
+        """
+        See Augmenter.augment_batch. When substituting by one thread, words to be substituted are chosen for all data
+        first and their candidates are predicted at once (see WordEmbeddings.predict_batch). Result is same as
+        augmenting data one by one.
+        """
+        if self.action != Action.SUBSTITUTE or num_thread != 1 or len(data) < 2:
+            return super().augment_batch(data, n=n, num_thread=num_thread, backend=backend, seed=seed)
+
+        # Seeds are fixed up front so that same words are chosen again when data is augmented
+        seeds = generate_seeds(seed, len(data), draw=True)
+        words = []
+        for d, s in zip(data, seeds):
+            if self._validate_augment(d):
+                continue
+            clean_data = self.clean(d)
+            # First n candidates of each data. Words of retried candidates are predicted on demand.
+            for candidate_seed in generate_seeds(s, n):
+                words.extend(call_with_seed(self._get_substitute_words, candidate_seed, clean_data))
+        words = list(dict.fromkeys(words))
+
+        previous_memo = getattr(_local, 'memo', None)
+        _local.memo = (self, dict(zip(words, self.model.predict_batch(words))))
+        try:
+            return super().augment_batch(data, n=n, num_thread=num_thread, backend=backend, seed=seeds)
+        finally:
+            _local.memo = previous_memo
+
+    def _get_substitute_words(self, data):
+        # Same random draws as substitute before prediction
+        tokens = self.tokenizer(data)
+        return [tokens[aug_idx] for aug_idx in self._get_aug_idxes(tokens)]
+
+    def _predict(self, words):
+        """
+        :param list words: Words for substitution
+        :return: List of candidate words (one list per word)
+        """
+        memo = getattr(_local, 'memo', None)
+        if memo is None or memo[0] is not self:
+            return self.model.predict_batch(words)
+
+        predictions = memo[1]
+        missing_words = [word for word in dict.fromkeys(words) if word not in predictions]
+        if missing_words:
+            predictions.update(zip(missing_words, self.model.predict_batch(missing_words)))
+        return [predictions[word] for word in words]
+
     def substitute(self, data):
         tokens = self.tokenizer(data)
         results = tokens.copy()
@@ -157,9 +211,9 @@ class WordEmbsAug(WordAugmenter):
         if aug_idexes is None:
             return data
 
-        for aug_idx in aug_idexes:
-            original_word = results[aug_idx]
-            candidate_words = self.model.predict(original_word, n=1)
+        # Candidates of all augmented words are predicted at once
+        candidates = self._predict([results[aug_idx] for aug_idx in aug_idexes])
+        for aug_idx, candidate_words in zip(aug_idexes, candidates):
             substitute_word = self.sample(candidate_words, 1)[0]
 
             results[aug_idx] = substitute_word
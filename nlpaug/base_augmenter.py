@@ -1,11 +1,28 @@
-import random
+import hashlib
 import numpy as np
-from multiprocessing.dummy import Pool as ThreadPool
 
+from nlpaug.augmenter.augment import get_edits
 from nlpaug.util import Action, Method, WarningException, WarningName, WarningCode, WarningMessage
+import nlpaug.util.parallel as parallel
+from nlpaug.util.dedup import DedupIndex
+from nlpaug.util.instrumentation import NULL_INSTRUMENTATION, Stage, Counter, InstrumentedFunction, InstrumentedModel
+from nlpaug.util.oversampling import OversamplingScheduler
+from nlpaug.util.random_stream import get_random_stream, call_with_seed, resolve_seed, generate_seeds
+from nlpaug.util.text.token_sequence import TokenSequence
 
 
 class Augmenter:
+    # Max loop times of n to generate expected number of outputs
+    MAX_RETRY_TIMES = 3
+    # Runtime attributes which do not change augmented result. They are excluded from cache key.
+    CACHE_IGNORED_ATTRS = ['augments', 'oversampler', 'instrumentation', 'cache', '_original_attrs', 'verbose',
+                           '_cache_digest', '_default_tokenizer']
+    # Attributes are wrapped by set_instrumentation for timing
+    INSTRUMENTED_FUNCTIONS = [
+        ('tokenizer', Stage.TOKENIZE), ('reverse_tokenizer', Stage.REVERSE_TOKENIZE),
+        ('_get_aug_idxes', Stage.SAMPLE_AUG_IDXES), ('_get_random_aug_idxes', Stage.SAMPLE_AUG_IDXES)
+    ]
+
     def __init__(self, name, method, action, aug_min, aug_max, aug_p=0.1, device='cpu', verbose=0):
         self.name = name
         self.action = action
@@ -16,16 +33,21 @@ class Augmenter:
         self.device = device
         self.verbose = verbose
 
-        # if seed is not None:
-        #     random.seed(seed)
-        #     np.random.seed(seed)
-        #     torch.manual_seed(seed)
-        #     torch.cuda.manual_seed(seed)
-
         self.augments = []
+        self.oversampler = OversamplingScheduler()
+        self.instrumentation = NULL_INSTRUMENTATION
+        self.cache = None
+        self._original_attrs = {}
 
         self._validate_augmenter(method, action)
 
+    def __setattr__(self, key, value):
+        # Configuration is changed. Values derived from it are computed again on next call.
+        if key not in self.CACHE_IGNORED_ATTRS:
+            self.__dict__.pop('_cache_digest', None)
+            self.__dict__.pop('_default_tokenizer', None)
+        object.__setattr__(self, key, value)
+
     @classmethod
     def _validate_augmenter(cls, method, action):
         if method not in Method.getall():
@@ -36,19 +58,24 @@ class Augmenter:
             raise ValueError(
                 'Action must be one of {} while {} is passed'.format(Action.getall(), action))
 
-    def augment(self, data, n=1, num_thread=1):
+    def augment(self, data, n=1, num_thread=1, backend=None, seed=None):
         """
         :param object data: Data for augmentation
         :param int n: Number of unique augmented output
         :param int num_thread: Number of thread for data augmentation. Use this option when you are using CPU and
             n is larger than 1
+        :param str backend: Execution backend when num_thread is larger than 1. Possible values are 'thread' and
+            'process'. Default value is None which means using global setting (see nlpaug.util.set_backend).
+        :param seed: Either int, random.Random, numpy.random.Generator or nlpaug.util.RandomStream. Same seed
+            returns same result regardless of num_thread and backend. Default value is None which means using random
+            stream of current thread (global random state if it is not set).
         :return: Augmented data
 
         >>> augmented_data = aug.augment(data)
 
         """
-        max_retry_times = 3  # max loop times of n to generate expected number of outputs
-
+        if self.instrumentation.enabled:
+            self.instrumentation.incr(self.name, Counter.CALLS)
         exceptions = self._validate_augment(data)
         # TODO: Handle multiple exceptions
         for exception in exceptions:
@@ -59,6 +86,8 @@ class Augmenter:
                 # Return empty value per data type
                 if isinstance(data, str):
                     return ''
+                elif isinstance(data, TokenSequence):
+                    return TokenSequence([''])
                 elif isinstance(data, list):
                     return []
                 elif isinstance(data, np.ndarray):
@@ -66,69 +95,394 @@ class Augmenter:
 
                 return None
 
-        results = []
-        action_fx = None
+        if self._is_single_call(n, seed):
+            return self._augment_single(self.get_action_fx(), self.clean(data), data, self.is_duplicate)
+
+        seed = resolve_seed(seed)
+        cache_key = self._get_cache_key(data, n, seed)
+        if cache_key is not None:
+            is_cached, results = self.cache.get(cache_key)
+            self.instrumentation.incr(self.name, Counter.CACHE_HITS if is_cached else Counter.CACHE_MISSES)
+            if is_cached:
+                return results
+
+        dedup_index = DedupIndex(self.get_dedup_key, self.is_duplicate)
+        dedup_index.add(data)
+        action_fx = self.get_action_fx()
         clean_data = self.clean(data)
+
+        with self.instrumentation.timer(self.name, Stage.AUGMENT):
+            results = self._generate_unique_results(action_fx, clean_data, n=n, num_thread=num_thread,
+                                                    backend=backend, dedup_index=dedup_index, seed=seed)
+
+        # TODO: standardize output to list even though n=1 from 1.0.0
+        if len(results) == 0:
+            # if not result, return itself
+            if n == 1:
+                results = data
+            else:
+                results = [data]
+        elif n == 1:
+            results = results[0]
+        else:
+            results = results[:n]
+
+        if cache_key is not None:
+            self.cache.put(cache_key, results)
+        return results
+
+    def get_action_fx(self):
+        """
+        :return: Function of augmenter's action (e.g. substitute). None if action is not supported.
+        """
         if self.action == Action.INSERT:
-            action_fx = self.insert
+            return self.insert
         elif self.action == Action.SUBSTITUTE:
-            action_fx = self.substitute
+            return self.substitute
         elif self.action == Action.SWAP:
-            action_fx = self.swap
+            return self.swap
         elif self.action == Action.DELETE:
-            action_fx = self.delete
+            return self.delete
         elif self.action == Action.SPLIT:
-            action_fx = self.split
+            return self.split
+        return None
+
+    def _is_single_call(self, n, seed):
+        # Single unseeded output (e.g. augmenter inside flow) without cache and instrumentation does not need seed
+        # derivation, oversampling and dedup index
+        return n == 1 and seed is None and self.cache is None and not self.instrumentation.enabled
+
+    def _augment_single(self, fx, fx_data, data, is_duplicate_fx):
+        """
+        :return: First output of fx(fx_data) which is different from data. Return data if all retries return same
+            data.
+        """
+        size = len(data) if hasattr(data, '__len__') else 0
+        for num_call in range(1, self.MAX_RETRY_TIMES + 2):
+            augmented_data = fx(fx_data)
+            if not is_duplicate_fx([data], augmented_data):
+                self.oversampler.update(size, num_call, num_call - 1)
+                return augmented_data
+        self.oversampler.update(size, num_call, num_call)
+        return data
+
+    def _generate_unique_results(self, action_fx, data, n, num_thread, backend, dedup_index, seed=None):
+        budget = (self.MAX_RETRY_TIMES + 1) * n
+        size = len(data) if hasattr(data, '__len__') else 0
+        is_parallel = num_thread > 1 and self.device == 'cpu'
+        instrumentation = self.instrumentation
+        if instrumentation.enabled and not is_parallel:
+            action_fx = InstrumentedFunction(action_fx, instrumentation, self.name, Stage.ACTION)
+
+        results = []
+        num_generated = 0
+        while len(results) < n and budget > 0:
+            # Only request the shortfall (plus expected duplicates) instead of regenerating n candidates
+            num_candidate = self.oversampler.plan(size, n - len(results), budget)
+            budget -= num_candidate
+            # Each candidate has its own stream derived from seed and index of candidate
+            seeds = generate_seeds(seed, num_candidate, offset=num_generated, draw=is_parallel)
+            num_generated += num_candidate
 
-        for _ in range(max_retry_times+1):
-            augmented_results = []
             if num_thread == 1:
-                augmented_results = [action_fx(clean_data) for _ in range(n)]
+                # Generate lazily so that no more candidate is generated once enough unique outputs are collected
+                augmented_results = (call_with_seed(action_fx, s, data) for s in seeds)
+            elif self.device == 'cpu':
+                augmented_results = self._parallel_augment(action_fx, data, seeds=seeds, num_thread=num_thread,
+                                                           backend=backend)
+            elif self.device == 'cuda':
+                # TODO: support multiprocessing for GPU
+                # https://discuss.pytorch.org/t/using-cuda-multiprocessing-with-single-gpu/7300
+                augmented_results = (call_with_seed(action_fx, s, data) for s in seeds)
             else:
-                if self.device == 'cpu':
-                    augmented_results = self._parallel_augment(action_fx, clean_data, n=n, num_thread=num_thread)
-                elif self.device == 'cuda':
-                    # TODO: support multiprocessing for GPU
-                    # https://discuss.pytorch.org/t/using-cuda-multiprocessing-with-single-gpu/7300
-                    augmented_results = [action_fx(clean_data) for _ in range(n)]
-                else:
-                    raise ValueError('Unsupported device mode [{}]. Only support `cpu` or `cuda`'.format(self.device))
+                raise ValueError('Unsupported device mode [{}]. Only support `cpu` or `cuda`'.format(self.device))
 
+            num_call, num_duplicate = 0, 0
             for augmented_result in augmented_results:
-                if not self.is_duplicate(results + [data], augmented_result):
-                    results.append(augmented_result)
-
+                num_call += 1
+                if instrumentation.enabled:
+                    with instrumentation.timer(self.name, Stage.DEDUP):
+                        is_unique = dedup_index.add(augmented_result)
+                else:
+                    is_unique = dedup_index.add(augmented_result)
+                if not is_unique:
+                    num_duplicate += 1
+                    continue
+                results.append(augmented_result)
                 if len(results) >= n:
                     break
-            if len(results) >= n:
-                break
+            if isinstance(augmented_results, list):
+                num_call = len(augmented_results)
 
-        # TODO: standardize output to list even though n=1 from 1.0.0
-        if len(results) == 0:
-            # if not result, return itself
-            if n == 1:
-                return data
+            self.oversampler.update(size, num_call, num_duplicate)
+            instrumentation.incr(self.name, Counter.CANDIDATES, num_call)
+            instrumentation.incr(self.name, Counter.DUPLICATES, num_duplicate)
+
+        return results
+
+    def get_oversampling_stats(self):
+        """
+        :return: Number of generated candidates and number of candidates wasted on duplicate output.
+
+        >>> aug.get_oversampling_stats()
+        """
+        return self.oversampler.get_stats()
+
+    def set_instrumentation(self, instrumentation=None):
+        """
+        :param instrumentation: nlpaug.util.instrumentation.Instrumentation object which receives timing of each
+            stage (tokenize, sampling augment index, model inference, action, dedup) and counters (calls, candidates,
+            duplicates, OOV skips, model calls). Pass None to disable instrumentation and restore original functions.
+        :return: Augmenter itself
+
+        >>> aug.set_instrumentation(MemoryInstrumentation())
+        """
+        # Restore first so that wrapping is not nested when instrumentation is replaced
+        for attr, original in self._original_attrs.items():
+            if original is None:
+                self.__dict__.pop(attr, None)
             else:
-                return [data]
-        if n == 1:
-            return results[0]
-        return results[:n]
+                self.__dict__[attr] = original
+        self._original_attrs = {}
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+
+        if not self.instrumentation.enabled:
+            return self
+
+        for attr, stage in self.INSTRUMENTED_FUNCTIONS:
+            if not hasattr(self, attr):
+                continue
+            # Keep None for class attribute (e.g. method) so that it can be restored by removing instance attribute
+            self._original_attrs[attr] = self.__dict__.get(attr)
+            setattr(self, attr, InstrumentedFunction(getattr(self, attr), self.instrumentation, self.name, stage))
+
+        model = self.__dict__.get('model')
+        # Some augmenters keep plain data (e.g. list of characters) as model. Only proxy model object with inference
+        # function.
+        if any(hasattr(model, fx) for fx in InstrumentedModel.INFERENCE_FUNCTIONS):
+            self._original_attrs['model'] = model
+            self.model = InstrumentedModel(model, self.instrumentation, self.name)
+
+        return self
+
+    def set_cache(self, cache=None):
+        """
+        :param cache: nlpaug.util.cache.ResultCache object. Augmented result is reused if same input is augmented
+            with same configuration, n and seed again. Only seeded call (or deterministic augmenter) is cached as
+            unseeded call is expected to return different result every time. Pass None to disable cache.
+        :return: Augmenter itself
+
+        >>> aug.set_cache(ResultCache(max_size=10000, cache_dir='cache'))
+        """
+        self.cache = cache
+        return self
+
+    def get_cache_stats(self):
+        """
+        :return: Hits, misses and evictions of cache. Return None if cache is not set.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get_stats()
+
+    def is_deterministic(self):
+        """
+        :return: True if augmenter always returns same result for same input. Result of deterministic augmenter is
+            cached even if seed is not provided.
+        """
+        return False
+
+    def accepts_token_sequence(self):
+        """
+        :return: True if augmenter accepts and returns nlpaug.util.text.token_sequence.TokenSequence as well as text.
+            Flow tokenizes text once and passes TokenSequence between such augmenters.
+        """
+        return False
+
+    def _is_default_tokenizer(self):
+        # Custom tokenizer may not split text by space so that TokenSequence cannot be used. It is checked on every
+        # flow call so result is kept until any attribute is assigned.
+        is_default = self.__dict__.get('_default_tokenizer')
+        if is_default is None:
+            tokenizer = self._original_attrs.get('tokenizer') or self.tokenizer
+            reverse_tokenizer = self._original_attrs.get('reverse_tokenizer') or self.reverse_tokenizer
+            is_default = tokenizer == self._tokenizer and reverse_tokenizer == self._reverse_tokenizer
+            self.__dict__['_default_tokenizer'] = is_default
+        return is_default
+
+    @classmethod
+    def _describe_cache_value(cls, value):
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, (list, tuple, set, frozenset)):
+            values = [cls._describe_cache_value(v) for v in value]
+            return tuple(sorted(values, key=repr)) if isinstance(value, (set, frozenset)) else tuple(values)
+        if isinstance(value, dict):
+            return tuple(sorted((repr(k), cls._describe_cache_value(v)) for k, v in value.items()))
+        # Function is described by name
+        if hasattr(value, '__qualname__'):
+            return '{}.{}'.format(getattr(value, '__module__', ''), value.__qualname__)
+        # Model is described by name and its scalar parameters (e.g. mask_factor). Large data (e.g. vectors) is skipped.
+        params = tuple(sorted((k, v) for k, v in getattr(value, '__dict__', {}).items()
+                              if v is None or isinstance(v, (str, int, float, bool))))
+        return '{}.{}'.format(type(value).__module__, type(value).__qualname__), params
+
+    def get_cache_config(self):
+        """
+        :return: Hashable description of augmenter configuration. It is a part of cache key.
+        """
+        config = []
+        for key, value in sorted(self.__dict__.items()):
+            if key in self.CACHE_IGNORED_ATTRS:
+                continue
+            if key in self._original_attrs:
+                # Use original function instead of instrumented one
+                value = self._original_attrs[key]
+                if value is None:
+                    continue
+            config.append((key, self._describe_cache_value(value)))
+        return '{}.{}'.format(type(self).__module__, type(self).__qualname__), tuple(config)
+
+    def get_cache_digest(self):
+        """
+        :return: SHA1 digest of get_cache_config. It is computed once and kept until any attribute of augmenter is
+            assigned. Modifying attribute in place (e.g. appending to list) is not detected.
+        """
+        digest = self.__dict__.get('_cache_digest')
+        if digest is None:
+            digest = hashlib.sha1(repr(self.get_cache_config()).encode('utf-8')).hexdigest()
+            self._cache_digest = digest
+        return digest
+
+    def _get_cache_key(self, data, n, seed):
+        if self.cache is None or (seed is None and not self.is_deterministic()):
+            return None
+        data_key = self.get_dedup_key(data)
+        if data_key is None:
+            return None
+        return self.get_cache_digest(), data_key, n, seed
+
+    def augment_batch(self, data, n=1, num_thread=1, backend=None, seed=None):
+        """
+        :param list data: List of data for augmentation
+        :param int n: Number of unique augmented output per data
+        :param int num_thread: Number of thread (or process) for data augmentation. Inputs are distributed to
+            workers. Use this option when you are using CPU
+        :param str backend: Execution backend when num_thread is larger than 1. Possible values are 'thread' and
+            'process'. Default value is None which means using global setting (see nlpaug.util.set_backend).
+        :param seed: Either int (or random.Random, numpy.random.Generator) or list of int (one seed per data). If
+            int is passed, seed of i-th data is nlpaug.util.derive_seed(seed, i). So that any data can be
+            regenerated by augment(data[i], seed=derive_seed(seed, i)).
+        :return: List of augmented data. The i-th element is the augmented result of the i-th input and follows the
+            same output format as augment()
+
+        Subclasses may override this method to process the whole batch at once (e.g. one model forward pass for all
+        inputs). Default implementation augments each input one by one.
+
+        >>> augmented_data = aug.augment_batch([data1, data2])
+
+        """
+        if num_thread == 1 or self.device == 'cuda' or len(data) < 2:
+            seeds = generate_seeds(seed, len(data))
+            return [self.augment(d, n=n, seed=s) for d, s in zip(data, seeds)]
+        seeds = generate_seeds(seed, len(data), draw=True)
+        return parallel.parallel_augment(self, data, n=n, seeds=seeds, num_thread=num_thread, backend=backend)
+
+    def augment_edits(self, data, n=1, num_thread=1, backend=None, seed=None):
+        """
+        Same as augment but return edits of each augmented text instead of whole text. Edits are much smaller than
+        text when n is large or text is long, and can be applied lazily by nlpaug.augmenter.augment.apply_edits.
+
+        :param str data: Text for augmentation
+        :param int n: Number of unique augmented output
+        :param seed: See augment
+        :return: List of Augment (pos, original, new) if n is 1. Otherwise, list of them (one per augmented text).
+
+        >>> edits = aug.augment_edits('The quick brown fox', n=100)
+        >>> augmented_text = apply_edits('The quick brown fox', edits[0])
+
+        """
+        if not isinstance(data, str):
+            raise ValueError('Only text input is supported while {} is passed'.format(type(data)))
+
+        results = self.augment(data, n=n, num_thread=num_thread, backend=backend, seed=seed)
+        if isinstance(results, str):
+            return get_edits(data, results) if n == 1 else [get_edits(data, results)]
+        return [get_edits(data, result) for result in results]
+
+    async def aaugment(self, data, n=1, seed=None, timeout=None, runner=None):
+        """
+        Coroutine version of augment. Augmentation runs in thread pool so that event loop is not blocked. Concurrent
+        requests are coalesced into one augment_batch call if augmenter overrides augment_batch (e.g. WordEmbsAug and
+        flows). Requests of other augmenters are run one by one. Seeded request returns same result as augment.
+
+        :param object data: Data for augmentation
+        :param int n: Number of unique augmented output
+        :param seed: Seed of this request. See augment
+        :param float timeout: Maximum time (in second) of this request. asyncio.TimeoutError is raised if it is
+            exceeded.
+        :param runner: nlpaug.util.async_runner.AsyncRunner object. Default value is None which means using global
+            runner (see nlpaug.util.async_runner.set_async_runner).
+        :return: Augmented data
+
+        >>> augmented_data = await aug.aaugment(data, timeout=1)
+
+        """
+        # Import on demand so that asyncio is not loaded by synchronous user
+        from nlpaug.util.async_runner import get_async_runner
+        return await get_async_runner(runner).run(self, data, n=n, seed=seed, timeout=timeout)
+
+    async def aaugment_batch(self, data, n=1, seed=None, timeout=None, runner=None):
+        """
+        Coroutine version of augment_batch.
+
+        :param list data: List of data for augmentation
+        :param int n: Number of unique augmented output per data
+        :param seed: Either int or list of int (one seed per data). See augment_batch
+        :param float timeout: Maximum time (in second) of this request. asyncio.TimeoutError is raised if it is
+            exceeded.
+        :param runner: nlpaug.util.async_runner.AsyncRunner object. Default value is None which means using global
+            runner (see nlpaug.util.async_runner.set_async_runner).
+        :return: List of augmented data
+
+        >>> augmented_data = await aug.aaugment_batch([data1, data2])
+
+        """
+        from nlpaug.util.async_runner import get_async_runner
+        return await get_async_runner(runner).run_batch(self, data, n=n, seed=seed, timeout=timeout)
+
+    def augment_stream(self, data, n=1, chunk_size=64, workers=1, backend=None, seed=None, offset=0):
+        """
+        :param iterable data: Iterable (e.g. generator or file reader) of data for augmentation. It is consumed
+            lazily so unbounded input is supported.
+        :param int n: Number of unique augmented output per data
+        :param int chunk_size: Number of inputs are processed by augment_batch at one time
+        :param int workers: Number of thread (or process) for data augmentation. Each worker processes one chunk at
+            one time.
+        :param str backend: Execution backend when workers is larger than 1. Possible values are 'thread' and
+            'process'. Default value is None which means using global setting (see nlpaug.util.set_backend).
+        :param int seed: Base seed. Seed of i-th data of the stream is nlpaug.util.derive_seed(seed, offset + i).
+        :param int offset: Position of first data in the whole stream. Use it to continue a stream which is
+            partially processed (e.g. resuming a job) with same seeds.
+        :return: Generator of augmented data. Results are yielded in same order of input.
+
+        >>> for augmented_data in aug.augment_stream(open('data.txt')):
+        ...     print(augmented_data)
+
+        """
+        return parallel.stream_augment(self, data, n=n, chunk_size=chunk_size, num_worker=workers, backend=backend,
+                                       seed=seed, offset=offset)
 
     @classmethod
     def _validate_augment(cls, data):
-        if data is None or len(data) == 0:
+        if data is None or len(data) == 0 or (isinstance(data, TokenSequence) and data.is_empty()):
             return [WarningException(name=WarningName.INPUT_VALIDATION_WARNING,
                                      code=WarningCode.WARNING_CODE_001, msg=WarningMessage.LENGTH_IS_ZERO)]
 
         return []
 
-    @classmethod
-    def _parallel_augment(cls, action_fx, data, n, num_thread=2):
-        pool = ThreadPool(num_thread)
-        results = pool.map(action_fx, [data] * n)
-        pool.close()
-        pool.join()
-        return results
+    def _parallel_augment(self, action_fx, data, seeds, num_thread=2, backend=None):
+        return parallel.parallel_action(self, action_fx, data, seeds=seeds, num_thread=num_thread, backend=backend)
 
     def insert(self, data):
         raise NotImplementedError
@@ -155,16 +509,25 @@ class Augmenter:
     def is_duplicate(cls, dataset, data):
         raise NotImplementedError
 
+    @classmethod
+    def get_dedup_key(cls, data):
+        """
+        :param object data: Augmented data
+        :return: Hashable key of data. Two data are duplicated if their keys are equal. Return None if data cannot be
+            hashed and is_duplicate will be used instead.
+        """
+        return None
+
     @classmethod
     def prob(cls):
-        return random.random()
+        return get_random_stream().random.random()
 
     @classmethod
     def sample(cls, x, num):
         if isinstance(x, list):
-            return random.sample(x, num)
+            return get_random_stream().random.sample(x, num)
         elif isinstance(x, int):
-            return random.randint(1, x-1)
+            return get_random_stream().random.randint(1, x-1)
 
     @classmethod
     def clean(cls, data):
@@ -1,9 +1,22 @@
+import hashlib
+import numpy as np
+
 from nlpaug import Augmenter
 from nlpaug.augmenter.char import CharAugmenter
 from nlpaug.util import Method
+import nlpaug.util.parallel as parallel
+from nlpaug.util.dedup import DedupIndex
+from nlpaug.util.instrumentation import Stage, Counter
+from nlpaug.util.random_stream import resolve_seed, generate_seeds, get_random_stream, hash_seeds, hash_uniforms
+from nlpaug.util.text.token_sequence import TokenSequence, use_token_sequence, set_token_mode
 
 
 class Pipeline(Augmenter, list):
+    # Children are instrumented instead
+    INSTRUMENTED_FUNCTIONS = []
+    # Shorter text is augmented as text. Splitting and joining short text is cheaper than handling TokenSequence.
+    TOKEN_SEQUENCE_MIN_LENGTH = 200
+
     def __init__(self, action, name='Pipeline', aug_p=1, flow=None, verbose=0):
         Augmenter.__init__(self, name=name, method=Method.FLOW,
                            action=action, aug_min=None, aug_max=None, verbose=verbose)
@@ -25,6 +38,16 @@ class Pipeline(Augmenter, list):
     def draw(self):
         raise NotImplementedError
 
+    def draw_batch(self, uniforms):
+        """
+        Vectorized version of draw.
+
+        :param numpy.ndarray uniforms: Uniform random numbers in [0, 1) with shape (number of data, number of
+            augmenters)
+        :return: numpy.ndarray of bool with same shape. True means augmenter is applied to data.
+        """
+        raise NotImplementedError
+
     def get_is_duplicate_fx(self):
         # Assume all augmenters share same is_duplicate function.
         for aug in self:
@@ -37,68 +60,227 @@ class Pipeline(Augmenter, list):
 
         return None
 
-    def augment(self, data, n=1, num_thread=1):
+    def get_dedup_key_fx(self):
+        # Assume all augmenters share same get_dedup_key function.
+        for aug in self:
+            if isinstance(aug, list):
+                dedup_key_fx = aug.get_dedup_key_fx()
+                if dedup_key_fx is not None:
+                    return dedup_key_fx
+            else:
+                return aug.get_dedup_key
+
+        return None
+
+    def augment(self, data, n=1, num_thread=1, backend=None, seed=None):
         """
         :param data: Data for augmentation
         :param int n: Number of augmented output
         :param int num_thread: Number of thread for data augmentation. Use this option when you are using CPU and
             n is larger than 1
+        :param str backend: Execution backend when num_thread is larger than 1. Possible values are 'thread' and
+            'process'. Default value is None which means using global setting (see nlpaug.util.set_backend).
+        :param seed: Either int, random.Random, numpy.random.Generator or nlpaug.util.RandomStream. Same seed
+            returns same result regardless of num_thread and backend.
         :return: Augmented data
 
         >>> augmented_data = flow.augment(data)
         """
-        max_retry_times = 3  # max loop times of n to generate expected number of outputs
-        results = []
+        if self.instrumentation.enabled:
+            self.instrumentation.incr(self.name, Counter.CALLS)
         is_duplicate_fx = self.get_is_duplicate_fx()
+        if self._is_single_call(n, seed):
+            if is_duplicate_fx is None:
+                return data
+            return self._augment_single(self._augment, data, data, is_duplicate_fx)
 
-        for _ in range(max_retry_times+1):
-            augmented_results = []
-            if num_thread == 1:
-                augmented_results = [self._augment(data) for _ in range(n)]
-            else:
-                if self.device == 'cpu':
-                    augmented_results = self._parallel_augment(self._augment, data, n=n, num_thread=num_thread)
-                elif self.device == 'cuda':
-                    # TODO: support multiprocessing for GPU
-                    # https://discuss.pytorch.org/t/using-cuda-multiprocessing-with-single-gpu/7300
-                    augmented_results = [self._augment(data) for _ in range(n)]
-                else:
-                    raise ValueError('Unsupported device mode [{}]. Only support `cpu` or `cuda`'.format(self.device))
-
-            for augmented_result in augmented_results:
-                if is_duplicate_fx is not None and not is_duplicate_fx(results + [data], augmented_result):
-                    results.append(augmented_result)
-
-                if len(results) >= n:
-                    break
-            if len(results) >= n:
-                break
+        seed = resolve_seed(seed)
+        cache_key = self._get_cache_key(data, n, seed)
+        if cache_key is not None:
+            is_cached, results = self.cache.get(cache_key)
+            self.instrumentation.incr(self.name, Counter.CACHE_HITS if is_cached else Counter.CACHE_MISSES)
+            if is_cached:
+                return results
+
+        results = []
+        # is_duplicate_fx is None if there is no augmenter in this flow
+        if is_duplicate_fx is not None:
+            dedup_index = DedupIndex(self.get_dedup_key_fx(), is_duplicate_fx)
+            dedup_index.add(data)
+            with self.instrumentation.timer(self.name, Stage.AUGMENT):
+                results = self._generate_unique_results(self._augment, data, n=n, num_thread=num_thread,
+                                                        backend=backend, dedup_index=dedup_index, seed=seed)
 
         # TODO: standardize output to list even though n=1
         if len(results) == 0:
             # if not result, return itself
             if n == 1:
-                return data
+                results = data
             else:
-                return [data]
-        if n == 1:
-            return results[0]
-        return results[:n]
+                results = [data]
+        elif n == 1:
+            results = results[0]
+        else:
+            results = results[:n]
 
-    def _augment(self, data, n=1, num_thread=1):
-        results = []
-        augmented_data = data[:]
+        if cache_key is not None:
+            self.cache.put(cache_key, results)
+        return results
+
+    def augment_batch(self, data, n=1, num_thread=1, backend=None, seed=None):
+        """
+        :param list data: List of data for augmentation
+        :param int n: Number of unique augmented output per data
+        :param int num_thread: Number of thread (or process) for data augmentation
+        :param str backend: Execution backend when num_thread is larger than 1. See augment.
+        :param seed: Either int (or random.Random, numpy.random.Generator) or list of int (one seed per data)
+        :return: List of augmented data
+
+        If n is 1, decisions of all data are drawn at once (see draw_batch) and each augmenter is run once on the sub
+        batch of data which selects it, so that model based augmenter receives real batch. If num_thread is larger
+        than 1, data is split into num_thread contiguous chunks and each worker does the same on its chunk. Result of
+        i-th data only depends on data[i] and its seed (derive_seed(seed, i) if seed is int), hence it is same
+        regardless of num_thread, backend and how data is split into batches. Any data can be regenerated by
+        augment_batch([data[i]], seed=[derive_seed(seed, i)]). But it is different from augment(data[i], seed=...) as
+        random numbers are drawn in different order.
+
+        >>> augmented_data = flow.augment_batch([data1, data2])
+        """
+        if n != 1 or self.cache is not None or len(self) == 0 or len(data) == 0:
+            return Augmenter.augment_batch(self, data, n=n, num_thread=num_thread, backend=backend, seed=seed)
+        if num_thread > 1 and len(data) > 1:
+            # Seeds are drawn for unseeded call so that workers do not share random state
+            seeds = generate_seeds(seed, len(data), draw=True)
+            return parallel.parallel_augment_batch(self, data, n=n, seeds=seeds, num_thread=num_thread,
+                                                   backend=backend)
+
+        self.instrumentation.incr(self.name, Counter.CALLS, len(data))
+        seeds = self._get_batch_seeds(seed, len(data))
+        dedup_key_fx, is_duplicate_fx = self.get_dedup_key_fx(), self.get_is_duplicate_fx()
+        results = list(data)
+        pending_idxes = np.arange(len(data))
+        with self.instrumentation.timer(self.name, Stage.AUGMENT):
+            # Data which is not changed is retried as augment does
+            for round_idx in range(self.MAX_RETRY_TIMES + 1):
+                augmented_data = self._augment_batch_once(
+                    [data[i] for i in pending_idxes], None if seeds is None else seeds[pending_idxes], round_idx)
+                unchanged_idxes = []
+                for i, augmented in zip(pending_idxes, augmented_data):
+                    dedup_index = DedupIndex(dedup_key_fx, is_duplicate_fx)
+                    dedup_index.add(data[i])
+                    if dedup_index.add(augmented):
+                        results[i] = augmented
+                    else:
+                        unchanged_idxes.append(i)
+                if not unchanged_idxes:
+                    break
+                pending_idxes = np.array(unchanged_idxes)
+        return results
+
+    @classmethod
+    def _get_batch_seeds(cls, seed, size):
+        seeds = generate_seeds(seed, size)
+        if all(s is None for s in seeds):
+            # Random numbers are drawn from stream of current thread
+            return None
+        # Unseeded data (e.g. mixed with seeded requests) gets a fresh seed so that seeded data keeps its own
+        stream = get_random_stream()
+        return hash_seeds([stream.derive_seed() if s is None else resolve_seed(s) for s in seeds])
+
+    def _augment_batch_once(self, data, seeds, round_idx):
+        if all(isinstance(d, str) for d in data) and self.accepts_token_sequence():
+            # See _augment
+            with use_token_sequence():
+                augmented_data = self._augment_batch_flow(
+                    [TokenSequence.from_text(d) for d in data], seeds, round_idx)
+            return [d.to_text() if isinstance(d, TokenSequence) else d for d in augmented_data]
+        return self._augment_batch_flow(data, seeds, round_idx)
+
+    def _augment_batch_flow(self, data, seeds, round_idx):
+        # Decisions of all data and augmenters are drawn at once
+        if seeds is None:
+            uniforms = get_random_stream().numpy.random((len(data), len(self)))
+        else:
+            uniforms = np.stack([hash_uniforms(seeds, round_idx, aug_idx) for aug_idx in range(len(self))], axis=1)
+        selections = self.draw_batch(uniforms)
+        augmented_data = list(data)
+        for aug_idx, aug in enumerate(self):
+            idxes = np.flatnonzero(selections[:, aug_idx])
+            if len(idxes) == 0:
+                continue
+            aug_seeds = None if seeds is None else hash_seeds(seeds[idxes], round_idx, len(self) + aug_idx).tolist()
+            outputs = aug.augment_batch([augmented_data[i] for i in idxes], n=1, seed=aug_seeds)
+            for i, output in zip(idxes, outputs):
+                augmented_data[i] = output
+        return augmented_data
+
+    def get_cache_config(self):
+        # Configuration of flow includes configuration of all augmenters inside it
+        return Augmenter.get_cache_config(self), tuple(aug.get_cache_config() for aug in self)
+
+    def get_cache_digest(self):
+        # Augmenters inside flow keep their own digest. Only their digests are combined on every call as flow (list)
+        # can be modified without assigning attribute.
+        digests = [Augmenter.get_cache_digest(self)] + [aug.get_cache_digest() for aug in self]
+        return hashlib.sha1(' '.join(digests).encode('utf-8')).hexdigest()
+
+    def is_deterministic(self):
+        return all(aug.is_deterministic() for aug in self)
+
+    def _get_cache_key(self, data, n, seed):
+        if self.cache is None or (seed is None and not self.is_deterministic()):
+            return None
+        dedup_key_fx = self.get_dedup_key_fx()
+        data_key = dedup_key_fx(data) if dedup_key_fx is not None else None
+        if data_key is None:
+            return None
+        return self.get_cache_digest(), data_key, n, seed
+
+    def set_instrumentation(self, instrumentation=None):
+        """
+        :param instrumentation: nlpaug.util.instrumentation.Instrumentation object. It is applied to this flow and
+            all augmenters inside this flow. Pass None to disable instrumentation.
+        :return: Flow itself
+        """
+        Augmenter.set_instrumentation(self, instrumentation)
+        for aug in self:
+            aug.set_instrumentation(instrumentation)
+        return self
+
+    def accepts_token_sequence(self):
+        return len(self) > 0 and all(aug.accepts_token_sequence() for aug in self)
+
+    def _augment_flow(self, data, n=1, num_thread=1):
+        augmented_data = data
         for aug in self:
             if not self.draw():
                 continue
             augmented_data = aug.augment(augmented_data, n=n, num_thread=num_thread)
+        return augmented_data
+
+    def _augment(self, data, n=1, num_thread=1):
+        results = []
+        if n == 1 and num_thread == 1 and isinstance(data, str) and len(data) >= self.TOKEN_SEQUENCE_MIN_LENGTH \
+                and self.accepts_token_sequence():
+            # Tokenize once when entering flow and join once when leaving it instead of at every augmenter. Inner
+            # flow receives TokenSequence and keeps it.
+            # Same as use_token_sequence without overhead of context manager on this hot path
+            previous = set_token_mode(True)
+            try:
+                augmented_data = self._augment_flow(TokenSequence.from_text(data), n=n, num_thread=num_thread)
+            finally:
+                set_token_mode(previous)
+            if isinstance(augmented_data, TokenSequence):
+                augmented_data = augmented_data.to_text()
+        else:
+            augmented_data = self._augment_flow(data, n=n, num_thread=num_thread)
 
         # Data format output of each augmenter should be same
         for aug in self:
-            if str(aug.__class__.__bases__[0]) == str(Pipeline):
+            if aug.__class__.__bases__[0] is Pipeline:
                 results.append(augmented_data)
                 continue
-            if not aug.is_duplicate(results + [data], augmented_data):
+            if not aug.is_duplicate([data], augmented_data):
                 results.append(augmented_data)
             break
 
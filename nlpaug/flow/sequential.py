@@ -2,8 +2,11 @@
     Flow that apply augmentation sequentially.
 """
 
+import numpy as np
+
 from nlpaug.util import Action
 from nlpaug.flow import Pipeline
+import nlpaug.util.parallel as parallel
 
 
 class Sequential(Pipeline):
@@ -24,3 +27,43 @@ class Sequential(Pipeline):
 
     def draw(self):
         return True
+
+    def draw_batch(self, uniforms):
+        return np.ones(uniforms.shape, dtype=bool)
+
+    def augment_pipelined(self, data, stage_workers=1, chunk_size=16, queue_size=2, seed=None, offset=0,
+                          stage_backends=None):
+        """
+        Run augmenters of this flow as pipeline stages. Each augmenter has its own worker thread(s) and chunks of data
+        are passed to next augmenter through bounded queue, so different chunks occupy different augmenters at the
+        same time. Throughput approaches that of the slowest augmenter instead of the sum of all augmenters. Give
+        more workers to the slow augmenter.
+
+        :param iterable data: Iterable (e.g. generator or file reader) of data for augmentation. It is consumed
+            lazily so unbounded input is supported.
+        :param stage_workers: Number of worker per augmenter. Either int (same for all augmenters) or list of int
+            (one per augmenter)
+        :param int chunk_size: Number of data passed between augmenters at one time. Each augmenter processes a chunk
+            by augment_batch.
+        :param int queue_size: Maximum number of chunks waiting in front of each augmenter
+        :param int seed: Base seed. Seed of i-th data of the stream is nlpaug.util.derive_seed(seed, offset + i).
+            Same seed returns same result regardless of stage_workers.
+        :param int offset: Position of first data in the whole stream. See augment_stream.
+        :param stage_backends: Execution backend of workers per augmenter. Either str (same for all augmenters) or
+            list of str (one per augmenter). 'thread' runs augmenter in worker thread, which suits augmenter releasing
+            GIL (e.g. PyTorch model). 'process' runs it in persistent process pool with one process per worker, which
+            suits pure python augmenter (e.g. SynonymAug). Default value is None which means using global setting (see
+            nlpaug.util.set_backend). Call nlpaug.util.shutdown_process_pool to release process pools.
+        :return: Generator of augmented data (one per input). Results are yielded in same order of input.
+
+        Each augmenter retries its own output until it differs from its input but the whole flow is not retried as
+        augment does.
+
+        >>> flow = naf.Sequential([naw.SynonymAug(), naw.ContextualWordEmbsAug()])
+        >>> for augmented_text in flow.augment_pipelined(open('data.txt'), stage_workers=[4, 1],
+        ...                                              stage_backends=['process', 'thread']):
+        ...     print(augmented_text)
+        """
+        return parallel.pipelined_augment(list(self), data, stage_workers=stage_workers, chunk_size=chunk_size,
+                                          queue_size=queue_size, seed=seed, offset=offset,
+                                          stage_backends=stage_backends)
@@ -28,3 +28,6 @@ class Sometimes(Pipeline):
 
     def draw(self):
         return self.pipeline_p > self.prob()
+
+    def draw_batch(self, uniforms):
+        return self.pipeline_p > uniforms
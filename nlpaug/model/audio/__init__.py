@@ -1,9 +1,13 @@
 from __future__ import absolute_import
-from nlpaug.model.audio.audio import *
-from nlpaug.model.audio.noise import *
-from nlpaug.model.audio.shift import *
-from nlpaug.model.audio.speed import *
-from nlpaug.model.audio.pitch import *
-from nlpaug.model.audio.loudness import *
-from nlpaug.model.audio.crop import *
-from nlpaug.model.audio.mask import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'audio': ['Audio'],
+    'noise': ['Noise'],
+    'shift': ['Shift'],
+    'speed': ['Speed'],
+    'pitch': ['Pitch'],
+    'loudness': ['Loudness'],
+    'crop': ['Crop'],
+    'mask': ['Mask'],
+})
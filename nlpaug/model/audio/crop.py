@@ -1,6 +1,7 @@
 import numpy as np
 
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Crop(Audio):
@@ -21,7 +22,7 @@ class Crop(Audio):
     def manipulate(self, data):
         valid_region = (int(len(data) * self.crop_range[0]), int(len(data) * self.crop_range[1]))
 
-        start_timeframe = np.random.randint(valid_region[0], valid_region[1])
+        start_timeframe = get_random_stream().numpy.integers(valid_region[0], valid_region[1])
         end_timeframe = start_timeframe + self.sampling_rate * self.crop_factor
 
         # Crop region is larger than valid region
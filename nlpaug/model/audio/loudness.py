@@ -1,6 +1,5 @@
-import numpy as np
-
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Loudness(Audio):
@@ -14,6 +13,6 @@ class Loudness(Audio):
         self.loudness_factor = loudness_factor
 
     def manipulate(self, data):
-        loud = np.random.uniform(self.loudness_factor[0], self.loudness_factor[1])
+        loud = get_random_stream().numpy.uniform(self.loudness_factor[0], self.loudness_factor[1])
         augmented_data = data * loud
         return augmented_data
@@ -1,6 +1,5 @@
-import numpy as np
-
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Mask(Audio):
@@ -24,7 +23,7 @@ class Mask(Audio):
     def manipulate(self, data):
         valid_region = (int(len(data) * self.mask_range[0]), int(len(data) * self.mask_range[1]))
 
-        start_timeframe = np.random.randint(valid_region[0], valid_region[1])
+        start_timeframe = get_random_stream().numpy.integers(valid_region[0], valid_region[1])
         end_timeframe = start_timeframe + self.sampling_rate * self.mask_factor
 
         # Mask region is larger than valid region
@@ -33,7 +32,7 @@ class Mask(Audio):
 
         masked_value = None
         if self.mask_with_noise:
-            masked_value = np.random.randn(end_timeframe - start_timeframe)
+            masked_value = get_random_stream().numpy.standard_normal(end_timeframe - start_timeframe)
         else:
             masked_value = [0 for _ in range(end_timeframe-start_timeframe)]
 
@@ -1,6 +1,5 @@
-import numpy as np
-
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Noise(Audio):
@@ -18,7 +17,7 @@ class Noise(Audio):
         self.noise_factor = noise_factor
 
     def manipulate(self, data):
-        noise = np.random.randn(len(data))
+        noise = get_random_stream().numpy.standard_normal(len(data))
         augmented_data = data + self.noise_factor * noise
         # Cast back to same data type
         augmented_data = augmented_data.astype(type(data[0]))
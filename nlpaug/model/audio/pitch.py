@@ -5,9 +5,8 @@ try:
 except ImportError:
     # No installation required if not using this function
     pass
-import numpy as np
-
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Pitch(Audio):
@@ -29,6 +28,6 @@ class Pitch(Audio):
             raise ImportError('Missed librosa library. Install it via `pip install librosa`')
 
     def manipulate(self, data):
-        n_step = np.random.randint(self.pitch_range[0], self.pitch_range[1])
+        n_step = get_random_stream().numpy.integers(self.pitch_range[0], self.pitch_range[1])
 
         return librosa.effects.pitch_shift(data, self.sampling_rate, n_step)
@@ -2,6 +2,7 @@
 import numpy as np
 
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Shift(Audio):
@@ -24,11 +25,11 @@ class Shift(Audio):
                 'shift_direction should be either left, right or both while {} is passed.'.format(shift_direction))
 
     def manipulate(self, data):
-        shift = np.random.randint(self.sampling_rate * self.shift_max)
+        shift = get_random_stream().numpy.integers(self.sampling_rate * self.shift_max)
         if self.shift_direction == 'right':
             shift = -shift
         elif self.shift_direction == 'both':
-            direction = np.random.randint(0, 2)
+            direction = get_random_stream().numpy.integers(0, 2)
             if direction == 1:
                 shift = -shift
 
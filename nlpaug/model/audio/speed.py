@@ -8,6 +8,7 @@ except ImportError:
 import numpy as np
 
 from nlpaug.model.audio import Audio
+from nlpaug.util.random_stream import get_random_stream
 
 
 class Speed(Audio):
@@ -32,6 +33,6 @@ class Speed(Audio):
 
     def manipulate(self, data):
         speeds = [round(i, 1) for i in np.arange(self.speed_range[0], self.speed_range[1], 0.1)]
-        speed = speeds[np.random.randint(len(speeds))]
+        speed = speeds[get_random_stream().numpy.integers(len(speeds))]
 
         return librosa.effects.time_stretch(data, speed)
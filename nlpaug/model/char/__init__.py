@@ -1,4 +1,8 @@
 from __future__ import absolute_import
-from nlpaug.model.char.char import *
-from nlpaug.model.char.keyboard import *
-from nlpaug.model.char.ocr import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'char': ['Character'],
+    'keyboard': ['Keyboard'],
+    'ocr': ['Ocr'],
+})
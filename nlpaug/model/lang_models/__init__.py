@@ -1,5 +1,9 @@
 from __future__ import absolute_import
-from nlpaug.model.lang_models.language_models import *
-from nlpaug.model.lang_models.bert import *
-from nlpaug.model.lang_models.xlnet import *
-from nlpaug.model.lang_models.gpt2 import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'language_models': ['LanguageModels'],
+    'bert': ['BertDeprecated', 'Bert'],
+    'xlnet': ['XlNet'],
+    'gpt2': ['Gpt2'],
+})
@@ -1,4 +1,8 @@
 from __future__ import absolute_import
-from nlpaug.model.spectrogram.spectrogram import *
-from nlpaug.model.spectrogram.frequency_masking import *
-from nlpaug.model.spectrogram.time_masking import *
\ No newline at end of file
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'spectrogram': ['Spectrogram'],
+    'frequency_masking': ['FrequencyMasking'],
+    'time_masking': ['TimeMasking'],
+})
@@ -1,6 +1,5 @@
-import numpy as np
-
 from nlpaug.model.spectrogram import Spectrogram
+from nlpaug.util.random_stream import get_random_stream
 
 
 class FrequencyMasking(Spectrogram):
@@ -20,8 +19,8 @@ class FrequencyMasking(Spectrogram):
         :return:
         """
         v  = data.shape[0]
-        self.f = np.random.randint(self.mask_factor)
-        self.f0 = np.random.randint(v - self.f)
+        self.f = get_random_stream().numpy.integers(self.mask_factor)
+        self.f0 = get_random_stream().numpy.integers(v - self.f)
 
         augmented_mel_spectrogram = data.copy()
         augmented_mel_spectrogram[self.f0:self.f0+self.f, :] = 0
@@ -1,6 +1,5 @@
-import numpy as np
-
 from nlpaug.model.spectrogram import Spectrogram
+from nlpaug.util.random_stream import get_random_stream
 
 
 class TimeMasking(Spectrogram):
@@ -20,8 +19,8 @@ class TimeMasking(Spectrogram):
         """
 
         time_range = data.shape[1]
-        self.t = np.random.randint(self.mask_factor)
-        self.t0 = np.random.randint(time_range - self.t)
+        self.t = get_random_stream().numpy.integers(self.mask_factor)
+        self.t0 = get_random_stream().numpy.integers(time_range - self.t)
 
         augmented_mel_spectrogram = data.copy()
         augmented_mel_spectrogram[:, self.t0:self.t0+self.t] = 0
@@ -1,5 +1,9 @@
 from __future__ import absolute_import
-from nlpaug.model.word_dict.word_dictionary import *
-from nlpaug.model.word_dict.spelling import *
-from nlpaug.model.word_dict.wordnet import *
-from nlpaug.model.word_dict.ppdb import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'word_dictionary': ['WordDictionary'],
+    'spelling': ['Spelling'],
+    'wordnet': ['WordNet'],
+    'ppdb': ['Ppdb'],
+})
@@ -1,5 +1,11 @@
 from __future__ import absolute_import
-from nlpaug.model.word_embs.word_embeddings import *
-from nlpaug.model.word_embs.glove import *
-from nlpaug.model.word_embs.word2vec import *
-from nlpaug.model.word_embs.fasttext import *
\ No newline at end of file
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'word_embeddings': ['WordEmbeddings'],
+    'glove': ['pre_trained_model_url', 'GloVe'],
+    'word2vec': ['Word2vec'],
+    'fasttext': ['Fasttext'],
+    'ann_index': ['IvfIndex'],
+    'neighbor_table': ['build_neighbor_table', 'load_neighbor_table'],
+})
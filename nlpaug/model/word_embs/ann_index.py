@@ -0,0 +1,132 @@
+"""
+    Approximate nearest neighbor index of word embeddings.
+"""
+
+import numpy as np
+
+import nlpaug.util.math.normalization as normalization
+
+
+class IvfIndex:
+    """
+    Inverted file index. Vectors are clustered by spherical k-means and only vectors of the nprobe clusters which are
+    closest to query are scored. Search cost is roughly nprobe / num_list of exact search.
+
+    :param numpy.ndarray vectors: L2 normalized vectors (one row per word). Index refers to them instead of copying.
+    :param numpy.ndarray centroids: L2 normalized centroids (one row per cluster)
+    :param numpy.ndarray list_offsets: Vectors of i-th cluster are list_ids[list_offsets[i]:list_offsets[i + 1]]
+    :param numpy.ndarray list_ids: Vector ids grouped by cluster
+    :param int nprobe: Number of clusters scored per query. Larger value returns better recall but is slower.
+
+    >>> index = IvfIndex.build(model.normalized_vectors, nprobe=8)
+    >>> ids = index.search(model.normalized_vectors[0], k=10)
+    """
+    VERSION = 1
+
+    def __init__(self, vectors, centroids, list_offsets, list_ids, nprobe=8):
+        self.vectors = vectors
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.list_ids = list_ids
+        self.nprobe = nprobe
+
+    @property
+    def num_list(self):
+        return len(self.centroids)
+
+    @classmethod
+    def build(cls, vectors, num_list=None, nprobe=8, num_iter=10, sample_size=100000, batch_size=10000, seed=0):
+        """
+        :param numpy.ndarray vectors: L2 normalized vectors
+        :param int num_list: Number of clusters. Default value is square root of number of vectors.
+        :param int nprobe: Default number of clusters scored per query
+        :param int num_iter: Number of k-means iteration
+        :param int sample_size: Number of vectors used to train centroids. All vectors are assigned afterward.
+        :param int batch_size: Number of vectors assigned at one time. It bounds memory of assignment.
+        :param int seed: Seed of sampling and centroid initialization
+        :return: IvfIndex
+        """
+        if len(vectors) == 0:
+            raise ValueError('Index cannot be built from empty vectors')
+        if num_list is None:
+            num_list = int(np.sqrt(len(vectors)))
+        num_list = max(1, min(num_list, len(vectors)))
+
+        random = np.random.default_rng(seed)
+        samples = vectors
+        if len(vectors) > sample_size:
+            samples = vectors[np.sort(random.choice(len(vectors), sample_size, replace=False))]
+        centroids = samples[random.choice(len(samples), num_list, replace=False)].astype(np.float32)
+
+        for _ in range(num_iter):
+            assignments = cls._assign(samples, centroids, batch_size)
+            counts = np.bincount(assignments, minlength=num_list)
+            # Empty cluster keeps its centroid
+            non_empty = counts > 0
+            starts = (np.cumsum(counts) - counts)[non_empty]
+            sums = np.add.reduceat(samples[np.argsort(assignments, kind='stable')], starts, axis=0)
+            centroids[non_empty] = normalization.l2_norm(sums).astype(np.float32)
+
+        assignments = cls._assign(vectors, centroids, batch_size)
+        list_ids = np.argsort(assignments, kind='stable').astype(np.int64)
+        list_offsets = np.zeros(num_list + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=num_list), out=list_offsets[1:])
+        return cls(vectors, centroids, list_offsets, list_ids, nprobe=nprobe)
+
+    @classmethod
+    def _assign(cls, vectors, centroids, batch_size):
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), batch_size):
+            assignments[start:start + batch_size] = np.argmax(
+                np.dot(vectors[start:start + batch_size], centroids.T), axis=1)
+        return assignments
+
+    def search(self, query, k, nprobe=None):
+        """
+        :param numpy.ndarray query: Query vector. It does not need to be normalized.
+        :param int k: Number of neighbors
+        :param int nprobe: Number of clusters scored. Default value is nprobe of index.
+        :return: Ids of (at most) k vectors which have the highest dot product with query, sorted by score
+        """
+        nprobe = min(nprobe or self.nprobe, self.num_list)
+        centroid_scores = np.dot(self.centroids, query)
+        if nprobe < self.num_list:
+            probe_ids = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        else:
+            probe_ids = np.arange(self.num_list)
+
+        candidate_ids = np.concatenate(
+            [self.list_ids[self.list_offsets[i]:self.list_offsets[i + 1]] for i in probe_ids])
+        scores = np.dot(self.vectors[candidate_ids], query)
+        if k < len(candidate_ids):
+            top_ids = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top_ids = np.arange(len(candidate_ids))
+        top_ids = top_ids[np.argsort(-scores[top_ids], kind='stable')]
+        return candidate_ids[top_ids]
+
+    def save(self, file_path):
+        """
+        :param str file_path: Path of index file (.npz). Vectors are not saved.
+        """
+        with open(file_path, 'wb') as f:
+            np.savez(f, version=self.VERSION, centroids=self.centroids, list_offsets=self.list_offsets,
+                     list_ids=self.list_ids, nprobe=self.nprobe)
+
+    @classmethod
+    def load(cls, file_path, vectors):
+        """
+        :param str file_path: Path of index file
+        :param numpy.ndarray vectors: Same L2 normalized vectors which index is built from
+        :return: IvfIndex
+        """
+        with np.load(file_path) as f:
+            if int(f['version']) != cls.VERSION:
+                raise ValueError('Index version ({}) is not supported. Expected version is {}'.format(
+                    int(f['version']), cls.VERSION))
+            index = cls(vectors, f['centroids'], f['list_offsets'], f['list_ids'], nprobe=int(f['nprobe']))
+
+        if len(index.list_ids) != len(vectors) or index.centroids.shape[1] != vectors.shape[1]:
+            raise ValueError('Index is built from {} vectors of size {} while {} vectors of size {} are passed'.format(
+                len(index.list_ids), index.centroids.shape[1], len(vectors), vectors.shape[1]))
+        return index
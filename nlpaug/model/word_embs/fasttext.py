@@ -9,6 +9,10 @@ class Fasttext(WordEmbeddings):
         super().__init__(top_k, cache, skip_check)
 
     def read(self, file_path, max_num_vector=None):
+        binary_path = self.find_binary(file_path)
+        if binary_path is not None:
+            return self.read_binary(binary_path, max_num_vector=max_num_vector)
+
         with open(file_path, 'r', encoding='utf-8') as f:
             header = f.readline()
             self.vocab_size, self.emb_size = map(int, header.split())
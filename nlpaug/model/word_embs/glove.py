@@ -17,6 +17,10 @@ class GloVe(WordEmbeddings):
         super().__init__(top_k, cache, skip_check)
 
     def read(self, file_path, max_num_vector=None):
+        binary_path = self.find_binary(file_path)
+        if binary_path is not None:
+            return self.read_binary(binary_path, max_num_vector=max_num_vector)
+
         with open(file_path, 'r', encoding='utf-8') as f:
             for line in f:
                 tokens = line.split()
@@ -0,0 +1,90 @@
+"""
+    Precomputed nearest neighbors of word embeddings.
+"""
+
+import multiprocessing
+import numpy as np
+
+# Vectors owned by a process pool worker. Set once when worker starts.
+_WORKER_VECTORS = None
+
+
+def _init_worker(vectors):
+    global _WORKER_VECTORS
+    _WORKER_VECTORS = vectors
+
+
+def _worker_search(args):
+    start, end, num_neighbor = args
+    return search_neighbors(_WORKER_VECTORS, start, end, num_neighbor)
+
+
+def search_neighbors(vectors, start, end, num_neighbor):
+    """
+    :param numpy.ndarray vectors: L2 normalized vectors
+    :param int start: First word id of chunk
+    :param int end: Last word id (exclusive) of chunk
+    :param int num_neighbor: Number of neighbors per word
+    :return: int32 matrix of neighbor ids (one row per word, sorted by score). Word itself is excluded.
+    """
+    scores = np.dot(vectors[start:end], vectors.T)
+    num_candidate = min(num_neighbor + 1, len(vectors))
+    if num_candidate < len(vectors):
+        candidate_ids = np.argpartition(-scores, num_candidate - 1, axis=1)[:, :num_candidate]
+    else:
+        candidate_ids = np.tile(np.arange(len(vectors)), (end - start, 1))
+    candidate_scores = np.take_along_axis(scores, candidate_ids, axis=1)
+    candidate_ids = np.take_along_axis(candidate_ids, np.argsort(-candidate_scores, axis=1, kind='stable'), axis=1)
+
+    # Drop word itself. If it is not among candidates (e.g. duplicated vectors), drop the last candidate instead.
+    keep = candidate_ids != np.arange(start, end)[:, np.newaxis]
+    keep[keep.all(axis=1), -1] = False
+    return candidate_ids[keep].reshape(end - start, num_candidate - 1).astype(np.int32)
+
+
+def build_neighbor_table(vectors, file_path, num_neighbor=102, max_num_word=None, chunk_size=1024, num_proc=1):
+    """
+    Compute nearest neighbors of every word and store them as int32 matrix in .npy file. Matrix is written chunk by
+    chunk so memory stays bounded. Load it by load_neighbor_table (memory mapped).
+
+    :param numpy.ndarray vectors: L2 normalized vectors
+    :param str file_path: Path of table file (.npy)
+    :param int num_neighbor: Number of neighbors per word
+    :param int max_num_word: Only compute neighbors of first max_num_word words (the most frequent words for most of
+        pre-trained embeddings). Neighbors are searched from whole vocabulary.
+    :param int chunk_size: Number of words are computed at one time
+    :param int num_proc: Number of process
+    :return: Memory mapped table
+    """
+    num_word = len(vectors) if max_num_word is None else min(max_num_word, len(vectors))
+    num_neighbor = min(num_neighbor, len(vectors) - 1)
+    if num_neighbor < 1:
+        raise ValueError('At least 2 vectors are required while {} is passed'.format(len(vectors)))
+
+    table = np.lib.format.open_memmap(file_path, mode='w+', dtype=np.int32, shape=(num_word, num_neighbor))
+    tasks = [(start, min(start + chunk_size, num_word), num_neighbor) for start in range(0, num_word, chunk_size)]
+    if num_proc > 1:
+        with multiprocessing.Pool(num_proc, initializer=_init_worker, initargs=(vectors,)) as pool:
+            for (start, end, _), neighbors in zip(tasks, pool.imap(_worker_search, tasks)):
+                table[start:end] = neighbors
+    else:
+        for start, end, _ in tasks:
+            table[start:end] = search_neighbors(vectors, start, end, num_neighbor)
+    table.flush()
+    del table
+    return load_neighbor_table(file_path)
+
+
+def load_neighbor_table(file_path, vocab_size=None):
+    """
+    :param str file_path: Path of table file which is built by build_neighbor_table
+    :param int vocab_size: Vocabulary size of embeddings. Table is validated against it if it is passed.
+    :return: Memory mapped table. Rows are read from disk on demand.
+    """
+    table = np.load(file_path, mmap_mode='r')
+    if table.ndim != 2 or table.dtype != np.int32:
+        raise ValueError('{} is not a neighbor table'.format(file_path))
+    if vocab_size is not None and (len(table) > vocab_size or table.shape[1] >= vocab_size):
+        raise ValueError('Table of {} words and {} neighbors does not match vocabulary size {}'.format(
+            len(table), table.shape[1], vocab_size))
+    return table
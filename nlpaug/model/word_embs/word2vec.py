@@ -1,5 +1,6 @@
 # Source: https://arxiv.org/pdf/1301.3781.pdf
 
+import mmap
 import numpy as np
 
 from nlpaug.model.word_embs import WordEmbeddings
@@ -10,6 +11,10 @@ class Word2vec(WordEmbeddings):
         super().__init__(top_k, cache, skip_check)
 
     def read(self, file_path, max_num_vector=None):
+        binary_path = self.find_binary(file_path)
+        if binary_path is not None:
+            return self.read_binary(binary_path, max_num_vector=max_num_vector)
+
         with open(file_path, 'rb') as f:
             header = f.readline()
             self.vocab_size, self.emb_size = map(int, header.split())
@@ -18,26 +23,9 @@ class Word2vec(WordEmbeddings):
 
             self.vectors = np.zeros((self.vocab_size, self.emb_size), dtype=np.float32)
             binary_len = np.dtype(np.float32).itemsize * self.emb_size
-
-            for _ in range(self.vocab_size):
-                word = []
-                while True:
-                    ch = f.read(1)
-                    if ch == b' ':
-                        word = ''.join(word)
-                        break
-                    if ch != '\n':
-                        word.append(ch.decode('cp437'))
-                # values = np.fromstring(f.read(binary_len), dtype=np.float32)
-                values = np.frombuffer(f.read(binary_len), dtype=np.float32)
-
-                # word = " ".join(tokens[0:(len(tokens) - self.emb_size):])
-                # values = np.array([float(val) for val in tokens[(self.emb_size * -1):]])
-
-                self.vectors[len(self.i2w)] = values
-                self.i2w[len(self.i2w)] = word
-                self.w2i[word] = len(self.w2i)
-                self.w2v[word] = values
+            if self.vocab_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    self._read_vectors(buffer, len(header), binary_len)
 
         self.vectors = np.asarray(self.vectors)
         if not self.skip_check:
@@ -53,3 +41,31 @@ class Word2vec(WordEmbeddings):
         if self.cache:
             self.vocab = [word for word in self.w2v]
 
+    def _read_vectors(self, buffer, offset, binary_len, chunk_size=4096):
+        # Record is word, space and vector. Word (including '\n' written after previous vector) ends at first space
+        # which is found by C level scanning. Vectors of a chunk are copied into matrix at once.
+        words = []
+        position = offset
+        for chunk_start in range(0, self.vocab_size, chunk_size):
+            vectors = []
+            for i in range(chunk_start, min(chunk_start + chunk_size, self.vocab_size)):
+                space_position = buffer.find(b' ', position)
+                if space_position < 0 or space_position + 1 + binary_len > len(buffer):
+                    raise ValueError('Word2vec file is truncated at {}-th vector'.format(i))
+                word = buffer[position:space_position]
+                # Same as decoding byte by byte. cp437 is identical to ascii for ascii bytes.
+                words.append(word.decode('ascii') if word.isascii() else word.decode('cp437'))
+                position = space_position + 1 + binary_len
+                vectors.append(buffer[space_position + 1:position])
+
+            self.vectors[chunk_start:chunk_start + len(vectors)] = np.frombuffer(
+                b''.join(vectors), dtype=np.float32).reshape(len(vectors), self.emb_size)
+
+        self.i2w = dict(enumerate(words))
+        if len(set(words)) == len(words):
+            self.w2i = {word: i for i, word in enumerate(words)}
+        else:
+            # Same index as adding words one by one
+            for word in words:
+                self.w2i[word] = len(self.w2i)
+        self.w2v = dict(zip(words, self.vectors))
@@ -1,9 +1,19 @@
+import copy
+import os
 import numpy as np
 
 import nlpaug.util.math.normalization as normalization
 
 
 class WordEmbeddings:
+    # Maximum number of scores computed by one matrix product of predict_batch
+    MAX_NUM_SCORE = 2 ** 25
+    # Files of binary format. They are named by appending extension to path of original file.
+    BINARY_VECTORS_EXT = '.npy'
+    BINARY_NORMALIZED_VECTORS_EXT = '.normalized.npy'
+    BINARY_VOCAB_EXT = '.vocab'
+    BINARY_OFFSETS_EXT = '.offsets.npy'
+
     def __init__(self, top_k=100, cache=True, skip_check=True):
         self.top_k = top_k
         self.cache = cache
@@ -16,12 +26,104 @@ class WordEmbeddings:
         self.w2i = {}
         self.vectors = []
         self.normalized_vectors = None
+        self.index = None
+        self.neighbor_table = None
+        self.neighbor_table_path = None
+        self.binary_path = None
+        self.max_num_vector = None
 
         self.vocab = []
 
     def read(self, file_path, max_num_vector):
         raise NotImplementedError
 
+    @classmethod
+    def get_binary_files(cls, file_path):
+        return [file_path + ext for ext in [cls.BINARY_VECTORS_EXT, cls.BINARY_NORMALIZED_VECTORS_EXT,
+                                           cls.BINARY_VOCAB_EXT, cls.BINARY_OFFSETS_EXT]]
+
+    @classmethod
+    def find_binary(cls, file_path):
+        """
+        :param str file_path: Path of original file or of binary format (path of original file appended with .npy)
+        :return: Path of original file if its binary format exists and is not older than it. Otherwise, None.
+        """
+        if file_path.endswith(cls.BINARY_VECTORS_EXT) and not file_path.endswith(cls.BINARY_OFFSETS_EXT):
+            file_path = file_path[:-len(cls.BINARY_VECTORS_EXT)]
+        binary_files = cls.get_binary_files(file_path)
+        if not all(os.path.exists(binary_file) for binary_file in binary_files):
+            return None
+        if os.path.exists(file_path) and \
+                os.path.getmtime(file_path) > min(os.path.getmtime(binary_file) for binary_file in binary_files):
+            # Original file is updated after conversion
+            return None
+        return file_path
+
+    def save_binary(self, file_path):
+        """
+        Convert loaded embeddings to binary format: float32 .npy matrix of vectors (and normalized vectors) and
+        vocabulary with offsets. read of Word2vec, GloVe and Fasttext detects it and memory maps it instead of parsing
+        original file, so that processes on same host share one copy of vectors in page cache.
+
+        :param str file_path: Path of original file. Binary files are created next to it (e.g. glove.6B.50d.txt.npy).
+
+        >>> model.read('glove.6B.50d.txt')
+        >>> model.save_binary('glove.6B.50d.txt')
+        """
+        words = [self.i2w[i] for i in range(len(self.i2w))]
+        encoded_words = [word.encode('utf-8') for word in words]
+        offsets = np.zeros(len(encoded_words) + 1, dtype=np.int64)
+        np.cumsum([len(word) for word in encoded_words], out=offsets[1:])
+
+        vectors_path, normalized_vectors_path, vocab_path, offsets_path = self.get_binary_files(file_path)
+        # Vectors are written last so that partially converted files are never detected
+        self._write_binary(offsets_path, lambda f: np.save(f, offsets))
+        self._write_binary(vocab_path, lambda f: f.write(b''.join(encoded_words)))
+        self._write_binary(normalized_vectors_path,
+                           lambda f: np.save(f, np.asarray(self.normalized_vectors, dtype=np.float32)))
+        self._write_binary(vectors_path, lambda f: np.save(f, np.asarray(self.vectors, dtype=np.float32)))
+
+    @classmethod
+    def _write_binary(cls, file_path, write_fx):
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            write_fx(f)
+        os.replace(tmp_path, file_path)
+
+    def read_binary(self, file_path, max_num_vector=None):
+        """
+        :param str file_path: Path of original file which is converted by save_binary
+        :param int max_num_vector: Only load first max_num_vector words
+        """
+        vectors_path, normalized_vectors_path, vocab_path, offsets_path = self.get_binary_files(file_path)
+        self.vectors = np.load(vectors_path, mmap_mode='r')
+        self.normalized_vectors = np.load(normalized_vectors_path, mmap_mode='r')
+        offsets = np.load(offsets_path)
+        if max_num_vector is not None:
+            self.vectors = self.vectors[:max_num_vector]
+            self.normalized_vectors = self.normalized_vectors[:max_num_vector]
+            offsets = offsets[:max_num_vector + 1]
+        if len(offsets) != len(self.vectors) + 1 or len(self.normalized_vectors) != len(self.vectors):
+            raise ValueError('Vocabulary size ({}) does not match number of vectors ({}) of {}'.format(
+                len(offsets) - 1, len(self.vectors), file_path))
+
+        with open(vocab_path, 'rb') as f:
+            vocab = f.read(int(offsets[-1]))
+        self.vocab_size, self.emb_size = self.vectors.shape
+        words = [vocab[start:end].decode('utf-8') for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        self.i2w = dict(enumerate(words))
+        self.w2i = {word: i for i, word in enumerate(words)}
+        # Rows of plain ndarray (still memory mapped) are much cheaper to create than rows of np.memmap
+        self.w2v = dict(zip(words, np.asarray(self.vectors)))
+
+        if not self.skip_check and len(self.w2i) != len(self.i2w):
+            raise AssertionError('Index2Word Size:{}, Word2Index Size:{}'.format(len(self.i2w), len(self.w2i)))
+
+        self.binary_path = file_path
+        self.max_num_vector = max_num_vector
+        if self.cache:
+            self.vocab = [word for word in self.w2v]
+
     def similar(self, word):
         raise NotImplementedError
 
@@ -56,11 +158,116 @@ class WordEmbeddings:
         elif norm == 'standard':
             return normalization.standard_norm(vectors)
 
+    def build_index(self, num_list=None, nprobe=8, **kwargs):
+        """
+        Build approximate nearest neighbor index so that predict scores a part of vocabulary instead of all of it.
+
+        :param int num_list: Number of clusters. Default value is square root of vocabulary size.
+        :param int nprobe: Number of clusters scored per prediction. Larger value returns better recall but is slower.
+        :param kwargs: See nlpaug.model.word_embs.ann_index.IvfIndex.build
+        :return: IvfIndex
+        """
+        from nlpaug.model.word_embs.ann_index import IvfIndex
+        self.index = IvfIndex.build(self.normalized_vectors, num_list=num_list, nprobe=nprobe, **kwargs)
+        return self.index
+
+    def save_index(self, file_path):
+        if self.index is None:
+            raise ValueError('Index is not built. Call build_index first')
+        self.index.save(file_path)
+
+    def load_index(self, file_path):
+        """
+        :param str file_path: Index file which is saved by save_index from the same embeddings
+        :return: IvfIndex
+        """
+        from nlpaug.model.word_embs.ann_index import IvfIndex
+        self.index = IvfIndex.load(file_path, self.normalized_vectors)
+        return self.index
+
+    def build_neighbor_table(self, file_path, max_num_word=None, chunk_size=1024, num_proc=1):
+        """
+        Precompute neighbors of vocabulary and store them in file so that predict looks them up instead of scoring
+        vocabulary. Table is reused by other processes through load_neighbor_table.
+
+        :param str file_path: Path of table file (.npy)
+        :param int max_num_word: Only compute neighbors of first max_num_word words. Other words are predicted as
+            usual.
+        :param int chunk_size: Number of words are computed at one time
+        :param int num_proc: Number of process
+        :return: Memory mapped table (int32 matrix of top_k + 2 neighbor ids per word)
+        """
+        from nlpaug.model.word_embs.neighbor_table import build_neighbor_table
+        build_neighbor_table(self.normalized_vectors, file_path, num_neighbor=self.top_k+2, max_num_word=max_num_word,
+                             chunk_size=chunk_size, num_proc=num_proc)
+        return self.load_neighbor_table(file_path)
+
+    def load_neighbor_table(self, file_path):
+        from nlpaug.model.word_embs.neighbor_table import load_neighbor_table
+        self.neighbor_table = load_neighbor_table(file_path, vocab_size=len(self.normalized_vectors))
+        self.neighbor_table_path = file_path
+        return self.neighbor_table
+
+    def __getstate__(self):
+        # Memory mapped files are reopened instead of being copied (e.g. to process pool worker)
+        state = self.__dict__.copy()
+        if self.neighbor_table_path is not None:
+            state['neighbor_table'] = None
+        if self.binary_path is not None:
+            for key in ['vectors', 'normalized_vectors', 'w2v', 'i2w', 'w2i', 'vocab']:
+                state[key] = None
+            if self.index is not None:
+                state['index'] = copy.copy(self.index)
+                state['index'].vectors = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.__dict__.get('binary_path') is not None:
+            self.read_binary(self.binary_path, max_num_vector=self.max_num_vector)
+            if self.index is not None:
+                self.index.vectors = self.normalized_vectors
+        if self.__dict__.get('neighbor_table_path') is not None:
+            self.load_neighbor_table(self.neighbor_table_path)
+
     def predict(self, word, n=1):
-        source_id = self.word2idx(word)
-        source_vector = self.word2vector(word)
-        scores = np.dot(self.normalized_vectors, source_vector)
-        target_ids = np.argpartition(-scores, self.top_k+2)[:self.top_k+2]
+        return self.predict_batch([word], n=n)[0]
+
+    def predict_batch(self, words, n=1):
+        """
+        Predict candidates of multiple words at once. Words which are not in neighbor table (or index) are scored by
+        one matrix-matrix product per chunk instead of one matrix-vector product per word.
+
+        :param list words: Words for prediction. Repeated words are predicted once.
+        :return: List of candidate words (one list per word). Same as predict of each word.
+        """
+        predictions = {}
+        exact_words = []
+        for word in dict.fromkeys(words):
+            source_id = self.word2idx(word)
+            if self.neighbor_table is not None and source_id < len(self.neighbor_table):
+                predictions[word] = self._get_target_words(word, source_id, self.neighbor_table[source_id])
+            elif self.index is not None:
+                target_ids = self.index.search(self.word2vector(word), self.top_k+2)
+                predictions[word] = self._get_target_words(word, source_id, target_ids)
+            else:
+                exact_words.append(word)
+
+        # Bound memory of score matrix
+        chunk_size = max(1, self.MAX_NUM_SCORE // max(1, len(self.normalized_vectors)))
+        for start in range(0, len(exact_words), chunk_size):
+            chunk_words = exact_words[start:start + chunk_size]
+            source_vectors = np.array([self.word2vector(word) for word in chunk_words])
+            scores = np.dot(source_vectors, self.normalized_vectors.T)
+            target_ids = np.argpartition(-scores, self.top_k+2, axis=1)[:, :self.top_k+2]
+            for word, word_scores, ids in zip(chunk_words, scores, target_ids):
+                # Sorted by score so that result does not depend on other words of chunk
+                ids = ids[np.argsort(-word_scores[ids], kind='stable')]
+                predictions[word] = self._get_target_words(word, self.word2idx(word), ids)
+
+        return [predictions[word] for word in words]
+
+    def _get_target_words(self, word, source_id, target_ids):
         target_words = [self.idx2word(idx) for idx in target_ids if idx != source_id and self.idx2word(idx).lower() !=
                         word.lower()]  # filter out same word
         return target_words[:self.top_k]
@@ -1,3 +1,7 @@
 from __future__ import absolute_import
-from nlpaug.model.word_stats.word_statistics import *
-from nlpaug.model.word_stats.tfidf import *
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'word_statistics': ['WordStatistics'],
+    'tfidf': ['TfIdf'],
+})
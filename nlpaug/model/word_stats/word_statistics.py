@@ -1,4 +1,4 @@
-import numpy as np
+from nlpaug.util.random_stream import get_random_stream
 
 
 class WordStatistics:
@@ -19,4 +19,4 @@ class WordStatistics:
 
     @classmethod
     def choice(cls, x, p, size=1):
-        return np.random.choice(len(x), size, p=p)
+        return get_random_stream().numpy.choice(len(x), size, p=p)
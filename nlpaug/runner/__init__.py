@@ -0,0 +1,10 @@
+from __future__ import absolute_import
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'io': ['Format', 'Compression', 'read_records', 'ShardWriter'],
+    'spec': ['build_augmenter'],
+    'job': ['AugmentationJob'],
+    'work_queue': ['WorkQueue', 'run_worker'],
+    'cli': ['augment_records', 'main', 'queue_main'],
+})
@@ -0,0 +1,183 @@
+"""
+    Command line runner for augmenting files in bulk.
+
+    >>> nlpaug-run input.jsonl --output-dir output --spec flow.json --workers 4 --compression gzip
+
+    Corpus is processed on multiple hosts by work queue in shared directory.
+
+    >>> nlpaug-queue create queue input.jsonl --spec flow.json --task-size 100000 --seed 2019
+    >>> nlpaug-queue worker queue --workers 4  # On every host
+    >>> nlpaug-queue merge queue --output-dir output --compression gzip
+"""
+
+import argparse
+import collections
+import json
+import sys
+
+from nlpaug.runner.io import Format, Compression
+from nlpaug.runner.job import AugmentationJob
+from nlpaug.runner.spec import build_augmenter
+from nlpaug.runner.work_queue import WorkQueue, run_worker
+from nlpaug.util.parallel import Backend
+
+
+def augment_records(aug, records, text_field='text', n=1, chunk_size=64, workers=1, backend=None, seed=None,
+                    offset=0):
+    """
+    Augment text of records lazily.
+
+    :param obj aug: Augmenter or flow
+    :param iterable records: Iterable of dict record
+    :param int offset: Position of first record in whole input. It is used for deriving seed of each record.
+    :return: Generator of (record, augmented text). Records are yielded in same order of input.
+    """
+    # Records are buffered until their results come back. augment_stream reads ahead bounded number of chunks only.
+    buffer = collections.deque()
+
+    def texts():
+        for record in records:
+            buffer.append(record)
+            yield record[text_field]
+
+    for result in aug.augment_stream(texts(), n=n, chunk_size=chunk_size, workers=workers, backend=backend,
+                                     seed=seed, offset=offset):
+        yield buffer.popleft(), result
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(prog='nlpaug-run', description='Augment text file by nlpaug flow')
+    parser.add_argument('input', help='Path of input file (txt, jsonl or csv, optionally .gz/.bz2). "-" means stdin')
+    parser.add_argument('-o', '--output-dir', required=True, help='Directory of output shards')
+    parser.add_argument('-s', '--spec', required=True,
+                        help='Augmenter or flow spec. Either JSON string or path of JSON file. '
+                             'e.g. \'[{"type": "char.KeyboardAug"}, {"type": "word.RandomWordAug", "action": "swap"}]\'')
+    parser.add_argument('--input-format', choices=Format.getall(), help='Default is detected by file extension')
+    parser.add_argument('--output-format', choices=[Format.TXT, Format.JSONL],
+                        help='Default is txt for txt input and jsonl for others')
+    parser.add_argument('--text-field', default='text', help='Field (or column) of text in JSONL (or CSV) input')
+    parser.add_argument('--output-field', default='augmented', help='Field of augmented text in JSONL output')
+    parser.add_argument('--output-edits', action='store_true',
+                        help='Store edits ([position, original, replacement] list per augmented text) instead of '
+                             'augmented text in JSONL output')
+    parser.add_argument('--delimiter', help='Delimiter of CSV input')
+    parser.add_argument('-n', type=int, default=1, help='Number of augmented output per record')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Number of worker')
+    parser.add_argument('--backend', choices=Backend.getall(), default=Backend.PROCESS,
+                        help='Execution backend of workers')
+    parser.add_argument('--chunk-size', type=int, default=256, help='Number of records per worker task')
+    parser.add_argument('--shard-size', type=int, default=100000, help='Maximum number of records per output shard')
+    parser.add_argument('--compression', choices=Compression.getall(), default=Compression.NONE)
+    parser.add_argument('--seed', type=int, help='Base seed. Same seed returns same output regardless of workers')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume interrupted job from checkpoint of output directory. Otherwise, job starts from '
+                             'beginning')
+    parser.add_argument('--checkpoint-interval', type=float,
+                        help='Persist checkpoint at least every this number of second (by completing current shard '
+                             'early). Default is per full shard')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Do not print statistics')
+    return parser
+
+
+def run(args):
+    """
+    :param args: Parsed arguments (see get_parser)
+    :return: dict of statistics
+    """
+    aug = build_augmenter(args.spec)
+    job = AugmentationJob(aug, args.input, args.output_dir, input_format=args.input_format,
+                          text_field=args.text_field, output_format=args.output_format,
+                          output_field=args.output_field, output_edits=args.output_edits,
+                          delimiter=args.delimiter, n=args.n,
+                          chunk_size=args.chunk_size, workers=args.workers, backend=args.backend,
+                          shard_size=args.shard_size, compression=args.compression, seed=args.seed,
+                          checkpoint_interval=args.checkpoint_interval)
+    return job.run(resume=args.resume)
+
+
+def print_stats(stats, file=sys.stderr):
+    print('Processed {} records ({} output records, {} shards) in {:.2f}s. Throughput: {:.1f} records/s'.format(
+        stats['num_record'], stats['num_output_record'], stats['num_shard'], stats['elapsed'], stats['throughput']),
+        file=file)
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    stats = run(args)
+    if not args.quiet:
+        print_stats(stats)
+    return 0
+
+
+def get_queue_parser():
+    parser = argparse.ArgumentParser(prog='nlpaug-queue', description='Augment corpus on multiple hosts by work queue '
+                                                                      'in shared directory')
+    sub_parsers = parser.add_subparsers(dest='command', required=True)
+
+    create_parser = sub_parsers.add_parser('create', help='Split corpus into tasks (coordinator)')
+    create_parser.add_argument('queue_dir', help='Shared directory of queue')
+    create_parser.add_argument('input', help='Path of input file (txt, jsonl or csv, optionally .gz/.bz2)')
+    create_parser.add_argument('-s', '--spec', required=True, help='Augmenter or flow spec. Either JSON string or '
+                                                                   'path of JSON file')
+    create_parser.add_argument('--task-size', type=int, default=100000, help='Number of records per task')
+    create_parser.add_argument('--input-format', choices=Format.getall(), help='Default is detected by file extension')
+    create_parser.add_argument('--output-format', choices=[Format.TXT, Format.JSONL],
+                               help='Default is txt for txt input and jsonl for others')
+    create_parser.add_argument('--text-field', default='text', help='Field (or column) of text in JSONL (or CSV) input')
+    create_parser.add_argument('--output-field', default='augmented', help='Field of augmented text in JSONL output')
+    create_parser.add_argument('--delimiter', help='Delimiter of CSV input')
+    create_parser.add_argument('-n', type=int, default=1, help='Number of augmented output per record')
+    create_parser.add_argument('--seed', type=int, help='Base seed')
+    create_parser.add_argument('--lease-timeout', type=float, default=600,
+                               help='Second of lease. Task of worker which does not renew its lease in time is '
+                                    'claimed by other worker')
+
+    worker_parser = sub_parsers.add_parser('worker', help='Claim and process tasks until every task is done')
+    worker_parser.add_argument('queue_dir', help='Shared directory of queue')
+    worker_parser.add_argument('--worker-id', help='Unique ID of worker. Default is <host>-<pid>-<random>')
+    worker_parser.add_argument('-w', '--workers', type=int, default=1, help='Number of local worker')
+    worker_parser.add_argument('--backend', choices=Backend.getall(), default=Backend.PROCESS,
+                               help='Execution backend of local workers')
+    worker_parser.add_argument('--chunk-size', type=int, default=256, help='Number of records per local worker task')
+    worker_parser.add_argument('--poll-interval', type=float, default=5,
+                               help='Second to wait when every remaining task is leased by other workers')
+
+    merge_parser = sub_parsers.add_parser('merge', help='Verify and merge outputs of tasks')
+    merge_parser.add_argument('queue_dir', help='Shared directory of queue')
+    merge_parser.add_argument('-o', '--output-dir', required=True, help='Directory of output shards')
+    merge_parser.add_argument('--shard-size', type=int, default=100000, help='Maximum number of records per shard')
+    merge_parser.add_argument('--compression', choices=Compression.getall(), default=Compression.NONE)
+
+    status_parser = sub_parsers.add_parser('status', help='Print number of pending, leased and done tasks')
+    status_parser.add_argument('queue_dir', help='Shared directory of queue')
+
+    for sub_parser in [create_parser, worker_parser, merge_parser, status_parser]:
+        sub_parser.add_argument('-q', '--quiet', action='store_true', help='Do not print statistics')
+    return parser
+
+
+def queue_main(argv=None):
+    args = get_queue_parser().parse_args(argv)
+    if args.command == 'create':
+        queue = WorkQueue.create(args.queue_dir, args.input, args.spec, task_size=args.task_size,
+                                 input_format=args.input_format, text_field=args.text_field,
+                                 output_format=args.output_format, output_field=args.output_field,
+                                 delimiter=args.delimiter, n=args.n, seed=args.seed,
+                                 lease_timeout=args.lease_timeout)
+        stats = {'num_task': len(queue.tasks), 'num_record': sum(task['num_record'] for task in queue.tasks)}
+    elif args.command == 'worker':
+        stats = run_worker(args.queue_dir, worker_id=args.worker_id, chunk_size=args.chunk_size,
+                           workers=args.workers, backend=args.backend, poll_interval=args.poll_interval)
+    elif args.command == 'merge':
+        stats = WorkQueue(args.queue_dir).merge(args.output_dir, shard_size=args.shard_size,
+                                                compression=args.compression)
+    else:
+        stats = WorkQueue(args.queue_dir).get_status()
+
+    if not args.quiet:
+        print(json.dumps(stats), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
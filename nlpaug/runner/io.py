@@ -0,0 +1,201 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import os
+
+
+class Format:
+    TXT = 'txt'
+    JSONL = 'jsonl'
+    CSV = 'csv'
+
+    @staticmethod
+    def getall():
+        return [Format.TXT, Format.JSONL, Format.CSV]
+
+
+class Compression:
+    NONE = 'none'
+    GZIP = 'gzip'
+    BZ2 = 'bz2'
+
+    @staticmethod
+    def getall():
+        return [Compression.NONE, Compression.GZIP, Compression.BZ2]
+
+
+COMPRESSION_EXTENSIONS = {
+    Compression.NONE: '',
+    Compression.GZIP: '.gz',
+    Compression.BZ2: '.bz2'
+}
+
+
+def detect_format(file_path):
+    """
+    :param str file_path: Path of file. Compression extension (.gz, .bz2) is ignored.
+    :return: Format of file according to its extension. Default is plain text.
+    """
+    compression = detect_compression(file_path)
+    path = file_path[:len(file_path) - len(COMPRESSION_EXTENSIONS[compression])]
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension in [Format.JSONL, 'json', 'ndjson']:
+        return Format.JSONL
+    if extension in [Format.CSV, 'tsv']:
+        return Format.CSV
+    return Format.TXT
+
+
+def detect_compression(file_path):
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if extension and file_path.endswith(extension):
+            return compression
+    return Compression.NONE
+
+
+def open_file(file_path, mode='r', compression=None):
+    """
+    Open text file. Compressed file (gzip or bz2) is decompressed on the fly.
+
+    :param str compression: Compression of file. Default value is None which means detecting by file extension.
+    """
+    if compression is None:
+        compression = detect_compression(file_path)
+    if compression == Compression.GZIP:
+        return gzip.open(file_path, mode + 't', encoding='utf-8', newline='' if 'w' in mode else None)
+    if compression == Compression.BZ2:
+        return bz2.open(file_path, mode + 't', encoding='utf-8', newline='' if 'w' in mode else None)
+    return open(file_path, mode, encoding='utf-8', newline='' if 'w' in mode else None)
+
+
+def read_records(file_path, file_format=None, text_field='text', delimiter=None):
+    """
+    Read records one by one so that file of any size can be processed.
+
+    :param str file_path: Path of input file. '-' means standard input.
+    :param str file_format: Either 'txt', 'jsonl' or 'csv'. Default value is None which means detecting by file
+        extension.
+    :param str text_field: Field (or column) of text in JSONL (or CSV) file
+    :param str delimiter: Delimiter of CSV file. Default value is None which means ',' ('\\t' for .tsv file).
+    :return: Generator of dict record. Text of plain text file is stored in text_field.
+    """
+    file_format = file_format or detect_format(file_path)
+    if delimiter is None:
+        delimiter = '\t' if '.tsv' in file_path else ','
+
+    f = io.TextIOWrapper(os.fdopen(os.dup(0), 'rb'), encoding='utf-8') if file_path == '-' else open_file(file_path)
+    with f:
+        if file_format == Format.CSV:
+            for record in csv.DictReader(f, delimiter=delimiter):
+                if text_field not in record:
+                    raise ValueError('Column [{}] does not exist in {}'.format(text_field, file_path))
+                yield record
+        elif file_format == Format.JSONL:
+            for line_no, line in enumerate(f):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if text_field not in record:
+                    raise ValueError('Field [{}] does not exist in line {} of {}'.format(
+                        text_field, line_no + 1, file_path))
+                yield record
+        else:
+            for line in f:
+                yield {text_field: line.rstrip('\r\n')}
+
+
+class ShardWriter:
+    """
+    Write records into multiple files (shards) with at most shard_size records each. Shard is written to temporary
+    file and renamed when it is completed so that partial shard is never visible to readers.
+
+    :param str output_dir: Directory of shards
+    :param str file_format: Either 'txt' or 'jsonl'
+    :param int shard_size: Maximum number of records per shard. If None, shard is completed by flush_shard only.
+    :param str compression: Either 'none', 'gzip' or 'bz2'
+    :param str prefix: Prefix of shard file name
+    :param int start_shard: Index of first shard
+
+    >>> with ShardWriter('output', shard_size=100000, compression='gzip') as writer:
+    ...     writer.write({'text': 'The quick brown fox'})
+    """
+
+    def __init__(self, output_dir, file_format=Format.JSONL, shard_size=100000, compression=Compression.NONE,
+                 prefix='part', start_shard=0):
+        if file_format not in [Format.TXT, Format.JSONL]:
+            raise ValueError('Output format must be one of {} while {} is passed'.format(
+                [Format.TXT, Format.JSONL], file_format))
+        if compression not in Compression.getall():
+            raise ValueError('Compression must be one of {} while {} is passed'.format(
+                Compression.getall(), compression))
+
+        self.output_dir = output_dir
+        self.file_format = file_format
+        self.shard_size = shard_size
+        self.compression = compression
+        self.prefix = prefix
+
+        self.shard_idx = start_shard
+        self.num_record = 0
+        self.num_record_in_shard = 0
+        self.shard_paths = []
+        self._file = None
+        self._temp_path = None
+
+        os.makedirs(output_dir, exist_ok=True)
+
+    def get_shard_path(self, shard_idx):
+        return os.path.join(self.output_dir, '{}-{:05d}.{}{}'.format(
+            self.prefix, shard_idx, self.file_format, COMPRESSION_EXTENSIONS[self.compression]))
+
+    def write(self, record, text_field='text'):
+        if self._file is None:
+            self._temp_path = self.get_shard_path(self.shard_idx) + '.tmp'
+            self._file = open_file(self._temp_path, 'w', compression=self.compression)
+
+        if self.file_format == Format.TXT:
+            self._file.write(str(record[text_field]).replace('\n', ' ') + '\n')
+        else:
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        self.num_record += 1
+        self.num_record_in_shard += 1
+        if self.shard_size is not None and self.num_record_in_shard >= self.shard_size:
+            self.flush_shard()
+
+    def flush_shard(self):
+        """
+        Complete current shard. Next record is written to new shard.
+
+        :return: Path of completed shard. None if there is no record in current shard.
+        """
+        if self._file is None:
+            return None
+
+        self._file.close()
+        shard_path = self.get_shard_path(self.shard_idx)
+        os.replace(self._temp_path, shard_path)
+        self.shard_paths.append(shard_path)
+
+        self._file = None
+        self._temp_path = None
+        self.shard_idx += 1
+        self.num_record_in_shard = 0
+        return shard_path
+
+    def close(self):
+        self.flush_shard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            # Do not publish partial shard
+            self._file.close()
+            os.remove(self._temp_path)
+            self._file = None
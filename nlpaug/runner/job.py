@@ -0,0 +1,246 @@
+import hashlib
+import itertools
+import json
+import os
+import re
+import tempfile
+import time
+
+from nlpaug.augmenter.augment import get_edits
+from nlpaug.runner.io import Format, Compression, detect_format, read_records, ShardWriter
+from nlpaug.util.random_stream import get_random_stream
+
+
+def write_result(writer, record, result, text_field='text', output_field='augmented', output_edits=False):
+    """
+    Write augmented result of one input record. Each augmented text is written as one line of txt output while it
+    is stored in output_field of original record for jsonl output.
+
+    :param bool output_edits: Store edits ([pos, original, new] list per augmented text) instead of augmented text
+        in jsonl output. See nlpaug.augmenter.augment.apply_edits.
+    """
+    if output_edits:
+        if isinstance(result, list):
+            result = [[edit.to_tuple() for edit in get_edits(record[text_field], r)] for r in result]
+        else:
+            result = [edit.to_tuple() for edit in get_edits(record[text_field], result)]
+
+    if writer.file_format == Format.TXT:
+        for augmented_text in (result if isinstance(result, list) else [result]):
+            writer.write({text_field: augmented_text}, text_field=text_field)
+        return
+
+    record = dict(record)
+    record[output_field] = result
+    writer.write(record)
+
+
+class AugmentationJob:
+    """
+    Augment file in bulk with checkpoint. Progress (input offset, base seed and completed shards) is persisted to
+    checkpoint.json of output_dir whenever a shard is completed. Resumed job skips processed records and continues
+    from next shard so that no record is duplicated or skipped. Seed of each record is derived from base seed and
+    its position in input, hence resumed output is identical to uninterrupted one regardless of number of workers.
+
+    :param obj aug: Augmenter or flow
+    :param str input_path: Path of input file. '-' means standard input.
+    :param str output_dir: Directory of output shards and checkpoint
+    :param str input_format: Either 'txt', 'jsonl' or 'csv'. Default value is None which means detecting by file
+        extension.
+    :param str text_field: Field (or column) of text in JSONL (or CSV) input
+    :param str output_format: Either 'txt' or 'jsonl'. Default is txt for txt input and jsonl for others.
+    :param str output_field: Field of augmented text in JSONL output
+    :param bool output_edits: Store edits instead of augmented text in JSONL output. It is much smaller when n is
+        large or text is long.
+    :param str delimiter: Delimiter of CSV input
+    :param int n: Number of augmented output per record
+    :param int chunk_size: Number of records per worker task
+    :param int workers: Number of worker
+    :param str backend: Execution backend of workers. Either 'thread' or 'process'.
+    :param int shard_size: Maximum number of output records per shard. Records of one input are never split across
+        shards.
+    :param str compression: Either 'none', 'gzip' or 'bz2'
+    :param int seed: Base seed. If None, it is drawn from current random stream and persisted in checkpoint.
+    :param float checkpoint_interval: Complete current shard (and persist checkpoint) when it is open longer than
+        this number of second. Default value is None which means checkpoint is persisted per full shard only.
+
+    >>> from nlpaug.runner.job import AugmentationJob
+    >>> job = AugmentationJob(aug, 'input.jsonl', 'output', workers=4, seed=2019)
+    >>> job.run(resume=True)
+    """
+    CHECKPOINT_FILE = 'checkpoint.json'
+    CHECKPOINT_VERSION = 1
+    SHARD_PREFIX = 'part'
+
+    def __init__(self, aug, input_path, output_dir, input_format=None, text_field='text', output_format=None,
+                 output_field='augmented', output_edits=False, delimiter=None, n=1, chunk_size=256, workers=1,
+                 backend=None, shard_size=100000, compression=Compression.NONE, seed=None, checkpoint_interval=None):
+        if shard_size is not None and shard_size < 1:
+            raise ValueError('shard_size must be positive while {} is passed'.format(shard_size))
+        if output_edits and output_format == Format.TXT:
+            raise ValueError('Edits can be stored in jsonl output only')
+
+        self.aug = aug
+        self.input_path = input_path
+        self.output_dir = output_dir
+        self.input_format = input_format or detect_format(input_path)
+        self.text_field = text_field
+        self.output_format = output_format or (
+            Format.TXT if self.input_format == Format.TXT and not output_edits else Format.JSONL)
+        self.output_field = output_field
+        self.output_edits = output_edits
+        self.delimiter = delimiter
+        self.n = n
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.backend = backend
+        self.shard_size = shard_size
+        self.compression = compression
+        self.seed = seed
+        self.checkpoint_interval = checkpoint_interval
+
+    @property
+    def checkpoint_path(self):
+        return os.path.join(self.output_dir, self.CHECKPOINT_FILE)
+
+    def get_fingerprint(self):
+        """
+        :return: Digest of configurations which affect output. Checkpoint of different configuration is rejected.
+        """
+        config = {
+            'input_path': os.path.abspath(self.input_path) if self.input_path != '-' else '-',
+            'input_format': self.input_format,
+            'text_field': self.text_field,
+            'delimiter': self.delimiter,
+            'output_format': self.output_format,
+            'output_field': self.output_field,
+            'output_edits': self.output_edits,
+            'n': self.n,
+            'compression': self.compression,
+            'augmenter': repr(self.aug.get_cache_config())
+        }
+        return hashlib.sha1(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def load_checkpoint(self):
+        """
+        :return: dict of checkpoint. None if there is no checkpoint.
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+
+        if checkpoint.get('version') != self.CHECKPOINT_VERSION:
+            raise ValueError('Unsupported checkpoint version {} of {}'.format(
+                checkpoint.get('version'), self.checkpoint_path))
+        if checkpoint['fingerprint'] != self.get_fingerprint():
+            raise ValueError('Checkpoint {} was created by different input, augmenter or output configuration. '
+                             'Remove it or use other output directory.'.format(self.checkpoint_path))
+        if self.seed is not None and int(self.seed) != checkpoint['seed']:
+            raise ValueError('Seed ({}) does not match seed of checkpoint ({})'.format(self.seed, checkpoint['seed']))
+        return checkpoint
+
+    def save_checkpoint(self, checkpoint):
+        # Write to temporary file and rename so that checkpoint is never partially written
+        fd, temp_path = tempfile.mkstemp(dir=self.output_dir, prefix='.checkpoint', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(temp_path, self.checkpoint_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _remove_uncommitted_shards(self, shard_idx):
+        # Shards which are not recorded in checkpoint (and temporary files) belong to interrupted run
+        pattern = re.compile(r'^{}-(\d+)\.'.format(re.escape(self.SHARD_PREFIX)))
+        for file_name in os.listdir(self.output_dir):
+            match = pattern.match(file_name)
+            if match and (int(match.group(1)) >= shard_idx or file_name.endswith('.tmp')):
+                os.remove(os.path.join(self.output_dir, file_name))
+
+    def write_result(self, writer, record, result):
+        write_result(writer, record, result, text_field=self.text_field, output_field=self.output_field,
+                     output_edits=self.output_edits)
+
+    def run(self, resume=False):
+        """
+        :param bool resume: Resume from checkpoint of output_dir if it exists. Otherwise, existing checkpoint is
+            discarded and job starts from beginning.
+        :return: dict of statistics. num_record and num_output_record include records of previous runs.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        checkpoint = self.load_checkpoint() if resume else None
+        if checkpoint is None:
+            if os.path.exists(self.checkpoint_path):
+                os.remove(self.checkpoint_path)
+            seed = int(self.seed) if self.seed is not None else get_random_stream().derive_seed()
+            checkpoint = {
+                'version': self.CHECKPOINT_VERSION,
+                'fingerprint': self.get_fingerprint(),
+                'seed': seed,
+                'input_offset': 0,
+                'num_output_record': 0,
+                'shard_idx': 0,
+                'shards': [],
+                'completed': False
+            }
+        self._remove_uncommitted_shards(checkpoint['shard_idx'])
+
+        start_time = time.time()
+        start_offset = checkpoint['input_offset']
+        if not checkpoint['completed']:
+            self._process(checkpoint)
+        elapsed = time.time() - start_time
+        num_processed = checkpoint['input_offset'] - start_offset
+
+        return {
+            'num_record': checkpoint['input_offset'],
+            'num_output_record': checkpoint['num_output_record'],
+            'num_shard': len(checkpoint['shards']),
+            'elapsed': elapsed,
+            'throughput': num_processed / elapsed if elapsed > 0 else 0.
+        }
+
+    def _process(self, checkpoint):
+        # cli imports this module
+        from nlpaug.runner.cli import augment_records
+
+        offset = checkpoint['input_offset']
+        records = read_records(self.input_path, file_format=self.input_format, text_field=self.text_field,
+                               delimiter=self.delimiter)
+        records = itertools.islice(records, offset, None)
+
+        writer = ShardWriter(self.output_dir, file_format=self.output_format, shard_size=None,
+                             compression=self.compression, prefix=self.SHARD_PREFIX,
+                             start_shard=checkpoint['shard_idx'])
+
+        def commit():
+            # Shard is published before checkpoint. Crash in between leaves extra shard which is removed on resume.
+            shard_path = writer.flush_shard()
+            if shard_path is not None:
+                checkpoint['shards'].append(os.path.basename(shard_path))
+            checkpoint['input_offset'] = offset
+            checkpoint['num_output_record'] += writer.num_record
+            checkpoint['shard_idx'] = writer.shard_idx
+            writer.num_record = 0
+            self.save_checkpoint(checkpoint)
+
+        with writer:
+            shard_start_time = time.time()
+            for record, result in augment_records(self.aug, records, text_field=self.text_field, n=self.n,
+                                                  chunk_size=self.chunk_size, workers=self.workers,
+                                                  backend=self.backend, seed=checkpoint['seed'], offset=offset):
+                self.write_result(writer, record, result)
+                offset += 1
+
+                # Shard is completed at record boundary only so that input offset identifies it exactly
+                if (self.shard_size is not None and writer.num_record_in_shard >= self.shard_size) or \
+                        (self.checkpoint_interval is not None and
+                         time.time() - shard_start_time >= self.checkpoint_interval):
+                    commit()
+                    shard_start_time = time.time()
+
+            checkpoint['completed'] = True
+            commit()
@@ -0,0 +1,66 @@
+import importlib
+import json
+import os
+
+from nlpaug.util import Method
+
+FLOW_TYPES = {
+    'sequential': 'Sequential',
+    'sometimes': 'Sometimes'
+}
+
+
+def _get_class(type_name):
+    """
+    :param str type_name: '<module>.<class>' (e.g. 'char.RandomCharAug', 'word.SynonymAug', 'flow.Sequential')
+    """
+    if '.' not in type_name:
+        raise ValueError('Type must be in format of "<module>.<class>" (e.g. "char.RandomCharAug") while {} is '
+                         'passed'.format(type_name))
+    module_name, class_name = type_name.rsplit('.', 1)
+    if module_name == Method.FLOW:
+        package = 'nlpaug.flow'
+    elif module_name in [Method.CHAR, Method.WORD, Method.SENTENCE, Method.AUDIO, Method.SPECTROGRAM]:
+        package = 'nlpaug.augmenter.' + module_name
+    else:
+        raise ValueError('Unknown module [{}] of type [{}]'.format(module_name, type_name))
+
+    cls = getattr(importlib.import_module(package), class_name, None)
+    if cls is None:
+        raise ValueError('Unknown type [{}]'.format(type_name))
+    return cls
+
+
+def build_augmenter(spec):
+    """
+    Build augmenter or flow from declarative spec. Flow is described by list of augmenters (sequential by default)
+    or dict with "type" (e.g. "flow.Sometimes") and "flow" fields. Augmenter is described by dict with "type" field
+    while other fields are passed to constructor.
+
+    :param spec: dict, list, JSON string or path of JSON file
+    :return: Augmenter or flow
+
+    >>> aug = build_augmenter({'type': 'flow.Sequential', 'flow': [
+    ...     {'type': 'char.RandomCharAug', 'action': 'insert'},
+    ...     {'type': 'word.RandomWordAug', 'action': 'swap'}
+    ... ]})
+    """
+    if isinstance(spec, str):
+        if os.path.isfile(spec):
+            with open(spec, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+        else:
+            spec = json.loads(spec)
+
+    if isinstance(spec, list):
+        return _get_class('flow.Sequential')(flow=[build_augmenter(s) for s in spec])
+
+    if not isinstance(spec, dict) or 'type' not in spec:
+        raise ValueError('Spec must be list or dict with "type" field while {} is passed'.format(spec))
+
+    params = dict(spec)
+    type_name = params.pop('type')
+    type_name = 'flow.' + FLOW_TYPES[type_name] if type_name in FLOW_TYPES else type_name
+    if 'flow' in params:
+        params['flow'] = [build_augmenter(s) for s in params['flow']]
+    return _get_class(type_name)(**params)
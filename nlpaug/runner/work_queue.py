@@ -0,0 +1,458 @@
+"""
+    File based work queue for augmenting corpus on multiple hosts. Queue directory must be shared by coordinator and
+    workers (e.g. NFS). Coordinator splits corpus into tasks, any number of workers claim and augment tasks, and
+    outputs are merged and verified at the end.
+
+    >>> queue = WorkQueue.create('queue', 'input.jsonl', spec='flow.json', task_size=100000, seed=2019)
+    >>> run_worker('queue', workers=4)  # On every host
+    >>> queue.merge('output', compression='gzip')
+"""
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+import time
+import uuid
+
+from nlpaug.runner.io import Format, Compression, detect_format, read_records, open_file, ShardWriter
+from nlpaug.runner.job import write_result
+from nlpaug.runner.spec import build_augmenter
+from nlpaug.util.random_stream import get_random_stream
+
+
+class TaskStatus:
+    PENDING = 'pending'
+    LEASED = 'leased'
+    DONE = 'done'
+
+    @staticmethod
+    def getall():
+        return [TaskStatus.PENDING, TaskStatus.LEASED, TaskStatus.DONE]
+
+
+def _write_json(file_path, data):
+    # Write to temporary file and rename so that readers never see partial file
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _read_json(file_path):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _get_checksum(file_path):
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def get_worker_id():
+    return '{}-{}-{}'.format(socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+
+
+class WorkQueue:
+    """
+    Queue directory layout:
+        manifest.json: Flow spec, parameters and tasks. It is written once by coordinator.
+        input/<task>.jsonl: Input records of task
+        leases/<task>.json: Owner and expiry time of claimed task. Lease of dead worker expires and task is claimed
+            by other worker.
+        done/<task>.json: Completion marker with number of records and checksum of output
+        output/<task>.<format>: Committed output of task
+
+    Seed of each record is derived from base seed and its position in whole corpus. Task processed twice (e.g. by
+    worker whose lease expired while it was still running) produces identical output, so committing it again is
+    harmless. Merged output is same as single host nlpaug-run of same seed.
+
+    :param str queue_dir: Shared directory of queue
+    """
+    MANIFEST_FILE = 'manifest.json'
+    MANIFEST_VERSION = 1
+
+    def __init__(self, queue_dir):
+        self.queue_dir = queue_dir
+        self.manifest = _read_json(os.path.join(queue_dir, self.MANIFEST_FILE))
+        if self.manifest is None:
+            raise ValueError('{} is not a work queue. Create it by WorkQueue.create'.format(queue_dir))
+        if self.manifest.get('version') != self.MANIFEST_VERSION:
+            raise ValueError('Unsupported work queue version {} of {}'.format(self.manifest.get('version'),
+                                                                              queue_dir))
+
+    @classmethod
+    def create(cls, queue_dir, input_path, spec, task_size=100000, input_format=None, text_field='text',
+               output_format=None, output_field='augmented', delimiter=None, n=1, seed=None, lease_timeout=600):
+        """
+        Split corpus into tasks. It is run once by coordinator.
+
+        :param str queue_dir: Shared directory of queue. It must not contain other queue.
+        :param str input_path: Path of input file. '-' means standard input.
+        :param spec: Augmenter or flow spec (see nlpaug.runner.spec.build_augmenter). Spec is stored in queue so
+            that workers do not need access to spec file.
+        :param int task_size: Number of records per task
+        :param int n: Number of augmented output per record
+        :param int seed: Base seed. If None, it is drawn from current random stream.
+        :param float lease_timeout: Second of lease. Worker renews its lease while processing task. Task of worker
+            which does not renew its lease in time is claimed by other worker. Clocks of hosts should be in sync.
+        :return: WorkQueue
+        """
+        if task_size < 1:
+            raise ValueError('task_size must be positive while {} is passed'.format(task_size))
+        if os.path.exists(os.path.join(queue_dir, cls.MANIFEST_FILE)):
+            raise ValueError('Work queue already exists in {}'.format(queue_dir))
+
+        if isinstance(spec, str) and os.path.isfile(spec):
+            with open(spec, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+        elif isinstance(spec, str):
+            spec = json.loads(spec)
+        # Fail fast on invalid spec instead of on every worker
+        build_augmenter(spec)
+
+        input_format = input_format or detect_format(input_path)
+        for sub_dir in ['input', 'leases', 'done', 'output', 'tmp']:
+            os.makedirs(os.path.join(queue_dir, sub_dir), exist_ok=True)
+
+        tasks = []
+        f = None
+        for offset, record in enumerate(read_records(input_path, file_format=input_format, text_field=text_field,
+                                                     delimiter=delimiter)):
+            if offset % task_size == 0:
+                if f is not None:
+                    f.close()
+                task = {'id': 'task-{:05d}'.format(len(tasks)), 'offset': offset, 'num_record': 0}
+                tasks.append(task)
+                f = open_file(os.path.join(queue_dir, 'input', task['id'] + '.jsonl'), 'w',
+                              compression=Compression.NONE)
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            tasks[-1]['num_record'] += 1
+        if f is not None:
+            f.close()
+
+        manifest = {
+            'version': cls.MANIFEST_VERSION,
+            'spec': spec,
+            'text_field': text_field,
+            'output_format': output_format or (Format.TXT if input_format == Format.TXT else Format.JSONL),
+            'output_field': output_field,
+            'n': n,
+            'seed': int(seed) if seed is not None else get_random_stream().derive_seed(),
+            'lease_timeout': lease_timeout,
+            'tasks': tasks
+        }
+        # Manifest is written last. Queue is not visible to workers until all inputs are written.
+        _write_json(os.path.join(queue_dir, cls.MANIFEST_FILE), manifest)
+        return cls(queue_dir)
+
+    @property
+    def tasks(self):
+        return self.manifest['tasks']
+
+    def _get_path(self, sub_dir, task_id, extension='json'):
+        return os.path.join(self.queue_dir, sub_dir, '{}.{}'.format(task_id, extension))
+
+    def get_input_path(self, task_id):
+        return self._get_path('input', task_id, 'jsonl')
+
+    def get_output_path(self, task_id):
+        return self._get_path('output', task_id, self.manifest['output_format'])
+
+    def get_task_status(self, task_id):
+        if os.path.exists(self._get_path('done', task_id)):
+            return TaskStatus.DONE
+        lease = self._read_lease(task_id)
+        if lease is not None and lease['expires_at'] > time.time():
+            return TaskStatus.LEASED
+        return TaskStatus.PENDING
+
+    def get_status(self):
+        """
+        :return: dict of task status to number of tasks
+        """
+        status = {s: 0 for s in TaskStatus.getall()}
+        for task in self.tasks:
+            status[self.get_task_status(task['id'])] += 1
+        return status
+
+    def is_done(self):
+        return all(self.get_task_status(task['id']) == TaskStatus.DONE for task in self.tasks)
+
+    def _read_lease(self, task_id, lease_path=None):
+        lease_path = lease_path or self._get_path('leases', task_id)
+        try:
+            return _read_json(lease_path)
+        except ValueError:
+            # Lease is just created by other worker and its content is not written yet (or the worker died then)
+            try:
+                return {'worker': None, 'expires_at': os.path.getmtime(lease_path) + self.manifest['lease_timeout']}
+            except FileNotFoundError:
+                return None
+
+    def _new_lease(self, worker_id):
+        return {'worker': worker_id, 'expires_at': time.time() + self.manifest['lease_timeout']}
+
+    def claim(self, worker_id):
+        """
+        :param str worker_id: Unique ID of worker
+        :return: Claimed task. None if no task is available (i.e. every task is done or leased by live worker).
+        """
+        for task in self.tasks:
+            if os.path.exists(self._get_path('done', task['id'])):
+                continue
+            if self._acquire_lease(task['id'], worker_id):
+                return task
+        return None
+
+    def _acquire_lease(self, task_id, worker_id, retry=True):
+        lease_path = self._get_path('leases', task_id)
+        try:
+            # Exclusive creation is atomic. Only one worker claims unleased task.
+            fd = os.open(lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            lease = self._read_lease(task_id)
+            if not retry or (lease is not None and lease['expires_at'] > time.time()):
+                return False
+
+            # Lease is expired. Only one worker succeeds to move it away and retries exclusive creation.
+            expired_path = '{}.{}.expired'.format(lease_path, worker_id)
+            try:
+                os.rename(lease_path, expired_path)
+            except FileNotFoundError:
+                return False
+            expired_lease = self._read_lease(task_id, expired_path)
+            if expired_lease is not None and expired_lease['expires_at'] > time.time():
+                # Owner renewed it in the meantime. Give it back.
+                try:
+                    os.link(expired_path, lease_path)
+                except OSError:
+                    pass
+                os.remove(expired_path)
+                return False
+            os.remove(expired_path)
+            return self._acquire_lease(task_id, worker_id, retry=False)
+
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self._new_lease(worker_id), f)
+        return True
+
+    def renew(self, task_id, worker_id):
+        """
+        :return: False if lease is lost (i.e. it expired and was claimed by other worker)
+        """
+        # Same compare-and-swap of takeover. Lease is moved away (only one worker succeeds), checked and rewritten
+        # privately, then linked back. Linking fails if other worker created a lease in the meantime.
+        lease_path = self._get_path('leases', task_id)
+        renew_path = '{}.{}.renew'.format(lease_path, worker_id)
+        try:
+            os.rename(lease_path, renew_path)
+        except FileNotFoundError:
+            return False
+        try:
+            lease = self._read_lease(task_id, renew_path)
+            is_owner = lease is not None and lease['worker'] == worker_id
+            if is_owner:
+                _write_json(renew_path, self._new_lease(worker_id))
+            try:
+                # Give lease back to its owner if it is not ours
+                os.link(renew_path, lease_path)
+            except FileExistsError:
+                return False
+            return is_owner
+        finally:
+            os.remove(renew_path)
+
+    def release(self, task_id, worker_id):
+        lease_path = self._get_path('leases', task_id)
+        lease = self._read_lease(task_id)
+        if lease is not None and lease['worker'] == worker_id:
+            try:
+                os.remove(lease_path)
+            except FileNotFoundError:
+                pass
+
+    def complete(self, task_id, worker_id, temp_output_path, num_output_record):
+        """
+        Commit output of task atomically. Output is moved into output directory before completion marker is
+        written, so marked task always has its output.
+
+        :param str temp_output_path: Output file in same file system of queue directory
+        :param int num_output_record: Number of records in output
+        :return: False if task was already completed by other worker. Output is discarded.
+        """
+        done_path = self._get_path('done', task_id)
+        if os.path.exists(done_path):
+            os.remove(temp_output_path)
+            self.release(task_id, worker_id)
+            return False
+
+        checksum = _get_checksum(temp_output_path)
+        os.replace(temp_output_path, self.get_output_path(task_id))
+        task = next(task for task in self.tasks if task['id'] == task_id)
+        _write_json(done_path, {
+            'worker': worker_id,
+            'num_record': task['num_record'],
+            'num_output_record': num_output_record,
+            'sha256': checksum
+        })
+        self.release(task_id, worker_id)
+        return True
+
+    def verify(self):
+        """
+        Verify that every task is completed and its output is intact.
+
+        :return: List of error message. Empty list means queue is verified.
+        """
+        errors = []
+        for task in self.tasks:
+            marker = _read_json(self._get_path('done', task['id']))
+            output_path = self.get_output_path(task['id'])
+            if marker is None:
+                errors.append('{} is not completed'.format(task['id']))
+            elif not os.path.exists(output_path):
+                errors.append('Output of {} does not exist'.format(task['id']))
+            elif marker['num_record'] != task['num_record']:
+                errors.append('{} processed {} records while it has {} records'.format(
+                    task['id'], marker['num_record'], task['num_record']))
+            elif _get_checksum(output_path) != marker['sha256']:
+                errors.append('Checksum of {} output does not match'.format(task['id']))
+        return errors
+
+    def merge(self, output_dir, shard_size=100000, compression=Compression.NONE):
+        """
+        Verify and merge outputs of tasks into shards in corpus order.
+
+        :param str output_dir: Directory of merged shards
+        :param int shard_size: Maximum number of records per shard
+        :param str compression: Either 'none', 'gzip' or 'bz2'
+        :return: dict of statistics
+        """
+        errors = self.verify()
+        if errors:
+            raise ValueError('Work queue {} is not verified: {}'.format(self.queue_dir, '; '.join(errors)))
+
+        text_field = self.manifest['text_field']
+        num_record = 0
+        with ShardWriter(output_dir, file_format=self.manifest['output_format'], shard_size=shard_size,
+                         compression=compression) as writer:
+            for task in self.tasks:
+                marker = _read_json(self._get_path('done', task['id']))
+                num_output_record = writer.num_record
+                for record in read_records(self.get_output_path(task['id']),
+                                           file_format=self.manifest['output_format'], text_field=text_field):
+                    writer.write(record, text_field=text_field)
+                if writer.num_record - num_output_record != marker['num_output_record']:
+                    raise ValueError('Output of {} has {} records while {} records are committed'.format(
+                        task['id'], writer.num_record - num_output_record, marker['num_output_record']))
+                num_record += task['num_record']
+
+        return {
+            'num_record': num_record,
+            'num_output_record': writer.num_record,
+            'num_shard': len(writer.shard_paths)
+        }
+
+
+class _LeaseLost(Exception):
+    pass
+
+
+def process_task(queue, task, worker_id, aug, chunk_size=256, workers=1, backend=None):
+    """
+    Augment one task and commit its output. Lease is renewed while processing.
+
+    :return: True if output is committed. False if lease is lost or task was completed by other worker.
+    """
+    # cli imports this module
+    from nlpaug.runner.cli import augment_records
+
+    manifest = queue.manifest
+    text_field = manifest['text_field']
+    renew_interval = manifest['lease_timeout'] / 3
+    temp_dir = tempfile.mkdtemp(dir=os.path.join(queue.queue_dir, 'tmp'), prefix=worker_id + '-')
+    try:
+        records = read_records(queue.get_input_path(task['id']), file_format=Format.JSONL, text_field=text_field)
+        last_renew_time = time.time()
+        with ShardWriter(temp_dir, file_format=manifest['output_format'], shard_size=None,
+                         prefix=task['id']) as writer:
+            for record, result in augment_records(aug, records, text_field=text_field, n=manifest['n'],
+                                                  chunk_size=chunk_size, workers=workers, backend=backend,
+                                                  seed=manifest['seed'], offset=task['offset']):
+                write_result(writer, record, result, text_field=text_field, output_field=manifest['output_field'])
+
+                if time.time() - last_renew_time >= renew_interval:
+                    if not queue.renew(task['id'], worker_id):
+                        raise _LeaseLost()
+                    last_renew_time = time.time()
+
+            shard_path = writer.flush_shard()
+
+        if shard_path is None:
+            # Empty output. Commit empty file so that merge can verify it.
+            shard_path = os.path.join(temp_dir, 'empty')
+            open(shard_path, 'w').close()
+        return queue.complete(task['id'], worker_id, shard_path, writer.num_record)
+    except _LeaseLost:
+        return False
+    finally:
+        for file_name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, file_name))
+        os.rmdir(temp_dir)
+
+
+def run_worker(queue_dir, worker_id=None, chunk_size=256, workers=1, backend=None, poll_interval=5,
+               max_task=None):
+    """
+    Claim and process tasks until every task of queue is done. Worker waits for tasks leased by other workers so
+    that it takes over tasks of dead workers once their leases expire.
+
+    :param str queue_dir: Shared directory of queue
+    :param str worker_id: Unique ID of worker. Default value is None which means '<host>-<pid>-<random>'.
+    :param int chunk_size: Number of records per local worker task
+    :param int workers: Number of local worker
+    :param str backend: Execution backend of local workers. Either 'thread' or 'process'.
+    :param float poll_interval: Second to wait when every remaining task is leased by other workers
+    :param int max_task: Maximum number of tasks processed by this worker. Default value is None which means no
+        limit.
+    :return: dict of statistics
+    """
+    queue = WorkQueue(queue_dir)
+    worker_id = worker_id or get_worker_id()
+    aug = build_augmenter(queue.manifest['spec'])
+
+    start_time = time.time()
+    num_task = 0
+    num_record = 0
+    while max_task is None or num_task < max_task:
+        task = queue.claim(worker_id)
+        if task is None:
+            if queue.is_done():
+                break
+            time.sleep(poll_interval)
+            continue
+        if process_task(queue, task, worker_id, aug, chunk_size=chunk_size, workers=workers, backend=backend):
+            num_task += 1
+            num_record += task['num_record']
+    elapsed = time.time() - start_time
+
+    return {
+        'worker': worker_id,
+        'num_task': num_task,
+        'num_record': num_record,
+        'elapsed': elapsed,
+        'throughput': num_record / elapsed if elapsed > 0 else 0.
+    }
@@ -1,11 +1,20 @@
-from nlpaug.util.action import *
-from nlpaug.util.operation import *
-from nlpaug.util.method import *
-from nlpaug.util.exception import *
-from nlpaug.util.math import *
-from nlpaug.util.text import *
+from __future__ import absolute_import
+from nlpaug.util.lazy import lazy_attach
 
-from nlpaug.util.part_of_speech import *
-
-from nlpaug.util.file import *
-from nlpaug.util.decorator import *
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'action': ['Action'],
+    'operation': ['Operation'],
+    'method': ['Method'],
+    'exception': ['ExceptionInfo', 'ExceptionType', 'WarningException', 'WarningName', 'WarningCode', 'WarningMessage'],
+    'math': ['standard_norm', 'l1_norm', 'l2_norm'],
+    'text': ['ADDING_SPACE_AROUND_PUNCTUATION_REGEX', 'SPLIT_WORD_REGEX', 'add_space_around_punctuation',
+        'split_sentence'],
+    'parallel': ['Backend', 'set_backend', 'get_backend', 'get_thread_pool', 'get_process_pool',
+        'shutdown_process_pool', 'parallel_action', 'parallel_augment', 'parallel_augment_batch', 'stream_augment',
+        'pipelined_augment'],
+    'random_stream': ['derive_seed', 'RandomStream', 'GLOBAL_RANDOM_STREAM', 'get_random_stream', 'use_random_stream',
+        'resolve_seed', 'generate_seeds', 'call_with_seed', 'hash_seeds', 'hash_uniforms'],
+    'part_of_speech': ['PartOfSpeech'],
+    'file': ['DownloadUtil', 'LoadUtil'],
+    'decorator': ['deprecated'],
+})
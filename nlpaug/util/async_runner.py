@@ -0,0 +1,192 @@
+import asyncio
+import atexit
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _LoopState:
+    """
+    Asyncio objects of one event loop. Semaphore and futures cannot be shared across event loops.
+    """
+
+    def __init__(self, loop, max_concurrency):
+        self.loop = loop
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # (id of augmenter, n, whether request is seeded) -> (augmenter, list of (data, seed, future), timer handle)
+        self.pending = {}
+
+
+class AsyncRunner:
+    """
+    Run augmentation in thread pool so that event loop is not blocked. Concurrent requests of augmenter which
+    implements batch processing (i.e. overrides augment_batch, e.g. WordEmbsAug and flows) are coalesced into one
+    augment_batch call. Seeded and unseeded requests are never coalesced together, and seeded requests of flow are
+    not coalesced at all as flow's augment_batch draws random numbers in different order from augment. So that
+    seeded request always returns same result as augment. Requests of other augmenters (e.g. ContextualWordEmbsAug
+    and SynonymAug) are run one by one in thread pool.
+
+    :param int max_concurrency: Maximum number of in-flight requests per event loop. Other requests wait.
+    :param int max_batch_size: Maximum number of requests are coalesced into one batch
+    :param float max_wait: Maximum waiting time (in second) for collecting requests of a batch
+    :param int num_thread: Number of thread for running augmentation
+
+    >>> from nlpaug.util.async_runner import AsyncRunner, set_async_runner
+    >>> set_async_runner(AsyncRunner(max_concurrency=64, max_batch_size=32))
+    >>> augmented_text = await aug.aaugment(text, timeout=1)
+    """
+
+    def __init__(self, max_concurrency=32, max_batch_size=16, max_wait=0.005, num_thread=4):
+        if max_concurrency < 1 or max_batch_size < 1 or num_thread < 1:
+            raise ValueError('max_concurrency, max_batch_size and num_thread must be positive')
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.num_thread = num_thread
+
+        self._executor = None
+        self._states = {}
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.num_thread, thread_name_prefix='nlpaug')
+            return self._executor
+
+    def _get_state(self):
+        loop = asyncio.get_running_loop()
+        state = self._states.get(id(loop))
+        if state is None or state.loop is not loop:
+            state = _LoopState(loop, self.max_concurrency)
+            with self._lock:
+                # Drop state of closed event loops (e.g. finished asyncio.run)
+                self._states = {key: s for key, s in self._states.items() if not s.loop.is_closed()}
+                self._states[id(loop)] = state
+        return state
+
+    @classmethod
+    def is_batchable(cls, augmenter, seed=None):
+        # Default augment_batch augments inputs one by one. Coalescing brings no benefit but latency.
+        from nlpaug.base_augmenter import Augmenter
+        from nlpaug.flow import Pipeline
+        if seed is not None and isinstance(augmenter, Pipeline):
+            # Result of seeded request must be same as augment (see Pipeline.augment_batch)
+            return False
+        return type(augmenter).augment_batch is not Augmenter.augment_batch
+
+    async def run(self, augmenter, data, n=1, seed=None, timeout=None):
+        """
+        :param obj augmenter: Augmenter or flow
+        :param object data: Data for augmentation
+        :param int n: Number of unique augmented output
+        :param seed: Seed of this request. See Augmenter.augment
+        :param float timeout: Maximum time (in second) of this request including waiting time. asyncio.TimeoutError
+            is raised if it is exceeded. Augmentation which is already running in thread is not interrupted.
+        :return: Augmented data
+        """
+        return await asyncio.wait_for(self._run(augmenter, data, n, seed), timeout)
+
+    async def run_batch(self, augmenter, data, n=1, seed=None, timeout=None):
+        """
+        :param list data: List of data for augmentation. It is processed by one augment_batch call.
+        :return: List of augmented data
+        """
+        return await asyncio.wait_for(self._run_batch(augmenter, data, n, seed), timeout)
+
+    async def _run(self, augmenter, data, n, seed):
+        state = self._get_state()
+        async with state.semaphore:
+            if self.max_batch_size == 1 or not self.is_batchable(augmenter, seed):
+                return await state.loop.run_in_executor(
+                    self.executor, functools.partial(augmenter.augment, data, n=n, seed=seed))
+
+            future = state.loop.create_future()
+            key = (id(augmenter), n, seed is None)
+            if key not in state.pending:
+                handle = state.loop.call_later(self.max_wait, self._flush, state, key)
+                state.pending[key] = (augmenter, [], handle)
+            requests = state.pending[key][1]
+            requests.append((data, seed, future))
+            if len(requests) >= self.max_batch_size:
+                self._flush(state, key)
+            return await future
+
+    async def _run_batch(self, augmenter, data, n, seed):
+        state = self._get_state()
+        async with state.semaphore:
+            return await state.loop.run_in_executor(
+                self.executor, functools.partial(augmenter.augment_batch, data, n=n, seed=seed))
+
+    def _flush(self, state, key):
+        entry = state.pending.pop(key, None)
+        if entry is None:
+            return
+        augmenter, requests, handle = entry
+        handle.cancel()
+
+        # Skip cancelled (e.g. timeout) requests
+        requests = [request for request in requests if not request[2].done()]
+        if len(requests) == 0:
+            return
+
+        data = [request[0] for request in requests]
+        seeds = [request[1] for request in requests]
+        n = key[1]
+        batch_future = state.loop.run_in_executor(
+            self.executor, functools.partial(augmenter.augment_batch, data, n=n, seed=seeds))
+
+        def distribute(f):
+            exception = None if f.cancelled() else f.exception()
+            for i, (_, _, future) in enumerate(requests):
+                if future.done():
+                    continue
+                if f.cancelled():
+                    future.cancel()
+                elif exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(f.result()[i])
+
+        batch_future.add_done_callback(distribute)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self._states = {}
+
+
+_DEFAULT_ASYNC_RUNNER = None
+_DEFAULT_ASYNC_RUNNER_LOCK = threading.Lock()
+
+
+def set_async_runner(runner):
+    """
+    :param AsyncRunner runner: Default runner of aaugment and aaugment_batch
+    """
+    global _DEFAULT_ASYNC_RUNNER
+    with _DEFAULT_ASYNC_RUNNER_LOCK:
+        if _DEFAULT_ASYNC_RUNNER is not None and _DEFAULT_ASYNC_RUNNER is not runner:
+            _DEFAULT_ASYNC_RUNNER.shutdown()
+        _DEFAULT_ASYNC_RUNNER = runner
+
+
+def get_async_runner(runner=None):
+    global _DEFAULT_ASYNC_RUNNER
+    if runner is not None:
+        return runner
+    with _DEFAULT_ASYNC_RUNNER_LOCK:
+        if _DEFAULT_ASYNC_RUNNER is None:
+            _DEFAULT_ASYNC_RUNNER = AsyncRunner()
+        return _DEFAULT_ASYNC_RUNNER
+
+
+def _shutdown_async_runner():
+    if _DEFAULT_ASYNC_RUNNER is not None:
+        _DEFAULT_ASYNC_RUNNER.shutdown()
+
+
+atexit.register(_shutdown_async_runner)
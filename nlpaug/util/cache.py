@@ -0,0 +1,143 @@
+import collections
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+
+class ResultCache:
+    """
+    Cache of augmented result. Result is keyed by augmenter configuration, input, number of output and seed. Recent
+    results are kept in memory (least recently used one is evicted when it is full). If cache_dir is provided,
+    results are persisted as well so that they are reused by other process or next run.
+
+    :param int max_size: Maximum number of results kept in memory
+    :param str cache_dir: Directory of persistent cache. Default value is None which means no persistent cache.
+
+    >>> import nlpaug.augmenter.char as nac
+    >>> from nlpaug.util.cache import ResultCache
+    >>> aug = nac.RandomCharAug()
+    >>> aug.set_cache(ResultCache(max_size=10000))
+    >>> aug.augment('The quick brown fox jumps over the lazy dog', seed=2019)
+    """
+
+    def __init__(self, max_size=1024, cache_dir=None):
+        if max_size is not None and max_size < 1:
+            raise ValueError('max_size must be positive while {} is passed'.format(max_size))
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self.data = collections.OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _copy(cls, value):
+        # Caller may modify result in place (e.g. numpy array). Return copy of cached object.
+        if isinstance(value, str):
+            return value
+        return copy.deepcopy(value)
+
+    def _get_file_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(repr(key).encode('utf-8')).hexdigest() + '.pkl')
+
+    def get(self, key):
+        """
+        :param tuple key: Hashable key
+        :return: Tuple of (found, value)
+        """
+        with self._lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return True, self._copy(self.data[key])
+
+        if self.cache_dir is not None:
+            try:
+                with open(self._get_file_path(key), 'rb') as f:
+                    stored_key, value = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                stored_key = None
+            # Make sure that it is not a hash collision
+            if stored_key == key:
+                self._put_memory(key, value)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return True, self._copy(value)
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        value = self._copy(value)
+        self._put_memory(key, value)
+
+        if self.cache_dir is not None:
+            # Write to temporary file then rename it so that reader never sees partial file
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._get_file_path(key))
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def _put_memory(self, key, value):
+        with self._lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while self.max_size is not None and len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+    def get_stats(self):
+        """
+        :return: Number of hits (including hits of persistent cache), misses and evictions and hit rate.
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self.data),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total > 0 else 0.
+        }
+
+    def clear(self, persistent=False):
+        """
+        :param bool persistent: If True, persistent cache is removed as well
+        """
+        with self._lock:
+            self.data = collections.OrderedDict()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+        if persistent and self.cache_dir is not None:
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, file_name))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
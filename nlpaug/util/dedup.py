@@ -0,0 +1,55 @@
+import hashlib
+import numpy as np
+
+from nlpaug.util.text.token_sequence import TokenSequence
+
+
+def text_dedup_key(data):
+    if isinstance(data, TokenSequence):
+        # Tokens map to text one to one. Keep it apart from key of token list input.
+        return TokenSequence, tuple(data)
+    if isinstance(data, list):
+        return tuple(data)
+    try:
+        hash(data)
+    except TypeError:
+        return None
+    return data
+
+
+def array_dedup_key(data):
+    # Hash the raw buffer so that comparing with all previous outputs is a set lookup instead of np.array_equal scan.
+    data = np.ascontiguousarray(data)
+    return data.shape, data.dtype.str, hashlib.sha1(data.view(np.uint8)).digest()
+
+
+class DedupIndex:
+    """
+    Index of seen data for duplicate detection. Data is indexed by a hashable key (see Augmenter.get_dedup_key) so
+    that each lookup is O(1). Fall back to is_duplicate_fx (linear scan) if key function is not available.
+
+    :param func key_fx: Function which returns hashable key of data. Returning None means data cannot be hashed.
+    :param func is_duplicate_fx: Function which accepts list of seen data and new data. Used when key is None.
+    """
+
+    def __init__(self, key_fx=None, is_duplicate_fx=None):
+        self.key_fx = key_fx
+        self.is_duplicate_fx = is_duplicate_fx
+        self.keys = set()
+        self.unhashable_data = []
+
+    def add(self, data):
+        """
+        :return: True if data is not seen before.
+        """
+        key = self.key_fx(data) if self.key_fx is not None else None
+        if key is not None:
+            if key in self.keys:
+                return False
+            self.keys.add(key)
+            return True
+
+        if self.is_duplicate_fx is not None and self.is_duplicate_fx(self.unhashable_data, data):
+            return False
+        self.unhashable_data.append(data)
+        return True
@@ -1,2 +1,7 @@
-from nlpaug.util.file.download import *
-from nlpaug.util.file.load import *
+from __future__ import absolute_import
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'download': ['DownloadUtil'],
+    'load': ['LoadUtil'],
+})
@@ -1,4 +1,4 @@
-import os, urllib, zipfile, tarfile, requests
+import os, urllib, zipfile, tarfile
 
 
 class DownloadUtil:
@@ -132,6 +132,9 @@ class DownloadUtil:
                     if chunk:  # filter out keep-alive new chunks
                         f.write(chunk)
 
+        # Import on demand. It is slow to import and only required for downloading
+        import requests
+
         session = requests.Session()
 
         response = session.get(url, params={'id': _id}, stream=True)
@@ -0,0 +1,210 @@
+import threading
+import time
+
+
+class Stage:
+    AUGMENT = 'augment'
+    ACTION = 'action'
+    TOKENIZE = 'tokenize'
+    REVERSE_TOKENIZE = 'reverse_tokenize'
+    SAMPLE_AUG_IDXES = 'sample_aug_idxes'
+    MODEL = 'model'
+    DEDUP = 'dedup'
+
+
+class Counter:
+    CALLS = 'calls'
+    CANDIDATES = 'candidates'
+    DUPLICATES = 'duplicates'
+    OOV_SKIPS = 'oov_skips'
+    MODEL_CALLS = 'model_calls'
+    CACHE_HITS = 'cache_hits'
+    CACHE_MISSES = 'cache_misses'
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ('instrumentation', 'name', 'stage', 'start')
+
+    def __init__(self, instrumentation, name, stage):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.stage = stage
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.instrumentation.record(self.name, self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class Instrumentation:
+    """
+    Base class of instrumentation. It receives per stage timing and counters from augmenters. This implementation
+    does nothing and is used by default. Override record and incr to forward metrics to other system.
+
+    >>> from nlpaug.util.instrumentation import Instrumentation
+    >>> class PrintInstrumentation(Instrumentation):
+    ...     enabled = True
+    ...     def record(self, name, stage, elapsed):
+    ...         print(name, stage, elapsed)
+    """
+    enabled = False
+
+    def timer(self, name, stage):
+        """
+        :param str name: Name of augmenter
+        :param str stage: Name of stage (see nlpaug.util.instrumentation.Stage)
+        :return: Context manager which records elapsed time of the block
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, stage)
+
+    def record(self, name, stage, elapsed):
+        pass
+
+    def incr(self, name, counter, value=1):
+        pass
+
+    def get_stats(self):
+        return {}
+
+    def reset(self):
+        pass
+
+
+NULL_INSTRUMENTATION = Instrumentation()
+
+
+class MemoryInstrumentation(Instrumentation):
+    """
+    Aggregate timing and counters in memory. Statistics are grouped by augmenter name. Give augmenters of same flow
+    different names to compare them.
+
+    >>> import nlpaug.augmenter.char as nac
+    >>> from nlpaug.util.instrumentation import MemoryInstrumentation
+    >>> instrumentation = MemoryInstrumentation()
+    >>> aug = nac.RandomCharAug()
+    >>> aug.set_instrumentation(instrumentation)
+    >>> aug.augment('The quick brown fox jumps over the lazy dog')
+    >>> instrumentation.get_stats()
+    """
+    enabled = True
+
+    def __init__(self):
+        self.timings = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, stage, elapsed):
+        key = (name, stage)
+        with self._lock:
+            timing = self.timings.get(key)
+            if timing is None:
+                self.timings[key] = [1, elapsed, elapsed]
+            else:
+                timing[0] += 1
+                timing[1] += elapsed
+                if elapsed > timing[2]:
+                    timing[2] = elapsed
+
+    def incr(self, name, counter, value=1):
+        key = (name, counter)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def get_stats(self):
+        """
+        :return: dict of augmenter name to stage timings (count, total, mean and max in second) and counters.
+        """
+        stats = {}
+        with self._lock:
+            for (name, stage), (count, total, max_elapsed) in self.timings.items():
+                stats.setdefault(name, {'timings': {}, 'counters': {}})['timings'][stage] = {
+                    'count': count, 'total': total, 'mean': total / count, 'max': max_elapsed}
+            for (name, counter), value in self.counters.items():
+                stats.setdefault(name, {'timings': {}, 'counters': {}})['counters'][counter] = value
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self.timings = {}
+            self.counters = {}
+
+    def __getstate__(self):
+        # Process workers get their own copy. Statistics from other process are not merged back.
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class InstrumentedFunction:
+    """
+    Wrap augmenter's function (e.g. tokenizer) to record its elapsed time. Counter (if any) is increased on every
+    call.
+    """
+
+    def __init__(self, fx, instrumentation, name, stage, counter=None):
+        self.fx = fx
+        self.instrumentation = instrumentation
+        self.name = name
+        self.stage = stage
+        self.counter = counter
+
+    def __call__(self, *args, **kwargs):
+        if self.counter is not None:
+            self.instrumentation.incr(self.name, self.counter)
+        start = time.perf_counter()
+        try:
+            return self.fx(*args, **kwargs)
+        finally:
+            self.instrumentation.record(self.name, self.stage, time.perf_counter() - start)
+
+
+class InstrumentedModel:
+    """
+    Proxy of augmenter's model. Inference functions are timed and counted while other attributes are forwarded to
+    the original model. Model may be shared by other augmenters so it is not modified.
+    """
+    INFERENCE_FUNCTIONS = ['predict', 'predict_batch', 'manipulate', 'mask']
+
+    def __init__(self, model, instrumentation, name):
+        self.__dict__['_model'] = model
+        self.__dict__['_instrumentation'] = instrumentation
+        self.__dict__['_name'] = name
+
+    @property
+    def original_model(self):
+        return self.__dict__['_model']
+
+    def __getattr__(self, item):
+        if item.startswith('__') or item in ['_model', '_instrumentation', '_name']:
+            raise AttributeError(item)
+
+        attr = getattr(self._model, item)
+        if item in self.INFERENCE_FUNCTIONS and callable(attr):
+            # Counted when it is called rather than when it is looked up
+            return InstrumentedFunction(attr, self._instrumentation, self._name, Stage.MODEL,
+                                        counter=Counter.MODEL_CALLS)
+        return attr
+
+    def __setattr__(self, key, value):
+        setattr(self._model, key, value)
@@ -0,0 +1,33 @@
+import importlib
+
+
+def lazy_attach(package_name, submodule_attrs):
+    """
+    Load attributes of package lazily (PEP 562). Submodule is imported when one of its attributes is accessed at the
+    first time. So that heavy dependencies (e.g. torch, nltk, librosa) are imported only when augmenter or model
+    which needs them is used.
+
+    :param str package_name: __name__ of package
+    :param dict submodule_attrs: Mapping of submodule name to list of attribute names exported by it
+    :return: __getattr__, __dir__ and __all__ of package
+
+    >>> __getattr__, __dir__, __all__ = lazy_attach(__name__, {'ocr': ['OcrAug']})
+    """
+    attr_to_submodule = {attr: submodule for submodule, attrs in submodule_attrs.items() for attr in attrs}
+    __all__ = sorted(attr_to_submodule)
+
+    def __getattr__(name):
+        if name in attr_to_submodule:
+            module = importlib.import_module('{}.{}'.format(package_name, attr_to_submodule[name]))
+            value = getattr(module, name)
+            # Cache in package so that __getattr__ is not called again
+            setattr(importlib.import_module(package_name), name, value)
+            return value
+        if name in submodule_attrs:
+            return importlib.import_module('{}.{}'.format(package_name, name))
+        raise AttributeError('module {!r} has no attribute {!r}'.format(package_name, name))
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package_name))) | set(__all__) | set(submodule_attrs))
+
+    return __getattr__, __dir__, __all__
@@ -12,6 +12,7 @@ def l1_norm(data):
     return np.nan_to_num(data)
 
 def l2_norm(data):
-    _norm = np.array([np.sqrt((x*x).sum(axis=0)) for x in data])
+    # Same as summing row by row but without python loop
+    _norm = np.sqrt((data*data).sum(axis=1))
     data = data/_norm[:, np.newaxis]
     return np.nan_to_num(data)
@@ -0,0 +1,103 @@
+import collections
+import math
+import threading
+
+
+class OversamplingScheduler:
+    """
+    Estimate how many candidates should be generated to get expected number of unique outputs. Duplicate rate is
+    tracked per input length (bucketed by power of 2) so that short input (which easily produces duplicates) asks for
+    more candidates while long input asks for exactly the shortfall.
+
+    :param int max_factor: Maximum oversampling factor of the shortfall
+    :param int prior_attempts: Number of virtual (non-duplicated) attempts for smoothing duplicate rate of unseen
+        length
+
+    >>> scheduler = OversamplingScheduler()
+    >>> num_candidate = scheduler.plan(size=len(data), shortfall=3)
+    """
+    MAX_PENDING_UPDATES = 1024
+
+    def __init__(self, max_factor=4, prior_attempts=1):
+        self.max_factor = max_factor
+        self.prior_attempts = prior_attempts
+        self.stats = {}
+        self.total_calls = 0
+        self.wasted_calls = 0
+        self._lock = threading.Lock()
+        # Updates are queued (deque.append is thread safe without lock) and folded into stats when they are read
+        self._pending = collections.deque()
+
+    @classmethod
+    def bucket(cls, size):
+        return int(size).bit_length()
+
+    def duplicate_rate(self, size):
+        self._fold()
+        attempts, duplicates = self.stats.get(self.bucket(size), (0, 0))
+        return duplicates / (attempts + self.prior_attempts)
+
+    def plan(self, size, shortfall, budget=None):
+        """
+        :param int size: Length of input
+        :param int shortfall: Number of unique outputs still required
+        :param int budget: Maximum number of candidates can be generated
+        :return: Number of candidates should be generated
+        """
+        rate = self.duplicate_rate(size)
+        factor = self.max_factor if rate >= 1 else min(self.max_factor, 1. / (1. - rate))
+        num_candidate = max(shortfall, int(math.ceil(shortfall * factor)))
+        if budget is not None:
+            num_candidate = min(num_candidate, budget)
+        return num_candidate
+
+    def update(self, size, calls, duplicates):
+        # Called once per augment call. Locking is deferred to _fold.
+        self._pending.append((size, calls, duplicates))
+        if len(self._pending) > self.MAX_PENDING_UPDATES:
+            self._fold()
+
+    def _fold(self):
+        if not self._pending:
+            return
+        with self._lock:
+            while self._pending:
+                try:
+                    size, calls, duplicates = self._pending.popleft()
+                except IndexError:
+                    break
+                key = self.bucket(size)
+                attempts, _duplicates = self.stats.get(key, (0, 0))
+                self.stats[key] = (attempts + calls, _duplicates + duplicates)
+                self.total_calls += calls
+                self.wasted_calls += duplicates
+
+    def get_stats(self):
+        """
+        :return: Total number of candidates generated, number of candidates wasted on duplicate and duplicate rate
+            per input length bucket. Bucket is keyed by exclusive upper bound of input length.
+        """
+        self._fold()
+        return {
+            'total_calls': self.total_calls,
+            'wasted_calls': self.wasted_calls,
+            'duplicate_rates': {2 ** key: duplicates / attempts for key, (attempts, duplicates) in self.stats.items()
+                                if attempts > 0}
+        }
+
+    def reset(self):
+        with self._lock:
+            self._pending.clear()
+            self.stats = {}
+            self.total_calls = 0
+            self.wasted_calls = 0
+
+    def __getstate__(self):
+        self._fold()
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,360 @@
+import atexit
+import collections
+import itertools
+import math
+import multiprocessing
+import pickle
+import queue
+import random
+import threading
+import weakref
+import numpy as np
+from multiprocessing.dummy import Pool as ThreadPool
+
+from nlpaug.util.random_stream import call_with_seed, generate_seeds, hash_seeds
+
+
+class Backend:
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+    @staticmethod
+    def getall():
+        return [Backend.THREAD, Backend.PROCESS]
+
+
+_DEFAULT_BACKEND = Backend.THREAD
+_THREAD_POOLS = {}
+# (id of augmenter, number of process) to (weak reference of augmenter, config digest, pool) in least recently used
+# order. Pools beyond MAX_PROCESS_POOLS are shut down.
+_PROCESS_POOLS = collections.OrderedDict()
+_PROCESS_POOLS_LOCK = threading.RLock()
+MAX_PROCESS_POOLS = 4
+
+# Augmenter copy owned by a process pool worker. Set once when worker starts.
+_WORKER_AUGMENTER = None
+
+
+def set_backend(backend):
+    """
+    :param str backend: Default execution backend when num_thread is larger than 1. Possible values are 'thread'
+        and 'process'. 'thread' is suitable for augmenter which release GIL (e.g. PyTorch model) while 'process'
+        is suitable for pure python augmenter (e.g. RandomCharAug, SynonymAug).
+
+    >>> import nlpaug.util as nau
+    >>> nau.set_backend('process')
+    """
+    global _DEFAULT_BACKEND
+    _DEFAULT_BACKEND = get_backend(backend)
+
+
+def get_backend(backend=None):
+    if backend is None:
+        return _DEFAULT_BACKEND
+    if backend not in Backend.getall():
+        raise ValueError('Backend must be one of {} while {} is passed'.format(Backend.getall(), backend))
+    return backend
+
+
+def get_thread_pool(num_thread):
+    if num_thread not in _THREAD_POOLS:
+        _THREAD_POOLS[num_thread] = ThreadPool(num_thread)
+    return _THREAD_POOLS[num_thread]
+
+
+def get_process_pool(augmenter, num_proc):
+    """
+    Persistent process pool dedicated to one augmenter. Augmenter (and its model) is pickled to each worker once
+    when pool is created and reused by every subsequent call. Pool is rebuilt if configuration of augmenter (see
+    get_cache_digest) is changed after pool creation, and it is shut down when augmenter is garbage collected. At most
+    MAX_PROCESS_POOLS pools are kept and least recently used one is shut down first. Call shutdown_process_pool to
+    drop the pool explicitly.
+    """
+    key = (id(augmenter), num_proc)
+    digest = _get_config_digest(augmenter)
+    with _PROCESS_POOLS_LOCK:
+        entry = _PROCESS_POOLS.get(key)
+        # id may be reused after garbage collection. Verify the pool still belongs to this augmenter.
+        if entry is not None and entry[0]() is augmenter and entry[1] == digest:
+            _PROCESS_POOLS.move_to_end(key)
+            return entry[2]
+        if entry is not None:
+            _terminate_pool(key)
+
+        # Pool keeps initargs for respawning worker. Pass weak reference (forked worker inherits augmenter) or pickled
+        # augmenter so that pool does not keep augmenter alive.
+        augmenter_ref = weakref.ref(augmenter)
+        if multiprocessing.get_start_method() == 'fork':
+            initargs = (augmenter_ref, None)
+        else:
+            initargs = (None, pickle.dumps(augmenter))
+        pool = multiprocessing.Pool(num_proc, initializer=_init_worker, initargs=initargs)
+        _PROCESS_POOLS[key] = (augmenter_ref, digest, pool)
+        weakref.finalize(augmenter, _terminate_pool, key, pool)
+        while len(_PROCESS_POOLS) > MAX_PROCESS_POOLS:
+            _terminate_pool(next(iter(_PROCESS_POOLS)))
+        return pool
+
+
+def _get_config_digest(augmenter):
+    get_cache_digest = getattr(augmenter, 'get_cache_digest', None)
+    return get_cache_digest() if get_cache_digest is not None else None
+
+
+def _terminate_pool(key, pool=None):
+    """
+    :param pool: Only terminate if pool of key is this pool. None means any pool of key.
+    """
+    with _PROCESS_POOLS_LOCK:
+        entry = _PROCESS_POOLS.get(key)
+        if entry is None or (pool is not None and entry[2] is not pool):
+            return
+        del _PROCESS_POOLS[key]
+    entry[2].terminate()
+    entry[2].join()
+
+
+def shutdown_process_pool(augmenter=None):
+    """
+    :param obj augmenter: Shutdown process pools of this augmenter. Shutdown all process pools if None is passed.
+    """
+    with _PROCESS_POOLS_LOCK:
+        keys = [key for key, entry in _PROCESS_POOLS.items() if augmenter is None or entry[0]() is augmenter]
+    for key in keys:
+        _terminate_pool(key)
+
+
+def _shutdown_pools():
+    shutdown_process_pool()
+    for pool in _THREAD_POOLS.values():
+        pool.terminate()
+    _THREAD_POOLS.clear()
+
+
+atexit.register(_shutdown_pools)
+
+
+def _init_worker(augmenter_ref, pickled_augmenter):
+    global _WORKER_AUGMENTER
+    _WORKER_AUGMENTER = augmenter_ref() if pickled_augmenter is None else pickle.loads(pickled_augmenter)
+    # Forked workers inherit parent's random state. Reseed it, otherwise every worker generates same outputs.
+    random.seed()
+    np.random.seed()
+
+
+def _worker_action(args):
+    action_name, data, seed = args
+    return call_with_seed(getattr(_WORKER_AUGMENTER, action_name), seed, data)
+
+
+def _worker_augment(args):
+    data, n, seed = args
+    return _WORKER_AUGMENTER.augment(data, n=n, seed=seed)
+
+
+def _worker_augment_batch(args):
+    data, n, seeds = args
+    return _WORKER_AUGMENTER.augment_batch(data, n=n, seed=seeds)
+
+
+def parallel_action(augmenter, action_fx, data, seeds, num_thread, backend=None):
+    # Each call runs with its own random stream so that workers never share random state.
+    if get_backend(backend) == Backend.PROCESS:
+        pool = get_process_pool(augmenter, num_thread)
+        return pool.map(_worker_action, [(action_fx.__name__, data, seed) for seed in seeds])
+
+    return get_thread_pool(num_thread).map(lambda seed: call_with_seed(action_fx, seed, data), seeds)
+
+
+def parallel_augment(augmenter, data, n, seeds, num_thread, backend=None):
+    # Spread whole inputs across workers. Each worker generates all n outputs of its input.
+    chunk_size = max(1, len(data) // (num_thread * 4))
+    if get_backend(backend) == Backend.PROCESS:
+        pool = get_process_pool(augmenter, num_thread)
+        return pool.map(_worker_augment, [(d, n, seed) for d, seed in zip(data, seeds)], chunksize=chunk_size)
+
+    return get_thread_pool(num_thread).map(
+        lambda args: augmenter.augment(args[0], n=n, seed=args[1]), list(zip(data, seeds)), chunksize=chunk_size)
+
+
+def parallel_augment_batch(augmenter, data, n, seeds, num_thread, backend=None):
+    # Spread contiguous chunks across workers. Each worker runs augment_batch of its chunk in one call so that
+    # augmenter which processes whole batch at once (e.g. flow) keeps doing so.
+    chunk_size = max(1, int(math.ceil(len(data) / num_thread)))
+    chunks = [(data[i:i + chunk_size], n, seeds[i:i + chunk_size]) for i in range(0, len(data), chunk_size)]
+    if get_backend(backend) == Backend.PROCESS:
+        results = get_process_pool(augmenter, num_thread).map(_worker_augment_batch, chunks)
+    else:
+        results = get_thread_pool(num_thread).map(
+            lambda args: augmenter.augment_batch(args[0], n=args[1], seed=args[2]), chunks)
+    return [result for chunk_results in results for result in chunk_results]
+
+
+def stream_augment(augmenter, data, n, chunk_size, num_worker, backend=None, seed=None, offset=0):
+    """
+    Pull inputs lazily from iterable data and yield augmented results in input order. At most num_worker * 2 chunks
+    are read ahead so memory stays bounded no matter how large the input is.
+    """
+    iterator = iter(data)
+    is_parallel = num_worker > 1 and augmenter.device != 'cuda'
+    position = [offset]
+
+    def next_chunk():
+        _chunk = list(itertools.islice(iterator, chunk_size))
+        # Seed of each item depends on its position in the whole stream only (not on chunk size)
+        seeds = generate_seeds(seed, len(_chunk), offset=position[0], draw=is_parallel)
+        position[0] += len(_chunk)
+        return _chunk, seeds
+
+    if not is_parallel:
+        chunk, chunk_seeds = next_chunk()
+        while chunk:
+            for result in augmenter.augment_batch(chunk, n=n, seed=chunk_seeds):
+                yield result
+            chunk, chunk_seeds = next_chunk()
+        return
+
+    if get_backend(backend) == Backend.PROCESS:
+        pool = get_process_pool(augmenter, num_worker)
+
+        def submit(_chunk, _seeds):
+            return pool.apply_async(_worker_augment_batch, ((_chunk, n, _seeds),))
+    else:
+        pool = get_thread_pool(num_worker)
+
+        def submit(_chunk, _seeds):
+            return pool.apply_async(augmenter.augment_batch, (_chunk,), {'n': n, 'seed': _seeds})
+
+    pending = collections.deque()
+    max_pending = num_worker * 2
+    is_exhausted = False
+    while True:
+        # Only read ahead when there is free slot. Slow consumer blocks further reading (backpressure).
+        while not is_exhausted and len(pending) < max_pending:
+            chunk, chunk_seeds = next_chunk()
+            if not chunk:
+                is_exhausted = True
+                break
+            pending.append(submit(chunk, chunk_seeds))
+
+        if not pending:
+            return
+
+        for result in pending.popleft().get():
+            yield result
+
+
+def pipelined_augment(stages, data, stage_workers=1, chunk_size=16, queue_size=2, seed=None, offset=0,
+                      stage_backends=None):
+    """
+    Run augmenters as pipeline stages. Each stage has its own worker thread(s) and passes chunks of data to next stage
+    through bounded queue, so different chunks occupy different stages at the same time. Stage workers complete
+    chunks out of order and results are reordered before yielding. Number of chunks in flight is bounded so memory
+    stays bounded no matter how large the input is. Worker thread of 'process' stage hands its chunk to persistent
+    process pool (one process per worker) of the augmenter so that pure python stage is not limited by GIL.
+    """
+    if isinstance(stage_workers, int):
+        stage_workers = [stage_workers] * len(stages)
+    if stage_backends is None or isinstance(stage_backends, str):
+        stage_backends = [stage_backends] * len(stages)
+    if len(stage_workers) != len(stages) or len(stage_backends) != len(stages):
+        raise ValueError('Number of stage_workers ({}) and stage_backends ({}) must match number of stages ({})'.format(
+            len(stage_workers), len(stage_backends), len(stages)))
+    if any(num_worker < 1 for num_worker in stage_workers) or chunk_size < 1 or queue_size < 1:
+        raise ValueError('stage_workers, chunk_size and queue_size must be positive')
+    stage_backends = [get_backend(backend) for backend in stage_backends]
+    # Pools are created before starting workers so that workers of same stage share one pool
+    process_pools = [get_process_pool(aug, num_worker) if backend == Backend.PROCESS else None
+                     for aug, num_worker, backend in zip(stages, stage_workers, stage_backends)]
+
+    # queues[i] feeds i-th stage and queues[-1] collects results. Message is (chunk_idx, chunk, seeds), or
+    # (None, exception, None) if failed. Total number of chunks is sent to result queue when input is exhausted.
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    in_flight = threading.Semaphore(sum(stage_workers) + queue_size * (len(stages) + 1))
+    stop_event = threading.Event()
+
+    def put(_queue, message):
+        while not stop_event.is_set():
+            try:
+                _queue.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(_queue):
+        while not stop_event.is_set():
+            try:
+                return _queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def feed():
+        iterator = iter(data)
+        chunk_idx, position = 0, offset
+        try:
+            while True:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                # Seed of each item depends on its position in the whole stream only (not on chunk size)
+                seeds = generate_seeds(seed, len(chunk), offset=position)
+                position += len(chunk)
+                while not in_flight.acquire(timeout=0.1):
+                    if stop_event.is_set():
+                        return
+                if not put(queues[0], (chunk_idx, chunk, seeds)):
+                    return
+                chunk_idx += 1
+            put(queues[-1], chunk_idx)
+        except Exception as e:
+            put(queues[-1], (None, e, None))
+
+    def work(stage_idx):
+        aug, process_pool = stages[stage_idx], process_pools[stage_idx]
+        while True:
+            message = get(queues[stage_idx])
+            if message is None:
+                return
+            chunk_idx, chunk, seeds = message
+            try:
+                stage_seeds = None
+                if seeds[0] is not None:
+                    stage_seeds = hash_seeds(seeds, stage_idx).tolist()
+                if process_pool is None:
+                    chunk = aug.augment_batch(chunk, n=1, seed=stage_seeds)
+                else:
+                    chunk = process_pool.apply(_worker_augment_batch, ((chunk, 1, stage_seeds),))
+            except Exception as e:
+                put(queues[-1], (None, e, None))
+                return
+            if not put(queues[stage_idx + 1], (chunk_idx, chunk, seeds)):
+                return
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    for stage_idx, num_worker in enumerate(stage_workers):
+        threads.extend(threading.Thread(target=work, args=(stage_idx,), daemon=True) for _ in range(num_worker))
+    for thread in threads:
+        thread.start()
+
+    # Completed chunks wait in reorder buffer until all previous chunks are yielded
+    reorder_buffer = {}
+    next_chunk_idx, num_chunk = 0, None
+    try:
+        while num_chunk is None or next_chunk_idx < num_chunk:
+            message = queues[-1].get()
+            if isinstance(message, int):
+                num_chunk = message
+                continue
+            chunk_idx, chunk, _ = message
+            if chunk_idx is None:
+                raise chunk
+            reorder_buffer[chunk_idx] = chunk
+            while next_chunk_idx in reorder_buffer:
+                for result in reorder_buffer.pop(next_chunk_idx):
+                    yield result
+                in_flight.release()
+                next_chunk_idx += 1
+    finally:
+        stop_event.set()
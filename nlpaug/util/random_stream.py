@@ -0,0 +1,227 @@
+import contextlib
+import random
+import threading
+import numpy as np
+
+
+def derive_seed(seed, *keys):
+    """
+    Derive an independent seed from a base seed and keys (e.g. index of item). Same base seed and keys always
+    return same seed so that any item of a large job can be regenerated without rerunning the whole job.
+
+    :param int seed: Base seed
+    :param int keys: Keys (e.g. index of item, index of candidate)
+    :return: int Derived seed
+
+    >>> derive_seed(2019, 10)
+    """
+    return int(np.random.SeedSequence([seed] + list(keys)).generate_state(1, dtype=np.uint64)[0])
+
+
+_UINT64_MASK = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _splitmix64(x):
+    # Arithmetic of uint64 array wraps around silently
+    x = x + np.uint64(_GOLDEN_GAMMA)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_seeds(seeds, *keys):
+    """
+    Vectorized seed derivation for large batch. Unlike derive_seed, it hashes all seeds in a few numpy operations.
+    Values are different from derive_seed but same seeds and keys always return same values.
+
+    :param seeds: List or numpy array of int seeds (taken modulo 2^64)
+    :param int keys: Keys (e.g. index of stage, index of round)
+    :return: numpy.ndarray of uint64 seeds
+
+    >>> hash_seeds([1, 2, 3], 0)
+    """
+    if isinstance(seeds, np.ndarray):
+        results = seeds.astype(np.uint64)
+    else:
+        results = np.array([seed & _UINT64_MASK for seed in seeds], dtype=np.uint64)
+    for key in keys:
+        results = _splitmix64(results ^ np.uint64((key * _GOLDEN_GAMMA) & _UINT64_MASK))
+    return results
+
+
+def hash_uniforms(seeds, *keys):
+    """
+    :return: numpy.ndarray of float in [0, 1). i-th value only depends on i-th seed and keys. See hash_seeds.
+    """
+    return (hash_seeds(seeds, *keys) >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+class _GlobalNumpyGenerator:
+    """
+    Expose numpy global random state with numpy.random.Generator interface. So that np.random.seed still controls
+    augmenter which is not run with explicit stream.
+    """
+
+    @staticmethod
+    def integers(low, high=None, size=None):
+        return np.random.randint(low, high, size)
+
+    @staticmethod
+    def standard_normal(size=None):
+        return np.random.standard_normal(size)
+
+    @staticmethod
+    def uniform(low=0.0, high=1.0, size=None):
+        return np.random.uniform(low, high, size)
+
+    @staticmethod
+    def choice(a, size=None, replace=True, p=None):
+        return np.random.choice(a, size, replace, p)
+
+    @staticmethod
+    def random(size=None):
+        return np.random.random_sample(size)
+
+
+class RandomStream:
+    """
+    Independent random number stream. It bundles a python random.Random and a numpy.random.Generator which are used
+    by augmenter and model respectively.
+
+    :param int seed: Seed of this stream. Default value is None which means seeding from OS entropy.
+
+    >>> from nlpaug.util.random_stream import RandomStream
+    >>> stream = RandomStream(2019)
+    """
+
+    def __init__(self, seed=None, py_random=None, np_random=None):
+        self.seed = seed
+        self.random = py_random or random.Random(seed)
+        self._numpy = np_random
+
+    @property
+    def numpy(self):
+        # Most of textual augmenters do not use numpy. Create generator on demand.
+        if self._numpy is None:
+            self._numpy = np.random.default_rng(self.seed)
+        return self._numpy
+
+    def derive_seed(self):
+        """
+        :return: A new seed drawn from this stream
+        """
+        return self.random.getrandbits(64)
+
+    @classmethod
+    def create(cls, seed):
+        """
+        :param seed: Either int, random.Random, numpy.random.Generator or RandomStream
+        :return: RandomStream
+        """
+        if isinstance(seed, RandomStream):
+            return seed
+        if isinstance(seed, random.Random):
+            return cls(py_random=seed, np_random=np.random.default_rng(seed.getrandbits(64)))
+        if isinstance(seed, np.random.Generator):
+            return cls(py_random=random.Random(int(seed.integers(2 ** 63))), np_random=seed)
+        return cls(seed)
+
+
+class _GlobalRandomStream(RandomStream):
+    def __init__(self):
+        super().__init__(py_random=random, np_random=_GlobalNumpyGenerator())
+
+
+GLOBAL_RANDOM_STREAM = _GlobalRandomStream()
+
+
+class _RandomStreamLocal(threading.local):
+    # Class attribute is the default of every thread. Reading it is cheaper than getattr with default.
+    stream = GLOBAL_RANDOM_STREAM
+
+
+_local = _RandomStreamLocal()
+# Number of use_random_stream contexts which are alive in any thread. Thread local storage is only read when it is
+# not zero so that unseeded augmentation pays the same as using global random state directly.
+_num_active_streams = 0
+_active_streams_lock = threading.Lock()
+
+
+def get_random_stream():
+    """
+    :return: RandomStream of current thread. Global random state (python random and numpy.random) is used if no
+        stream is set by use_random_stream.
+    """
+    if _num_active_streams:
+        return _local.stream
+    return GLOBAL_RANDOM_STREAM
+
+
+def _add_active_streams(value):
+    global _num_active_streams
+    with _active_streams_lock:
+        _num_active_streams += value
+
+
+@contextlib.contextmanager
+def use_random_stream(stream):
+    """
+    Use stream as random source of current thread within this context.
+
+    :param stream: Either int, random.Random, numpy.random.Generator or RandomStream
+
+    >>> with use_random_stream(2019):
+    ...     aug.substitute(data)
+    """
+    previous_stream = _local.stream
+    _local.stream = RandomStream.create(stream)
+    _add_active_streams(1)
+    try:
+        yield _local.stream
+    finally:
+        _local.stream = previous_stream
+        _add_active_streams(-1)
+
+
+def resolve_seed(seed):
+    """
+    Convert seed argument of augment call to int base seed. Return None if seed is None.
+    """
+    if seed is None:
+        return None
+    if isinstance(seed, (random.Random, np.random.Generator, RandomStream)):
+        return RandomStream.create(seed).derive_seed()
+    return int(seed)
+
+
+def generate_seeds(seed, size, offset=0, draw=False):
+    """
+    :param seed: Base seed (int), list of seeds (one per item) or None
+    :param int size: Number of seeds
+    :param int offset: Index of first item. Seed of i-th item is derive_seed(seed, offset + i)
+    :param bool draw: If True and seed is None, seeds are drawn from stream of current thread. Used when items are
+        processed by other workers so that workers do not share the same random state.
+    :return: List of seeds. Element is None if seed is None and draw is False.
+    """
+    if isinstance(seed, (list, tuple)):
+        if len(seed) != size:
+            raise ValueError('Number of seeds ({}) does not match number of data ({})'.format(len(seed), size))
+        return list(seed)
+    seed = resolve_seed(seed)
+    if seed is not None:
+        return [derive_seed(seed, offset + i) for i in range(size)]
+    if draw:
+        stream = get_random_stream()
+        return [stream.derive_seed() for _ in range(size)]
+    return [None] * size
+
+
+def call_with_seed(fx, seed, *args, **kwargs):
+    """
+    Call fx with an independent stream seeded by seed. Use stream of current thread if seed is None.
+    """
+    if seed is None:
+        return fx(*args, **kwargs)
+    with use_random_stream(seed):
+        return fx(*args, **kwargs)
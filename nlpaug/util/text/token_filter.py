@@ -0,0 +1,54 @@
+import string
+
+# Token is skipped as punctuation if it is a part of string.punctuation (e.g. '.', '()' or empty token). Set lookup
+# is much faster than substring search and gives same result.
+PUNCTUATION_TOKENS = frozenset(
+    string.punctuation[start:end] for start in range(len(string.punctuation) + 1)
+    for end in range(start, len(string.punctuation) + 1))
+
+
+class StopwordIndex:
+    """
+    Stopwords compiled into case normalized set. Checking a token costs the same no matter how many stopwords are
+    given.
+
+    :param list stopwords: List of words which will be skipped from augment operation. Matching is case insensitive.
+
+    >>> from nlpaug.util.text.token_filter import StopwordIndex
+    >>> index = StopwordIndex(['a', 'an', 'the'])
+    >>> 'The' in index
+    """
+
+    def __init__(self, stopwords=None):
+        self.words = frozenset(word.lower() for word in stopwords) if stopwords else frozenset()
+
+    def __contains__(self, token):
+        return token.lower() in self.words
+
+    def __len__(self):
+        return len(self.words)
+
+    def get_skipped_tokens(self, tokens, skip_punctuation=True):
+        """
+        :param iterable tokens: Tokens of one or more texts
+        :param bool skip_punctuation: Skip punctuation as well as stopwords
+        :return: Set of distinct tokens which should be skipped
+        """
+        tokens = set(tokens)
+        skipped_tokens = tokens & PUNCTUATION_TOKENS if skip_punctuation else set()
+        if self.words:
+            skipped_tokens.update(token for token in tokens if token.lower() in self.words)
+        return skipped_tokens
+
+    def get_eligible_idxes(self, batch_tokens, skip_punctuation=True):
+        """
+        :param list batch_tokens: List of tokenized texts
+        :param bool skip_punctuation: Skip punctuation as well as stopwords
+        :return: List of eligible token indexes per text. Every distinct token is checked once for whole batch.
+        """
+        # Single text (e.g. augment call) is passed as is to avoid generator overhead
+        tokens = batch_tokens[0] if len(batch_tokens) == 1 else (token for tokens in batch_tokens for token in tokens)
+        skipped_tokens = self.get_skipped_tokens(tokens, skip_punctuation=skip_punctuation)
+        if not skipped_tokens:
+            return [list(range(len(tokens))) for tokens in batch_tokens]
+        return [[i for i, token in enumerate(tokens) if token not in skipped_tokens] for tokens in batch_tokens]
@@ -0,0 +1,95 @@
+import contextlib
+import threading
+
+
+class TokenSequence(list):
+    """
+    Text represented by its tokens split by single space. It is passed between augmenters of flow so that text is
+    tokenized once when entering flow and joined once when leaving it. Tokens never contain space, so TokenSequence
+    and text map to each other one to one (e.g. 'a  b' is ['a', '', 'b'] and empty text is ['']).
+
+    >>> from nlpaug.util.text.token_sequence import TokenSequence
+    >>> tokens = TokenSequence.from_text('The quick brown fox')
+    >>> tokens.to_text()
+    """
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(text.split(' '))
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """
+        :param list tokens: Tokens of augmented text. Token may contain space (e.g. multi-word synonym).
+        :return: Same as TokenSequence.from_text(' '.join(tokens)) but without building text
+        """
+        # Joining without separator is much faster than checking tokens one by one in python
+        if ' ' in ''.join(tokens):
+            return cls(' '.join(tokens).split(' '))
+        if len(tokens) == 0:
+            return cls([''])
+        return cls(tokens)
+
+    def to_text(self):
+        return ' '.join(self)
+
+    def is_empty(self):
+        return len(self) == 0 or (len(self) == 1 and self[0] == '')
+
+    def strip(self):
+        """
+        :return: Same as TokenSequence.from_text(text.strip())
+        """
+        if self and self[0][:1].strip() and self[-1][-1:].strip():
+            # Nothing to strip. Most of tokens passed between augmenters are like this.
+            return self
+        start, end = 0, len(self)
+        while start < end and (self[start] == '' or self[start].isspace()):
+            start += 1
+        while end > start and (self[end - 1] == '' or self[end - 1].isspace()):
+            end -= 1
+        if start == end:
+            return TokenSequence([''])
+
+        tokens = self[start:end]
+        tokens[0] = tokens[0].lstrip()
+        tokens[-1] = tokens[-1].rstrip()
+        return TokenSequence(tokens)
+
+
+class _TokenModeLocal(threading.local):
+    # Class attribute is the default of every thread. Reading it is cheaper than getattr with default.
+    enabled = False
+
+
+_local = _TokenModeLocal()
+
+
+def is_token_mode():
+    """
+    :return: True if augmenters of current thread exchange TokenSequence instead of text
+    """
+    return _local.enabled
+
+
+def set_token_mode(enabled):
+    """
+    :param bool enabled: Token mode of current thread
+    :return: Previous token mode. Restore it after use.
+    """
+    previous = _local.enabled
+    _local.enabled = enabled
+    return previous
+
+
+@contextlib.contextmanager
+def use_token_sequence():
+    """
+    Default reverse_tokenizer of word and character augmenters returns TokenSequence instead of text within this
+    context. It is used by flow and applies to current thread only.
+    """
+    previous = set_token_mode(True)
+    try:
+        yield
+    finally:
+        set_token_mode(previous)
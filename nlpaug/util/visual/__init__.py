@@ -1,2 +1,7 @@
-from nlpaug.util.visual.spectrogram import *
-from nlpaug.util.visual.wave import *
+from __future__ import absolute_import
+from nlpaug.util.lazy import lazy_attach
+
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {
+    'spectrogram': ['VisualSpectrogram'],
+    'wave': ['VisualWave'],
+})
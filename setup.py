@@ -18,6 +18,12 @@ setup(
     long_description=readme,
     long_description_content_type="text/markdown",
     packages=find_packages(exclude="test"),
+    entry_points={
+        "console_scripts": [
+            "nlpaug-run=nlpaug.runner.cli:main",
+            "nlpaug-queue=nlpaug.runner.cli:queue_main"
+        ]
+    },
     keywords=[
         "deep learning", "neural network", "machine learning",
         "nlp", "natural language processing", "text", "audio", "spectrogram",
@@ -32,3 +32,12 @@ class TestLoudness(unittest.TestCase):
         self.assertFalse(np.array_equal(audio, augmented_audio))
         self.assertEqual(len(audio), len(augmented_audio))
         self.assertTrue(sampling_rate > 0)
+
+    def test_seed(self):
+        audio, sampling_rate = librosa.load(self.sample_wav_file)
+
+        aug = naa.LoudnessAug()
+        augmented_audio = aug.augment(audio, seed=2019)
+
+        self.assertTrue(np.array_equal(augmented_audio, aug.augment(audio, seed=2019)))
+        self.assertFalse(np.array_equal(augmented_audio, aug.augment(audio, seed=2020)))
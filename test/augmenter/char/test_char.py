@@ -1,7 +1,11 @@
+import gc
 import unittest
 
 import nlpaug.augmenter.char as nac
+import nlpaug.util.parallel as parallel
 import nlpaug.util.text.tokenizer as text_tokenizer
+from nlpaug.util.parallel import shutdown_process_pool
+from nlpaug.util.random_stream import derive_seed
 
 
 class TestCharacter(unittest.TestCase):
@@ -49,3 +53,137 @@ class TestCharacter(unittest.TestCase):
             for aug in augs:
                 augmented_data = aug.augment(text, n=n, num_thread=num_thread)
                 self.assertEqual(len(augmented_data), n)
+
+    def test_augment_batch(self):
+        texts = [
+            'The quick brown fox jumps over the lazy dog.',
+            '',
+            'Zology raku123456 fasdasd asd4123414 1234584'
+        ]
+        augs = [
+            nac.KeyboardAug(),
+            nac.RandomCharAug(),
+        ]
+
+        for aug in augs:
+            augmented_texts = aug.augment_batch(texts)
+            self.assertEqual(len(texts), len(augmented_texts))
+            self.assertEqual('', augmented_texts[1])
+            self.assertNotEqual(texts[0], augmented_texts[0])
+            self.assertNotEqual(texts[2], augmented_texts[2])
+
+            augmented_texts = aug.augment_batch(texts, n=2)
+            self.assertEqual(len(texts), len(augmented_texts))
+            self.assertEqual(2, len(augmented_texts[0]))
+
+    def test_process_backend(self):
+        texts = [
+            'The quick brown fox jumps over the lazy dog.',
+            'Zology raku123456 fasdasd asd4123414 1234584'
+        ]
+        n = 3
+        augs = [
+            nac.KeyboardAug(),
+            nac.RandomCharAug(),
+        ]
+
+        for aug in augs:
+            augmented_data = aug.augment(texts[0], n=n, num_thread=2, backend='process')
+            self.assertEqual(len(augmented_data), n)
+
+            augmented_data = aug.augment_batch(texts, n=n, num_thread=2, backend='process')
+            self.assertEqual(len(augmented_data), len(texts))
+            for augmented_texts in augmented_data:
+                self.assertEqual(len(augmented_texts), n)
+
+            shutdown_process_pool(aug)
+
+    def test_process_pool(self):
+        text = 'The quick brown fox jumps over the lazy dog'
+        aug = nac.RandomCharAug(action='substitute')
+        pool = parallel.get_process_pool(aug, 2)
+        self.assertIs(pool, parallel.get_process_pool(aug, 2))
+
+        # Pool is rebuilt after configuration is changed, so both backends give same result
+        aug.aug_char_p = 1
+        aug.aug_word_p = 1
+        self.assertIsNot(pool, parallel.get_process_pool(aug, 2))
+        self.assertEqual(aug.augment(text, n=3, seed=2019),
+                         aug.augment(text, n=3, num_thread=2, backend='process', seed=2019))
+
+        # Least recently used pools are shut down
+        augs = [nac.RandomCharAug() for _ in range(parallel.MAX_PROCESS_POOLS + 1)]
+        for other_aug in augs:
+            parallel.get_process_pool(other_aug, 1)
+        self.assertEqual(parallel.MAX_PROCESS_POOLS, len(parallel._PROCESS_POOLS))
+        self.assertNotIn((id(aug), 2), parallel._PROCESS_POOLS)
+
+        # Pool is shut down when augmenter is garbage collected
+        key = (id(augs[-1]), 1)
+        self.assertIn(key, parallel._PROCESS_POOLS)
+        del augs, other_aug
+        gc.collect()
+        self.assertEqual(0, len(parallel._PROCESS_POOLS))
+
+    def test_augment_stream(self):
+        texts = ['The quick brown fox jumps over the lazy dog.'] * 10
+        pulled = []
+
+        def reader():
+            for i, text in enumerate(texts):
+                pulled.append(i)
+                yield text
+
+        aug = nac.RandomCharAug()
+
+        stream = aug.augment_stream(reader(), chunk_size=3)
+        next(stream)
+        # Only first chunk is read
+        self.assertEqual(3, len(pulled))
+        self.assertEqual(len(texts) - 1, len(list(stream)))
+
+        for backend in ['thread', 'process']:
+            augmented_texts = list(aug.augment_stream(iter(texts), n=2, chunk_size=3, workers=2, backend=backend))
+            self.assertEqual(len(texts), len(augmented_texts))
+            for augmented_text in augmented_texts:
+                self.assertEqual(2, len(augmented_text))
+
+        shutdown_process_pool(aug)
+
+    def test_oversampling_stats(self):
+        aug = nac.OcrAug()
+        n = 3
+
+        # No OCR mapping for A so every candidate is same as input
+        aug.augment('AAAAAAAAAAA AAAAAAAAAAAAAA', n=n)
+        stats = aug.get_oversampling_stats()
+        self.assertEqual(stats['total_calls'], stats['wasted_calls'])
+        self.assertLessEqual(stats['total_calls'], n * 4)
+
+        # Fixed seed whose first candidate is different from input
+        aug.oversampler.reset()
+        aug.augment('The quick brown fox jumps over the lazy dog', n=1, seed=0)
+        self.assertEqual(1, aug.get_oversampling_stats()['total_calls'])
+
+    def test_seed(self):
+        texts = [
+            'The quick brown fox jumps over the lazy dog.',
+            'Zology raku123456 fasdasd asd4123414 1234584'
+        ]
+        aug = nac.RandomCharAug()
+
+        expected_texts = aug.augment(texts[0], n=3, seed=2019)
+        self.assertEqual(expected_texts, aug.augment(texts[0], n=3, seed=2019))
+        self.assertNotEqual(expected_texts, aug.augment(texts[0], n=3, seed=2020))
+        # Result does not depend on execution mode
+        self.assertEqual(expected_texts, aug.augment(texts[0], n=3, num_thread=3, seed=2019))
+        self.assertEqual(expected_texts, aug.augment(texts[0], n=3, num_thread=3, backend='process', seed=2019))
+
+        # Any item of batch can be regenerated individually
+        augmented_texts = aug.augment_batch(texts, seed=2019)
+        for i, text in enumerate(texts):
+            self.assertEqual(augmented_texts[i], aug.augment(text, seed=derive_seed(2019, i)))
+        self.assertEqual(augmented_texts, aug.augment_batch(texts, num_thread=2, seed=2019))
+        self.assertEqual(augmented_texts, list(aug.augment_stream(texts, chunk_size=1, workers=2, seed=2019)))
+
+        shutdown_process_pool(aug)
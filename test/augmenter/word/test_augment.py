@@ -0,0 +1,55 @@
+import pickle
+import unittest
+
+import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.word as naw
+import nlpaug.flow as naf
+from nlpaug.augmenter.augment import Augment, get_edits, apply_edits
+
+
+class TestAugment(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.text = 'The quick brown fox jumps over the lazy dog .'
+        cls.augs = [
+            nac.RandomCharAug(),
+            naw.RandomWordAug(),
+            naw.RandomWordAug(action='swap'),
+            naf.Sequential([nac.KeyboardAug(), naw.RandomWordAug(action='swap')])
+        ]
+
+    def test_edits(self):
+        augmented_text = 'The quick red fox jumps over the lazy dog !'
+        edits = get_edits(self.text, augmented_text)
+        self.assertEqual([Augment(10, 'brown', 'red'), Augment(44, '.', '!')], edits)
+        self.assertEqual(augmented_text, apply_edits(self.text, edits))
+        self.assertEqual(augmented_text, apply_edits(self.text, [edit.to_tuple() for edit in edits]))
+        self.assertEqual([], get_edits(self.text, self.text))
+
+        self.assertEqual(edits, pickle.loads(pickle.dumps(edits)))
+        with self.assertRaises(AttributeError):
+            edits[0].other = 1
+        with self.assertRaises(ValueError):
+            apply_edits('A quick brown fox', edits)
+
+    def test_edits_alignment(self):
+        # Deletion and insertion keep order of the other tokens
+        self.assertEqual([Augment(10, 'brown ', ''), Augment(43, ' .', '')],
+                         get_edits(self.text, 'The quick fox jumps over the lazy dog'))
+        self.assertEqual([Augment(4, '', 'very '), Augment(45, '', ' !')],
+                         get_edits(self.text, 'The very quick brown fox jumps over the lazy dog . !'))
+
+        # Changed part which cannot be aligned token by token is one edit
+        augmented_text = 'The quick red fox jumps over the dog!'
+        edits = get_edits(self.text, augmented_text)
+        self.assertEqual([Augment(10, 'brown fox jumps over the lazy dog .', 'red fox jumps over the dog!')], edits)
+        self.assertEqual(augmented_text, apply_edits(self.text, edits))
+
+    def test_augment_edits(self):
+        for aug in self.augs:
+            edits = aug.augment_edits(self.text, seed=2019)
+            self.assertTrue(all(isinstance(edit, Augment) for edit in edits))
+            self.assertEqual(aug.augment(self.text, seed=2019), apply_edits(self.text, edits))
+
+            edits = aug.augment_edits(self.text, n=3, seed=2019)
+            self.assertEqual(aug.augment(self.text, n=3, seed=2019), [apply_edits(self.text, e) for e in edits])
@@ -1,5 +1,7 @@
 import unittest
 import os
+import multiprocessing
+import time
 import numpy as np
 import librosa
 
@@ -10,6 +12,14 @@ import nlpaug.augmenter.audio as naa
 import nlpaug.flow as naf
 from nlpaug.util import Action
 from nlpaug.util.file.load import LoadUtil
+from nlpaug.util.parallel import shutdown_process_pool
+
+
+class SlowWordAug(naw.RandomWordAug):
+    # Pure python work which holds GIL
+    def substitute(self, data):
+        sum(i * i for i in range(100000))
+        return super().substitute(data)
 
 
 class TestSequential(unittest.TestCase):
@@ -104,3 +114,114 @@ class TestSequential(unittest.TestCase):
 
         self.assertFalse(np.array_equal(audio, augmented_audio))
         self.assertTrue(len(audio), len(augmented_audio))
+
+    def test_process_backend(self):
+        texts = [
+            'The quick brown fox jumps over the lazy dog',
+            'Zology raku123456 fasdasd asd4123414 1234584'
+        ]
+        flow = naf.Sequential([nac.RandomCharAug(action=Action.INSERT), naw.RandomWordAug()])
+
+        augmented_texts = flow.augment(texts[0], n=3, num_thread=2, backend='process')
+        self.assertEqual(3, len(augmented_texts))
+
+        augmented_texts = flow.augment_batch(texts, num_thread=2, backend='process')
+        self.assertEqual(len(texts), len(augmented_texts))
+        for text, augmented_text in zip(texts, augmented_texts):
+            self.assertNotEqual(text, augmented_text)
+
+        shutdown_process_pool(flow)
+
+    def test_augment_stream(self):
+        texts = ['The quick brown fox jumps over the lazy dog', 'Zology raku123456 fasdasd asd4123414 1234584'] * 5
+        flow = naf.Sequential([nac.RandomCharAug(action=Action.INSERT), naw.RandomWordAug()])
+
+        augmented_texts = list(flow.augment_stream(iter(texts), chunk_size=4, workers=2))
+        self.assertEqual(len(texts), len(augmented_texts))
+        for text, augmented_text in zip(texts, augmented_texts):
+            self.assertNotEqual(text, augmented_text)
+
+    def test_token_sequence(self):
+        def tokenizer(text):
+            return text.split(' ')
+
+        def reverse_tokenizer(tokens):
+            return ' '.join(tokens)
+
+        def build_flow(**kwargs):
+            word_kwargs = {}
+            if kwargs:
+                word_kwargs = {'tokenizer': lambda text: [t for t in tokenizer(text) if len(t) > 0],
+                               'reverse_tokenizer': reverse_tokenizer}
+            return naf.Sequential([
+                naw.RandomWordAug(action='swap', **word_kwargs),
+                nac.KeyboardAug(**kwargs),
+                naf.Sometimes([naw.RandomWordAug(**word_kwargs), nac.RandomCharAug(action='insert', **kwargs)]),
+                naw.RandomWordAug(action='substitute', target_words=['ice cream'], **word_kwargs)
+            ])
+
+        # Custom tokenizer disables shared TokenSequence. Output must be same.
+        flow = build_flow()
+        # Use TokenSequence for short text as well
+        flow.TOKEN_SEQUENCE_MIN_LENGTH = 0
+        string_flow = build_flow(tokenizer=tokenizer, reverse_tokenizer=reverse_tokenizer)
+        self.assertTrue(flow.accepts_token_sequence())
+        self.assertFalse(string_flow.accepts_token_sequence())
+
+        texts = ['The quick brown fox jumps over the lazy dog', '  The  quick\tbrown fox  ', ' \t quick x brown\n',
+                 ' '.join(['The quick brown fox jumps over the lazy dog'] * 10)]
+        for text in texts:
+            for seed in range(20):
+                self.assertEqual(string_flow.augment(text, seed=seed), flow.augment(text, seed=seed))
+                self.assertEqual(string_flow.augment(text, n=3, seed=seed), flow.augment(text, n=3, seed=seed))
+
+    def test_augment_pipelined(self):
+        texts = ['The quick brown fox jumps over the lazy dog {}'.format(i) for i in range(50)]
+        flow = naf.Sequential([nac.KeyboardAug(), naw.RandomWordAug(action='swap'),
+                               naf.Sometimes([naw.RandomWordAug()], pipeline_p=0.5)])
+
+        augmented_texts = list(flow.augment_pipelined(iter(texts), chunk_size=4, seed=2019))
+        self.assertEqual(len(texts), len(augmented_texts))
+        for text, augmented_text in zip(texts, augmented_texts):
+            self.assertNotEqual(text, augmented_text)
+        # Same result regardless of number of workers and order of completion
+        self.assertEqual(augmented_texts, list(flow.augment_pipelined(
+            texts, stage_workers=[3, 2, 1], chunk_size=4, queue_size=1, seed=2019)))
+        # Continue a stream by offset
+        self.assertEqual(augmented_texts[20:], list(flow.augment_pipelined(
+            texts[20:], chunk_size=7, seed=2019, offset=20)))
+
+        # Same result with process workers
+        self.assertEqual(augmented_texts, list(flow.augment_pipelined(
+            texts, stage_workers=[2, 1, 1], chunk_size=4, seed=2019, stage_backends=['process', 'thread', 'thread'])))
+        shutdown_process_pool()
+
+        with self.assertRaises(ValueError):
+            list(flow.augment_pipelined(texts, stage_workers=[1, 1]))
+        with self.assertRaises(ValueError):
+            list(flow.augment_pipelined(texts, stage_backends=['thread']))
+
+        # Error of stage is raised to caller
+        flow = naf.Sequential([nac.KeyboardAug(), naw.RandomWordAug(action='swap')])
+        with self.assertRaises(TypeError):
+            list(flow.augment_pipelined(['The quick brown fox', 1], chunk_size=1))
+
+    @unittest.skipIf(multiprocessing.cpu_count() < 2, 'Need at least 2 CPUs')
+    def test_augment_pipelined_process_stage(self):
+        texts = ['The quick brown fox jumps over the lazy dog {}'.format(i) for i in range(64)]
+        flow = naf.Sequential([SlowWordAug(action='substitute')])
+
+        elapsed_times = {}
+        results = {}
+        for backend in ['thread', 'process']:
+            # Warm up process pool
+            list(flow.augment_pipelined(texts[:2], stage_workers=2, stage_backends=backend))
+            start_time = time.time()
+            results[backend] = list(flow.augment_pipelined(
+                texts, stage_workers=2, chunk_size=4, seed=2019, stage_backends=backend))
+            elapsed_times[backend] = time.time() - start_time
+        shutdown_process_pool(flow[0])
+
+        self.assertEqual(results['thread'], results['process'])
+        # Two threads of pure python stage take turns on GIL while two processes run in parallel
+        self.assertLess(elapsed_times['process'], elapsed_times['thread'] * 0.8)
@@ -1,8 +1,10 @@
 import unittest
 
 import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.word as naw
 import nlpaug.flow as naf
-from nlpaug.util import Action
+from nlpaug.util import Action, derive_seed
+from nlpaug.util.parallel import shutdown_process_pool
 
 
 class TestSometimes(unittest.TestCase):
@@ -72,3 +74,49 @@ class TestSometimes(unittest.TestCase):
         self.assertLess(0, len(flows))
         self.assertLess(0, len(texts))
 
+
+    def test_augment_batch(self):
+        class BatchAug(naw.RandomWordAug):
+            def __init__(self):
+                super().__init__(action=Action.SUBSTITUTE, target_words=['x'])
+                self.batch_sizes = []
+
+            def augment_batch(self, data, n=1, num_thread=1, backend=None, seed=None):
+                self.batch_sizes.append(len(data))
+                return super().augment_batch(data, n=n, num_thread=num_thread, backend=backend, seed=seed)
+
+        batch_aug = BatchAug()
+        flow = naf.Sequential([nac.KeyboardAug(), naf.Sometimes([batch_aug, naw.RandomWordAug()], pipeline_p=0.5)])
+        texts = ['The quick brown fox jumps over the lazy dog {}'.format(i) for i in range(20)]
+
+        augmented_texts = flow.augment_batch(texts, seed=2019)
+        self.assertEqual(len(texts), len(augmented_texts))
+        for text, augmented_text in zip(texts, augmented_texts):
+            self.assertNotEqual(text, augmented_text)
+        # Augmenter is run once per round on data which selects it
+        self.assertLess(0, batch_aug.batch_sizes[0])
+        self.assertLess(batch_aug.batch_sizes[0], len(texts))
+
+        # Result does not depend on how data is split into batches
+        seeds = [derive_seed(2019, i) for i in range(len(texts))]
+        self.assertEqual(augmented_texts, flow.augment_batch(texts[:7], seed=seeds[:7]) +
+                         flow.augment_batch(texts[7:], seed=seeds[7:]))
+        self.assertEqual(augmented_texts[3], flow.augment_batch([texts[3]], seed=[seeds[3]])[0])
+
+        # Result does not depend on number of workers and backend
+        self.assertEqual(augmented_texts, flow.augment_batch(texts, num_thread=3, seed=2019))
+        self.assertEqual(augmented_texts, flow.augment_batch(texts, num_thread=3, backend='process', seed=2019))
+        shutdown_process_pool(flow)
+
+    def test_augment_batch_mixed_seeds(self):
+        flow = naf.Sequential([nac.KeyboardAug(), naf.Sometimes([naw.RandomWordAug()], pipeline_p=0.5)])
+        texts = ['The quick brown fox jumps over the lazy dog {}'.format(i) for i in range(6)]
+        seeds = [7, None, 8, None, 7, 9]
+
+        # Seeded data does not depend on unseeded data of same batch
+        expected_texts = [flow.augment_batch([text], seed=[seed])[0] for text, seed in zip(texts, seeds) if seed]
+        for _ in range(5):
+            augmented_texts = flow.augment_batch(texts, seed=seeds)
+            self.assertEqual(expected_texts, [t for t, seed in zip(augmented_texts, seeds) if seed])
+            for text, augmented_text in zip(texts, augmented_texts):
+                self.assertNotEqual(text, augmented_text)
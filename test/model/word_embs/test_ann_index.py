@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from nlpaug.model.word_embs import IvfIndex, WordEmbeddings
+
+
+class TestIvfIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.RandomState(2019)
+        centers = rng.standard_normal((20, 16))
+        vectors = centers[rng.randint(20, size=2000)] + 0.3 * rng.standard_normal((2000, 16))
+        cls.vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+    def exact_search(self, query, k):
+        return np.argsort(-np.dot(self.vectors, query), kind='stable')[:k]
+
+    def test_search(self):
+        index = IvfIndex.build(self.vectors, num_list=20, nprobe=4)
+        self.assertEqual(20, index.num_list)
+        self.assertEqual(list(range(len(self.vectors))), sorted(index.list_ids))
+
+        recalls = []
+        for nprobe in [1, 4, 20]:
+            hits = 0
+            for query in self.vectors[:50]:
+                ids = index.search(query, 10, nprobe=nprobe)
+                scores = np.dot(self.vectors[ids], query)
+                self.assertTrue(np.all(scores[:-1] >= scores[1:]))
+                hits += len(set(ids) & set(self.exact_search(query, 10)))
+            recalls.append(hits / 500)
+        # Scoring all lists is exact search
+        self.assertEqual(1.0, recalls[-1])
+        self.assertLessEqual(recalls[0], recalls[1])
+
+    def test_save_load(self):
+        index = IvfIndex.build(self.vectors, nprobe=3)
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'index.npz')
+            index.save(file_path)
+            loaded_index = IvfIndex.load(file_path, self.vectors)
+            self.assertEqual(3, loaded_index.nprobe)
+            self.assertTrue(np.array_equal(index.search(self.vectors[0], 5), loaded_index.search(self.vectors[0], 5)))
+
+            with self.assertRaises(ValueError):
+                IvfIndex.load(file_path, self.vectors[:100])
+
+    def test_word_embeddings(self):
+        model = WordEmbeddings(top_k=5)
+        for i, vector in enumerate(self.vectors):
+            word = 'w{}'.format(i)
+            model.i2w[i], model.w2i[word], model.w2v[word] = word, i, vector
+        model.normalized_vectors = self.vectors
+
+        expected = ['w{}'.format(i) for i in self.exact_search(self.vectors[0], 6)[1:]]
+        self.assertEqual(set(expected), set(model.predict('w0')))
+        # Index returns neighbors sorted by score. Scoring all lists is exact search.
+        model.build_index(num_list=10, nprobe=10)
+        self.assertEqual(expected, model.predict('w0'))
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'index.npz')
+            model.save_index(file_path)
+            model.index = None
+            model.load_index(file_path)
+            self.assertEqual(expected, model.predict('w0'))
@@ -0,0 +1,73 @@
+import os
+import pickle
+import tempfile
+import time
+import unittest
+import numpy as np
+
+from nlpaug.model.word_embs import GloVe, Word2vec
+
+
+class TestBinaryFormat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.words = ['w{}'.format(i) for i in range(200)] + ['ünïcode', 'pp.', 'a b']
+        cls.vectors = np.random.RandomState(2019).standard_normal((len(cls.words), 25))
+
+    def write_glove(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for word, vector in zip(self.words, self.vectors):
+                f.write(word + ' ' + ' '.join('{:.6f}'.format(v) for v in vector) + '\n')
+
+    def test_glove(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'glove.txt')
+            self.write_glove(file_path)
+            model = GloVe(top_k=5)
+            model.read(file_path)
+            self.assertIsNone(model.binary_path)
+            model.save_binary(file_path)
+
+            binary_model = GloVe(top_k=5)
+            binary_model.read(file_path)
+            self.assertEqual(file_path, binary_model.binary_path)
+            self.assertIsInstance(binary_model.vectors, np.memmap)
+            self.assertEqual(np.float32, binary_model.normalized_vectors.dtype)
+            self.assertEqual(model.i2w, binary_model.i2w)
+            self.assertEqual(model.w2i, binary_model.w2i)
+            self.assertTrue(np.allclose(model.vectors, binary_model.vectors, atol=1e-6))
+            for word in ['w0', 'ünïcode', 'a b']:
+                self.assertEqual(model.predict(word), binary_model.predict(word))
+
+            # Binary file can be passed directly
+            truncated_model = GloVe(top_k=5)
+            truncated_model.read(file_path + '.npy', max_num_vector=50)
+            self.assertEqual(50, len(truncated_model.w2v))
+            self.assertEqual(50, truncated_model.vocab_size)
+
+            # Memory mapped files are reopened instead of being copied
+            loaded_model = pickle.loads(pickle.dumps(binary_model))
+            self.assertIsInstance(loaded_model.vectors, np.memmap)
+            self.assertEqual(binary_model.predict('w1'), loaded_model.predict('w1'))
+
+            # Binary format is ignored if original file is updated after conversion
+            os.utime(file_path, (time.time() + 10, time.time() + 10))
+            self.assertIsNone(GloVe.find_binary(file_path))
+            del binary_model, truncated_model, loaded_model
+
+    def test_word2vec(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'word2vec.bin')
+            with open(file_path, 'wb') as f:
+                f.write('{} {}\n'.format(len(self.words) - 1, 25).encode('utf-8'))
+                for word, vector in zip(self.words[:-1], self.vectors):
+                    f.write(word.encode('utf-8') + b' ' + vector.astype(np.float32).tobytes())
+            model = Word2vec(top_k=5)
+            model.read(file_path)
+            model.save_binary(file_path)
+
+            binary_model = Word2vec(top_k=5)
+            binary_model.read(file_path, max_num_vector=100)
+            self.assertEqual([model.i2w[i] for i in range(100)], [binary_model.i2w[i] for i in range(100)])
+            self.assertTrue(np.array_equal(model.vectors[:100], binary_model.vectors))
+            del binary_model
@@ -0,0 +1,59 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+
+from nlpaug.model.word_embs import WordEmbeddings, build_neighbor_table, load_neighbor_table
+
+
+class TestNeighborTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.RandomState(2019)
+        vectors = rng.standard_normal((500, 16))
+        cls.vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+    def build_model(self):
+        model = WordEmbeddings(top_k=5)
+        for i, vector in enumerate(self.vectors):
+            word = 'w{}'.format(i)
+            model.i2w[i], model.w2i[word], model.w2v[word] = word, i, vector
+        model.normalized_vectors = self.vectors
+        return model
+
+    def test_build(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'table.npy')
+            table = build_neighbor_table(self.vectors, file_path, num_neighbor=10, chunk_size=64)
+            self.assertEqual((500, 10), table.shape)
+            self.assertEqual(np.int32, table.dtype)
+            for i in [0, 63, 64, 499]:
+                expected = np.argsort(-np.dot(self.vectors, self.vectors[i]), kind='stable')[1:11]
+                self.assertEqual(list(expected), list(table[i]))
+
+            # Same result regardless of chunk size and number of process
+            multi_proc_table = build_neighbor_table(
+                self.vectors, os.path.join(dir_path, 'table2.npy'), num_neighbor=10, max_num_word=100, chunk_size=30,
+                num_proc=2)
+            self.assertTrue(np.array_equal(table[:100], multi_proc_table))
+
+            with self.assertRaises(ValueError):
+                load_neighbor_table(file_path, vocab_size=100)
+
+    def test_predict(self):
+        model = self.build_model()
+        expected = ['w{}'.format(i) for i in np.argsort(-np.dot(self.vectors, self.vectors[3]), kind='stable')[1:6]]
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'table.npy')
+            table = model.build_neighbor_table(file_path, max_num_word=10)
+            self.assertEqual((10, 7), table.shape)
+            self.assertEqual(expected, model.predict('w3'))
+            # Word which is not in table is predicted as usual
+            self.assertEqual(5, len(model.predict('w100')))
+
+            # Table is reopened instead of copied
+            loaded_model = pickle.loads(pickle.dumps(model))
+            self.assertIsInstance(loaded_model.neighbor_table, np.memmap)
+            self.assertEqual(model.predict('w3'), loaded_model.predict('w3'))
+            del table, model, loaded_model
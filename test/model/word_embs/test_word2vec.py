@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from nlpaug.model.word_embs import Word2vec
+
+
+class TestWord2vec(unittest.TestCase):
+    def write_word2vec(self, file_path, words, vectors, separator=b'\n'):
+        with open(file_path, 'wb') as f:
+            f.write('{} {}\n'.format(len(words), vectors.shape[1]).encode('utf-8'))
+            for word, vector in zip(words, vectors):
+                f.write(word + b' ' + vector.astype(np.float32).tobytes() + separator)
+
+    def test_read(self):
+        words = [b'the', b'fox', 'café'.encode('utf-8'), b'\x81ber', b'dog']
+        vectors = np.random.RandomState(2019).standard_normal((len(words), 8)).astype(np.float32)
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'word2vec.bin')
+            self.write_word2vec(file_path, words, vectors)
+            model = Word2vec()
+            model.read(file_path)
+
+            # Bytes are decoded one by one by cp437 and new line after vector is a part of next word
+            expected_words = ['the'] + ['\n' + word.decode('cp437') for word in words[1:]]
+            self.assertEqual(dict(enumerate(expected_words)), model.i2w)
+            self.assertEqual({word: i for i, word in enumerate(expected_words)}, model.w2i)
+            self.assertTrue(np.array_equal(vectors, model.vectors))
+            self.assertTrue(np.array_equal(vectors[2], model.w2v[expected_words[2]]))
+
+            model = Word2vec()
+            model.read(file_path, max_num_vector=2)
+            self.assertEqual(['the', '\nfox'], list(model.w2v))
+            self.assertEqual((2, 8), model.vectors.shape)
+
+            # Vector may contain space byte
+            vectors[0, 0] = np.frombuffer(b'    ', dtype=np.float32)[0]
+            self.write_word2vec(file_path, words, vectors, separator=b'')
+            model = Word2vec()
+            model.read(file_path)
+            self.assertEqual(['the', 'fox'], [model.i2w[0], model.i2w[1]])
+            self.assertTrue(np.array_equal(vectors, model.vectors))
+
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            with open(file_path, 'wb') as f:
+                f.write(content[:-10])
+            with self.assertRaises(ValueError):
+                Word2vec().read(file_path)
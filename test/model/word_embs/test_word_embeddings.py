@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+
+import nlpaug.augmenter.word as naw
+from nlpaug.model.word_embs import WordEmbeddings
+from nlpaug.util import derive_seed
+
+
+class TestWordEmbeddings(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.RandomState(2019)
+        vectors = rng.standard_normal((3000, 32)).astype(np.float32)
+        cls.model = WordEmbeddings(top_k=10)
+        for i, vector in enumerate(vectors):
+            word = 'w{}'.format(i)
+            cls.model.i2w[i], cls.model.w2i[word], cls.model.w2v[word] = word, i, vector
+        cls.model.vectors = vectors
+        cls.model.normalized_vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        cls.model.vocab = list(cls.model.w2v)
+
+    def test_predict_batch(self):
+        words = ['w1', 'w20', 'w1', 'w300', 'w20']
+        predictions = self.model.predict_batch(words)
+        self.assertEqual(len(words), len(predictions))
+        self.assertEqual(predictions[0], predictions[2])
+        for word, candidate_words in zip(words, predictions):
+            self.assertEqual(self.model.predict(word), candidate_words)
+            self.assertEqual(10, len(candidate_words))
+            self.assertNotIn(word, candidate_words)
+
+        # Score matrix is split into chunks
+        original_max_num_score = WordEmbeddings.MAX_NUM_SCORE
+        try:
+            WordEmbeddings.MAX_NUM_SCORE = 2 * len(self.model.vectors)
+            self.assertEqual(predictions, self.model.predict_batch(words))
+        finally:
+            WordEmbeddings.MAX_NUM_SCORE = original_max_num_score
+        self.assertEqual([], self.model.predict_batch([]))
+
+    def test_augment_batch(self):
+        aug = naw.WordEmbsAug(model_type='word2vec', model=self.model, aug_p=0.5)
+        texts = [' '.join('w{}'.format((i * 7 + j) % 50) for j in range(10)) for i in range(20)]
+
+        augmented_texts = aug.augment_batch(texts, seed=2019)
+        for i, (text, augmented_text) in enumerate(zip(texts, augmented_texts)):
+            self.assertNotEqual(text, augmented_text)
+            # Same as augmenting one by one
+            self.assertEqual(aug.augment(text, seed=derive_seed(2019, i)), augmented_text)
+
+        # Only words chosen for substitution are predicted
+        aug = naw.WordEmbsAug(model_type='word2vec', model=self.model, aug_p=0.3)
+        texts = [' '.join('w{}'.format(i * 10 + j) for j in range(10)) for i in range(20)]
+        predicted_words = []
+        predict_batch = self.model.predict_batch
+        self.model.predict_batch = lambda words: predicted_words.append(words) or predict_batch(words)
+        try:
+            augmented_texts = aug.augment_batch(texts, seed=2019)
+        finally:
+            del self.model.predict_batch
+        self.assertEqual(3 * len(texts), len(predicted_words[0]))
+        for i, (text, augmented_text) in enumerate(zip(texts, augmented_texts)):
+            self.assertEqual(aug.augment(text, seed=derive_seed(2019, i)), augmented_text)
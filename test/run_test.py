@@ -18,7 +18,9 @@ if __name__ == '__main__':
         'test/augmenter/audio/',
         'test/augmenter/spectrogram/',
         'test/model/char/',
-        'test/util/selection/',
+        'test/model/word_embs/',
+        'test/util/',
+        'test/runner/',
         'test/flow/'
     ]
 
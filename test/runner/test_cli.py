@@ -0,0 +1,122 @@
+import csv
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import nlpaug.augmenter.char as nac
+import nlpaug.flow as naf
+from nlpaug.augmenter.augment import apply_edits
+from nlpaug.runner.cli import main
+from nlpaug.runner.io import read_records, ShardWriter
+from nlpaug.runner.spec import build_augmenter
+
+
+class TestCli(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.texts = ['The quick brown fox jumps over the lazy dog {}'.format(i) for i in range(10)]
+        cls.spec = '[{"type": "char.RandomCharAug"}, {"type": "word.RandomWordAug", "action": "swap"}]'
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def list_shards(output_dir):
+        return sorted(file_name for file_name in os.listdir(output_dir) if file_name.startswith('part-'))
+
+    def read_output(self, output_dir, text_field='text'):
+        records = []
+        for file_name in self.list_shards(output_dir):
+            records.extend(read_records(os.path.join(output_dir, file_name), text_field=text_field))
+        return records
+
+    def test_build_augmenter(self):
+        aug = build_augmenter({'type': 'sometimes', 'pipeline_p': 0.5, 'flow': [
+            {'type': 'char.KeyboardAug'}, {'type': 'word.RandomWordAug', 'action': 'swap'}]})
+        self.assertIsInstance(aug, naf.Sometimes)
+        self.assertEqual(2, len(aug))
+
+        aug = build_augmenter('{"type": "char.RandomCharAug", "action": "insert"}')
+        self.assertIsInstance(aug, nac.RandomCharAug)
+        self.assertEqual('insert', aug.action)
+
+        with self.assertRaises(ValueError):
+            build_augmenter({'type': 'char.UnknownAug'})
+
+    def test_txt(self):
+        input_path = os.path.join(self.temp_dir, 'input.txt')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.texts) + '\n')
+
+        output_dir = os.path.join(self.temp_dir, 'output')
+        main([input_path, '-o', output_dir, '-s', self.spec, '-n', '2', '--shard-size', '6', '--seed', '2019',
+              '-q'])
+
+        self.assertEqual(['part-00000.txt', 'part-00001.txt', 'part-00002.txt', 'part-00003.txt'],
+                         self.list_shards(output_dir))
+        self.assertEqual(20, len(self.read_output(output_dir)))
+
+    def test_jsonl_workers(self):
+        input_path = os.path.join(self.temp_dir, 'input.jsonl.gz')
+        with gzip.open(input_path, 'wt', encoding='utf-8') as f:
+            for i, text in enumerate(self.texts):
+                f.write(json.dumps({'id': i, 'sentence': text}) + '\n')
+
+        results = []
+        for workers in ['1', '2']:
+            output_dir = os.path.join(self.temp_dir, 'output' + workers)
+            main([input_path, '-o', output_dir, '-s', self.spec, '--text-field', 'sentence', '--workers', workers,
+                  '--backend', 'thread', '--chunk-size', '3', '--compression', 'gzip', '--seed', '2019', '-q'])
+            self.assertEqual(['part-00000.jsonl.gz'], self.list_shards(output_dir))
+            results.append(self.read_output(output_dir, text_field='sentence'))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(list(range(10)), [record['id'] for record in results[0]])
+        self.assertTrue(all(isinstance(record['augmented'], str) for record in results[0]))
+
+    def test_csv(self):
+        input_path = os.path.join(self.temp_dir, 'input.csv')
+        with open(input_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['label', 'text'])
+            for text in self.texts:
+                writer.writerow(['positive', text])
+
+        output_dir = os.path.join(self.temp_dir, 'output')
+        main([input_path, '-o', output_dir, '-s', self.spec, '-q'])
+
+        records = self.read_output(output_dir)
+        self.assertEqual(10, len(records))
+        self.assertEqual('positive', records[0]['label'])
+
+    def test_output_edits(self):
+        input_path = os.path.join(self.temp_dir, 'input.txt')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.texts) + '\n')
+
+        output_dirs = [os.path.join(self.temp_dir, 'output'), os.path.join(self.temp_dir, 'edits')]
+        main([input_path, '-o', output_dirs[0], '-s', self.spec, '-n', '2', '--output-format', 'jsonl',
+              '--seed', '2019', '-q'])
+        main([input_path, '-o', output_dirs[1], '-s', self.spec, '-n', '2', '--output-edits', '--seed', '2019',
+              '-q'])
+
+        for record, edit_record in zip(self.read_output(output_dirs[0]), self.read_output(output_dirs[1])):
+            self.assertEqual(record['augmented'], [
+                apply_edits(record['text'], edits) for edits in edit_record['augmented']])
+
+    def test_partial_shard(self):
+        output_dir = os.path.join(self.temp_dir, 'output')
+        with self.assertRaises(RuntimeError):
+            with ShardWriter(output_dir, shard_size=2) as writer:
+                for text in self.texts[:3]:
+                    writer.write({'text': text})
+                raise RuntimeError()
+
+        # Only completed shard is published
+        self.assertEqual(['part-00000.jsonl'], os.listdir(output_dir))
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from nlpaug.runner.cli import main
+from nlpaug.runner.io import read_records
+from nlpaug.runner.job import AugmentationJob
+from nlpaug.runner.spec import build_augmenter
+
+
+class InterruptedJob(AugmentationJob):
+    def __init__(self, *args, interrupt_at=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.interrupt_at = interrupt_at
+        self.num_written = 0
+
+    def write_result(self, writer, record, result):
+        if self.num_written == self.interrupt_at:
+            raise KeyboardInterrupt()
+        super().write_result(writer, record, result)
+        self.num_written += 1
+
+
+class TestJob(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.spec = [{'type': 'char.RandomCharAug'}, {'type': 'word.RandomWordAug', 'action': 'swap'}]
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.temp_dir, 'input.jsonl')
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            for i in range(23):
+                text = 'The quick brown fox jumps over the lazy dog {}'.format(i)
+                f.write(json.dumps({'id': i, 'text': text}) + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read_output(self, output_dir):
+        records = []
+        for file_name in sorted(os.listdir(output_dir)):
+            if file_name.startswith('part-'):
+                records.extend(read_records(os.path.join(output_dir, file_name)))
+        return records
+
+    def test_resume(self):
+        for workers in [1, 2]:
+            kwargs = {'n': 2, 'shard_size': 5, 'chunk_size': 3, 'workers': workers, 'backend': 'thread'}
+            # Seed is not passed. It is persisted in checkpoint by first run.
+            output_dir = os.path.join(self.temp_dir, 'output{}'.format(workers))
+            with self.assertRaises(KeyboardInterrupt):
+                InterruptedJob(build_augmenter(self.spec), self.input_path, output_dir, interrupt_at=12,
+                               **kwargs).run()
+            with self.assertRaises(KeyboardInterrupt):
+                InterruptedJob(build_augmenter(self.spec), self.input_path, output_dir, interrupt_at=3,
+                               **kwargs).run(resume=True)
+            stats = AugmentationJob(build_augmenter(self.spec), self.input_path, output_dir, **kwargs).run(
+                resume=True)
+
+            self.assertEqual(23, stats['num_record'])
+            self.assertEqual(5, stats['num_shard'])
+            self.assertEqual(list(range(23)), [record['id'] for record in self.read_output(output_dir)])
+
+            # Output is same as uninterrupted run of same base seed
+            with open(os.path.join(output_dir, AugmentationJob.CHECKPOINT_FILE), 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            self.assertTrue(checkpoint['completed'])
+            expected_dir = os.path.join(self.temp_dir, 'expected{}'.format(workers))
+            AugmentationJob(build_augmenter(self.spec), self.input_path, expected_dir, seed=checkpoint['seed'],
+                            **kwargs).run()
+            self.assertEqual(self.read_output(expected_dir), self.read_output(output_dir))
+
+    def test_resume_cli(self):
+        output_dir = os.path.join(self.temp_dir, 'output')
+        argv = [self.input_path, '-o', output_dir, '-s', json.dumps(self.spec), '--shard-size', '10',
+                '--seed', '2019', '-q']
+        main(argv)
+        expected = self.read_output(output_dir)
+
+        # Completed job is not processed again
+        main(argv + ['--resume'])
+        self.assertEqual(expected, self.read_output(output_dir))
+
+        with self.assertRaises(ValueError):
+            main(argv[:-3] + ['--seed', '2020', '--resume'])
+        with self.assertRaises(ValueError):
+            main(argv + ['-n', '2', '--resume'])
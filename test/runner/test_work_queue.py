@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from nlpaug.runner.cli import main, queue_main
+from nlpaug.runner.io import read_records
+from nlpaug.runner.work_queue import WorkQueue, TaskStatus, run_worker
+
+
+class TestWorkQueue(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.spec = json.dumps([{'type': 'char.RandomCharAug'}, {'type': 'word.RandomWordAug', 'action': 'swap'}])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.temp_dir, 'input.jsonl')
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            for i in range(23):
+                text = 'The quick brown fox jumps over the lazy dog {}'.format(i)
+                f.write(json.dumps({'id': i, 'text': text}) + '\n')
+        self.queue_dir = os.path.join(self.temp_dir, 'queue')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read_output(self, output_dir):
+        records = []
+        for file_name in sorted(os.listdir(output_dir)):
+            if file_name.startswith('part-'):
+                records.extend(read_records(os.path.join(output_dir, file_name)))
+        return records
+
+    def test_workers(self):
+        queue = WorkQueue.create(self.queue_dir, self.input_path, self.spec, task_size=4, n=2, seed=2019)
+        self.assertEqual(6, len(queue.tasks))
+        self.assertEqual(6, queue.get_status()[TaskStatus.PENDING])
+
+        # Workers (stand-in for hosts) share queue directory
+        threads = [threading.Thread(target=run_worker, args=(self.queue_dir,), kwargs={
+            'worker_id': 'worker{}'.format(i), 'poll_interval': 0.01}) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(6, queue.get_status()[TaskStatus.DONE])
+
+        merged_dir = os.path.join(self.temp_dir, 'merged')
+        stats = queue.merge(merged_dir, shard_size=10)
+        self.assertEqual(23, stats['num_record'])
+        self.assertEqual(3, stats['num_shard'])
+
+        # Same as single host job of same seed
+        expected_dir = os.path.join(self.temp_dir, 'expected')
+        main([self.input_path, '-o', expected_dir, '-s', self.spec, '-n', '2', '--seed', '2019', '-q'])
+        self.assertEqual(self.read_output(expected_dir), self.read_output(merged_dir))
+
+    def test_lease_expiry(self):
+        queue = WorkQueue.create(self.queue_dir, self.input_path, self.spec, task_size=10, seed=2019,
+                                 lease_timeout=0.2)
+        # Workers die after claiming tasks
+        task = queue.claim('dead_worker')
+        self.assertEqual('task-00000', task['id'])
+        self.assertEqual(TaskStatus.LEASED, queue.get_task_status(task['id']))
+        self.assertEqual('task-00001', queue.claim('other_dead_worker')['id'])
+
+        stats = run_worker(self.queue_dir, worker_id='live_worker', poll_interval=0.05)
+        self.assertEqual(3, stats['num_task'])
+        self.assertTrue(queue.is_done())
+        self.assertFalse(queue.renew(task['id'], 'dead_worker'))
+
+    def test_renew_race(self):
+        queue = WorkQueue.create(self.queue_dir, self.input_path, self.spec, task_size=10, seed=2019,
+                                 lease_timeout=60)
+        task = queue.claim('worker1')
+        self.assertTrue(queue.renew(task['id'], 'worker1'))
+        self.assertFalse(queue.renew(task['id'], 'worker2'))
+        self.assertEqual('worker1', queue._read_lease(task['id'])['worker'])
+
+        # Other worker claims the task while lease is being renewed. Only one of them keeps it.
+        read_lease = queue._read_lease
+
+        def claim_during_renew(task_id, lease_path=None):
+            if lease_path is not None and lease_path.endswith('.renew'):
+                self.assertEqual(task, queue.claim('worker2'))
+            return read_lease(task_id, lease_path)
+
+        queue._read_lease = claim_during_renew
+        self.assertFalse(queue.renew(task['id'], 'worker1'))
+        del queue._read_lease
+        self.assertEqual('worker2', queue._read_lease(task['id'])['worker'])
+        self.assertTrue(queue.renew(task['id'], 'worker2'))
+        self.assertEqual(['{}.json'.format(task['id'])], os.listdir(os.path.dirname(
+            queue._get_path('leases', task['id']))))
+
+    def test_verify(self):
+        queue = WorkQueue.create(self.queue_dir, self.input_path, self.spec, task_size=10, seed=2019)
+        run_worker(self.queue_dir, max_task=2)
+        self.assertEqual(['task-00002 is not completed'], queue.verify())
+        with self.assertRaises(ValueError):
+            queue.merge(os.path.join(self.temp_dir, 'merged'))
+
+        run_worker(self.queue_dir)
+        self.assertEqual([], queue.verify())
+        with open(queue.get_output_path('task-00001'), 'a', encoding='utf-8') as f:
+            f.write('{"text": "corrupted"}\n')
+        self.assertEqual(['Checksum of task-00001 output does not match'], queue.verify())
+
+    def test_cli(self):
+        queue_main(['create', self.queue_dir, self.input_path, '-s', self.spec, '--task-size', '5', '--seed', '2019',
+                    '-q'])
+        queue_main(['worker', self.queue_dir, '--workers', '2', '--backend', 'thread', '--chunk-size', '2', '-q'])
+        queue_main(['merge', self.queue_dir, '-o', os.path.join(self.temp_dir, 'merged'), '-q'])
+        self.assertEqual(list(range(23)), [
+            record['id'] for record in self.read_output(os.path.join(self.temp_dir, 'merged'))])
@@ -0,0 +1,117 @@
+import asyncio
+import time
+import unittest
+
+import nlpaug.augmenter.char as nac
+import nlpaug.flow as naf
+from nlpaug.util.async_runner import AsyncRunner
+
+
+class BatchRandomCharAug(nac.RandomCharAug):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def augment_batch(self, data, n=1, num_thread=1, backend=None, seed=None):
+        self.batch_sizes.append(len(data))
+        return super().augment_batch(data, n=n, num_thread=num_thread, backend=backend, seed=seed)
+
+
+class SlowRandomCharAug(nac.RandomCharAug):
+    def substitute(self, data):
+        time.sleep(0.5)
+        return super().substitute(data)
+
+
+class TestAsyncRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.texts = ['The quick brown fox jumps over the lazy dog {}'.format(i) for i in range(8)]
+
+    def test_aaugment(self):
+        aug = nac.RandomCharAug()
+        runner = AsyncRunner()
+
+        async def run():
+            return await asyncio.gather(*[aug.aaugment(text, seed=i, runner=runner)
+                                          for i, text in enumerate(self.texts)])
+
+        augmented_texts = asyncio.run(run())
+        self.assertEqual([aug.augment(text, seed=i) for i, text in enumerate(self.texts)], augmented_texts)
+        runner.shutdown()
+
+    def test_aaugment_batch(self):
+        flow = naf.Sequential([nac.RandomCharAug(), nac.KeyboardAug()])
+        runner = AsyncRunner()
+
+        augmented_texts = asyncio.run(flow.aaugment_batch(self.texts, seed=2019, runner=runner))
+        self.assertEqual(flow.augment_batch(self.texts, seed=2019), augmented_texts)
+        runner.shutdown()
+
+    def test_coalesce(self):
+        aug = BatchRandomCharAug()
+        runner = AsyncRunner(max_batch_size=4, max_wait=0.1)
+
+        async def run():
+            return await asyncio.gather(*[aug.aaugment(text, seed=i, runner=runner)
+                                          for i, text in enumerate(self.texts)])
+
+        augmented_texts = asyncio.run(run())
+        self.assertEqual([4, 4], aug.batch_sizes)
+        self.assertEqual([aug.augment(text, seed=i) for i, text in enumerate(self.texts)], augmented_texts)
+        runner.shutdown()
+
+    def test_coalesce_flow(self):
+        class BatchSequential(naf.Sequential):
+            def augment_batch(self, data, n=1, num_thread=1, backend=None, seed=None):
+                self.batch_sizes.append(len(data))
+                return super().augment_batch(data, n=n, num_thread=num_thread, backend=backend, seed=seed)
+
+        flow = BatchSequential([nac.RandomCharAug(), naf.Sometimes([nac.KeyboardAug()], pipeline_p=0.5)])
+        flow.batch_sizes = []
+        runner = AsyncRunner(max_batch_size=8, max_wait=0.1)
+
+        async def run():
+            # Seeded and unseeded requests run together
+            return await asyncio.gather(*[flow.aaugment(text, seed=7 if i % 2 == 0 else None, runner=runner)
+                                          for i, text in enumerate(self.texts)])
+
+        for _ in range(3):
+            augmented_texts = asyncio.run(run())
+            self.assertEqual([flow.augment(text, seed=7) for text in self.texts[::2]], augmented_texts[::2])
+            for text, augmented_text in zip(self.texts, augmented_texts):
+                self.assertNotEqual(text, augmented_text)
+        # Only unseeded requests are coalesced
+        self.assertEqual([4] * 3, flow.batch_sizes)
+        runner.shutdown()
+
+    def test_closed_loop(self):
+        aug = nac.RandomCharAug()
+        runner = AsyncRunner()
+        for i in range(3):
+            asyncio.run(aug.aaugment(self.texts[0], seed=i, runner=runner))
+        self.assertEqual(1, len(runner._states))
+        runner.shutdown()
+
+    def test_timeout(self):
+        aug = SlowRandomCharAug()
+        runner = AsyncRunner()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(aug.aaugment(self.texts[0], timeout=0.05, runner=runner))
+        runner.shutdown()
+
+    def test_concurrency(self):
+        aug = SlowRandomCharAug()
+        runner = AsyncRunner(max_concurrency=1, num_thread=4)
+
+        async def run():
+            return await asyncio.gather(aug.aaugment(self.texts[0], runner=runner),
+                                        aug.aaugment(self.texts[1], timeout=0.2, runner=runner),
+                                        return_exceptions=True)
+
+        results = asyncio.run(run())
+        # Second request waits for the first one and times out
+        self.assertIsInstance(results[0], str)
+        self.assertIsInstance(results[1], asyncio.TimeoutError)
+        runner.shutdown()
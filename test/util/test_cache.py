@@ -0,0 +1,99 @@
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.audio as naa
+import nlpaug.augmenter.spectrogram as nas
+import nlpaug.flow as naf
+from nlpaug.util.cache import ResultCache
+
+
+class TestCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.text = 'The quick brown fox jumps over the lazy dog'
+
+    def test_lru(self):
+        cache = ResultCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual((True, 1), cache.get('a'))
+        # b is least recently used
+        cache.put('c', 3)
+        self.assertEqual((False, None), cache.get('b'))
+        self.assertEqual((True, 3), cache.get('c'))
+
+        stats = cache.get_stats()
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['evictions'])
+
+    def test_persistent(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            ResultCache(cache_dir=cache_dir).put(('key', 1), ['value'])
+
+            cache = ResultCache(cache_dir=cache_dir)
+            self.assertEqual((True, ['value']), cache.get(('key', 1)))
+            self.assertEqual(1, cache.get_stats()['disk_hits'])
+
+            cache.clear(persistent=True)
+            self.assertEqual((False, None), ResultCache(cache_dir=cache_dir).get(('key', 1)))
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_seeded_augment(self):
+        aug = nac.RandomCharAug().set_cache(ResultCache())
+        augmented_text = aug.augment(self.text, seed=2019)
+        self.assertEqual(augmented_text, aug.augment(self.text, seed=2019))
+        self.assertEqual(1, aug.get_cache_stats()['hits'])
+
+        # Unseeded call is not cached
+        aug.augment(self.text)
+        self.assertEqual(1, aug.get_cache_stats()['misses'])
+
+        # Different n and configuration are different keys
+        aug.augment(self.text, n=2, seed=2019)
+        other_aug = nac.RandomCharAug(aug_char_p=0.9).set_cache(aug.cache)
+        other_aug.augment(self.text, seed=2019)
+        self.assertEqual(1, aug.get_cache_stats()['hits'])
+
+    def test_config_digest(self):
+        aug = nac.RandomCharAug().set_cache(ResultCache())
+        digest = aug.get_cache_digest()
+        aug.augment(self.text, seed=2019)
+        self.assertEqual(digest, aug.get_cache_digest())
+
+        # Digest is computed again after configuration is changed
+        aug.aug_char_p = 0.9
+        self.assertNotEqual(digest, aug.get_cache_digest())
+        aug.augment(self.text, seed=2019)
+        self.assertEqual(0, aug.get_cache_stats()['hits'])
+
+        flow = naf.Sequential([nac.RandomCharAug()])
+        digest = flow.get_cache_digest()
+        flow.append(nac.KeyboardAug())
+        self.assertNotEqual(digest, flow.get_cache_digest())
+
+    def test_model_config(self):
+        cache = ResultCache()
+        data = np.random.random((128, 50))
+        nas.FrequencyMaskingAug(mask_factor=40).set_cache(cache).augment(data, seed=2019)
+        nas.FrequencyMaskingAug(mask_factor=10).set_cache(cache).augment(data, seed=2019)
+        self.assertEqual(0, cache.get_stats()['hits'])
+
+    def test_copy(self):
+        audio = np.random.random(1000).astype(np.float32)
+        aug = naa.LoudnessAug().set_cache(ResultCache())
+        augmented_audio = aug.augment(audio, seed=2019)
+        augmented_audio[:] = 0
+
+        self.assertFalse(np.array_equal(augmented_audio, aug.augment(audio, seed=2019)))
+
+    def test_flow(self):
+        flow = naf.Sequential([nac.RandomCharAug(), nac.KeyboardAug()]).set_cache(ResultCache())
+        augmented_text = flow.augment(self.text, seed=2019)
+        self.assertEqual(augmented_text, flow.augment(self.text, seed=2019))
+        self.assertEqual(1, flow.get_cache_stats()['hits'])
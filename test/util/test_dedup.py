@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+
+from nlpaug.util.dedup import DedupIndex, text_dedup_key, array_dedup_key
+
+
+class TestDedup(unittest.TestCase):
+    def test_text(self):
+        index = DedupIndex(text_dedup_key)
+        self.assertTrue(index.add('The quick brown fox'))
+        self.assertTrue(index.add('The quick brown dog'))
+        self.assertFalse(index.add('The quick brown fox'))
+        self.assertTrue(index.add(['The', 'quick']))
+        self.assertFalse(index.add(['The', 'quick']))
+
+    def test_array(self):
+        data = np.random.randn(100)
+        index = DedupIndex(array_dedup_key)
+        self.assertTrue(index.add(data))
+        self.assertFalse(index.add(data.copy()))
+        self.assertTrue(index.add(data + 1))
+        # Same values with different shape are different data
+        self.assertTrue(index.add(data.reshape(10, 10)))
+        # Non contiguous data
+        self.assertFalse(index.add(np.asfortranarray(data.reshape(10, 10))))
+
+    def test_fallback(self):
+        def is_duplicate(dataset, data):
+            return any(d == data for d in dataset)
+
+        index = DedupIndex(key_fx=lambda x: None, is_duplicate_fx=is_duplicate)
+        self.assertTrue(index.add({'a': 1}))
+        self.assertFalse(index.add({'a': 1}))
+        self.assertTrue(index.add({'a': 2}))
@@ -0,0 +1,91 @@
+import pickle
+import unittest
+
+import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.word as naw
+import nlpaug.flow as naf
+from nlpaug.util.instrumentation import MemoryInstrumentation, NULL_INSTRUMENTATION, Stage, Counter, \
+    InstrumentedModel
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_null_instrumentation(self):
+        aug = nac.RandomCharAug()
+        self.assertEqual(NULL_INSTRUMENTATION, aug.instrumentation)
+        aug.augment('The quick brown fox jumps over the lazy dog')
+        self.assertEqual({}, aug.instrumentation.get_stats())
+
+    def test_memory_instrumentation(self):
+        instrumentation = MemoryInstrumentation()
+        aug = nac.RandomCharAug(name='random_char').set_instrumentation(instrumentation)
+        aug.augment('The quick brown fox jumps over the lazy dog', n=3)
+
+        stats = instrumentation.get_stats()['random_char']
+        for stage in [Stage.AUGMENT, Stage.ACTION, Stage.TOKENIZE, Stage.REVERSE_TOKENIZE, Stage.SAMPLE_AUG_IDXES,
+                      Stage.DEDUP]:
+            self.assertIn(stage, stats['timings'])
+            self.assertGreater(stats['timings'][stage]['count'], 0)
+        self.assertEqual(1, stats['counters'][Counter.CALLS])
+        self.assertGreaterEqual(stats['counters'][Counter.CANDIDATES], 3)
+
+        instrumentation.reset()
+        self.assertEqual({}, instrumentation.get_stats())
+
+    def test_restore(self):
+        aug = nac.RandomCharAug()
+        original_tokenizer = aug.tokenizer
+        aug.set_instrumentation(MemoryInstrumentation())
+        self.assertNotEqual(original_tokenizer, aug.tokenizer)
+        # Replacing instrumentation does not wrap function twice
+        aug.set_instrumentation(MemoryInstrumentation())
+        self.assertEqual(original_tokenizer, aug.tokenizer.fx)
+
+        aug.set_instrumentation(None)
+        self.assertEqual(original_tokenizer, aug.tokenizer)
+        self.assertNotIn('_get_aug_idxes', aug.__dict__)
+
+    def test_oov_skips(self):
+        instrumentation = MemoryInstrumentation()
+        aug = naw.RandomWordAug(action='swap', name='random_word', stopwords=['a', 'b']).set_instrumentation(instrumentation)
+        aug.augment('a b')
+
+        self.assertGreater(instrumentation.get_stats()['random_word']['counters'][Counter.OOV_SKIPS], 0)
+
+    def test_flow(self):
+        instrumentation = MemoryInstrumentation()
+        flow = naf.Sequential([
+            nac.RandomCharAug(name='random_char'),
+            naw.RandomWordAug(name='random_word')
+        ], name='flow')
+        flow.set_instrumentation(instrumentation)
+        flow.augment('The quick brown fox jumps over the lazy dog')
+
+        stats = instrumentation.get_stats()
+        for name in ['flow', 'random_char', 'random_word']:
+            self.assertIn(Stage.AUGMENT, stats[name]['timings'])
+
+    def test_pickle(self):
+        aug = nac.RandomCharAug().set_instrumentation(MemoryInstrumentation())
+        aug = pickle.loads(pickle.dumps(aug))
+        aug.augment('The quick brown fox jumps over the lazy dog')
+        self.assertIn(aug.name, aug.instrumentation.get_stats())
+
+    def test_model_calls(self):
+        class Model:
+            top_k = 10
+
+            def predict(self, word):
+                return [word]
+
+        instrumentation = MemoryInstrumentation()
+        model = InstrumentedModel(Model(), instrumentation, 'aug')
+        # Neither data attribute nor looking up function is counted
+        self.assertEqual(10, model.top_k)
+        predict_fx = model.predict
+        self.assertEqual({}, instrumentation.get_stats())
+
+        predict_fx('fox')
+        model.predict('dog')
+        stats = instrumentation.get_stats()['aug']
+        self.assertEqual(2, stats['counters'][Counter.MODEL_CALLS])
+        self.assertEqual(2, stats['timings'][Stage.MODEL]['count'])
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+import unittest
+
+import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.word as naw
+
+
+class TestLazy(unittest.TestCase):
+    def test_heavy_module_is_not_imported(self):
+        code = 'import sys; import nlpaug.augmenter.word as naw; naw.RandomWordAug(); ' \
+               'import nlpaug.augmenter.audio; import nlpaug.util; ' \
+               'print(",".join(m for m in ["nltk", "torch", "librosa", "matplotlib", "requests"] if m in sys.modules))'
+        output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True)
+        self.assertEqual('', output.strip())
+
+    def test_attribute(self):
+        from nlpaug.augmenter.char import CharAugmenter
+
+        self.assertTrue(issubclass(nac.RandomCharAug, CharAugmenter))
+        self.assertIn('RandomWordAug', dir(naw))
+        self.assertIn('SplitAug', naw.__all__)
+        # Submodule is accessible as well
+        self.assertEqual(naw.WordEmbsAug, naw.word_embs.WordEmbsAug)
+
+        with self.assertRaises(AttributeError):
+            naw.UnknownAug
@@ -0,0 +1,33 @@
+import unittest
+
+from nlpaug.util.oversampling import OversamplingScheduler
+
+
+class TestOversampling(unittest.TestCase):
+    def test_plan(self):
+        scheduler = OversamplingScheduler(max_factor=4)
+        # No history. Request exactly the shortfall
+        self.assertEqual(3, scheduler.plan(size=10, shortfall=3))
+
+        scheduler.update(size=10, calls=9, duplicates=5)
+        self.assertEqual(6, scheduler.plan(size=10, shortfall=3))
+        # Budget is respected
+        self.assertEqual(4, scheduler.plan(size=10, shortfall=3, budget=4))
+        # Other length bucket is not affected
+        self.assertEqual(3, scheduler.plan(size=100, shortfall=3))
+
+        scheduler.update(size=100, calls=10, duplicates=10)
+        self.assertEqual(12, scheduler.plan(size=100, shortfall=3))
+
+    def test_stats(self):
+        scheduler = OversamplingScheduler()
+        scheduler.update(size=10, calls=4, duplicates=1)
+        scheduler.update(size=11, calls=4, duplicates=3)
+
+        stats = scheduler.get_stats()
+        self.assertEqual(8, stats['total_calls'])
+        self.assertEqual(4, stats['wasted_calls'])
+        self.assertEqual({16: 0.5}, stats['duplicate_rates'])
+
+        scheduler.reset()
+        self.assertEqual(0, scheduler.get_stats()['total_calls'])
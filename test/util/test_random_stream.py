@@ -0,0 +1,47 @@
+import unittest
+import random
+import numpy as np
+
+from nlpaug.util.random_stream import RandomStream, derive_seed, generate_seeds, get_random_stream, \
+    use_random_stream, GLOBAL_RANDOM_STREAM
+
+
+class TestRandomStream(unittest.TestCase):
+    def test_derive_seed(self):
+        self.assertEqual(derive_seed(2019, 1), derive_seed(2019, 1))
+        self.assertNotEqual(derive_seed(2019, 1), derive_seed(2019, 2))
+        self.assertNotEqual(derive_seed(2019, 1), derive_seed(2020, 1))
+
+    def test_generate_seeds(self):
+        seeds = generate_seeds(2019, 3, offset=5)
+        self.assertEqual([derive_seed(2019, 5), derive_seed(2019, 6), derive_seed(2019, 7)], seeds)
+        self.assertEqual([None, None], generate_seeds(None, 2))
+        self.assertEqual([1, 2], generate_seeds([1, 2], 2))
+        self.assertEqual(2, len(set(generate_seeds(None, 2, draw=True))))
+        with self.assertRaises(ValueError):
+            generate_seeds([1, 2], 3)
+
+    def test_stream(self):
+        stream1, stream2 = RandomStream(2019), RandomStream(2019)
+        self.assertEqual(stream1.random.random(), stream2.random.random())
+        self.assertEqual(stream1.numpy.integers(100000), stream2.numpy.integers(100000))
+
+        stream = RandomStream.create(random.Random(1))
+        self.assertIsInstance(stream.numpy, np.random.Generator)
+        stream = RandomStream.create(np.random.default_rng(1))
+        self.assertIsInstance(stream.random, random.Random)
+
+    def test_use_random_stream(self):
+        self.assertIs(GLOBAL_RANDOM_STREAM, get_random_stream())
+        with use_random_stream(2019) as stream:
+            self.assertIs(stream, get_random_stream())
+            with use_random_stream(2020) as inner_stream:
+                self.assertIs(inner_stream, get_random_stream())
+            self.assertIs(stream, get_random_stream())
+        self.assertIs(GLOBAL_RANDOM_STREAM, get_random_stream())
+
+    def test_global_stream(self):
+        np.random.seed(2019)
+        expected_values = np.random.randint(0, 100, 5)
+        np.random.seed(2019)
+        self.assertTrue(np.array_equal(expected_values, GLOBAL_RANDOM_STREAM.numpy.integers(0, 100, 5)))
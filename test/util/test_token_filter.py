@@ -0,0 +1,42 @@
+import string
+import unittest
+
+import nlpaug.augmenter.char as nac
+import nlpaug.augmenter.word as naw
+from nlpaug.util.text.token_filter import PUNCTUATION_TOKENS, StopwordIndex
+
+
+class TestTokenFilter(unittest.TestCase):
+    def test_punctuation(self):
+        # Same as substring search on string.punctuation
+        for token in ['', '.', '()', ',-.', '...', '?!', 'a', 'a.', string.punctuation]:
+            self.assertEqual(token in string.punctuation, token in PUNCTUATION_TOKENS)
+
+    def test_stopword_index(self):
+        index = StopwordIndex(['The', 'fox'])
+        self.assertIn('the', index)
+        self.assertIn('FOX', index)
+        self.assertNotIn('quick', index)
+        self.assertEqual(0, len(StopwordIndex()))
+
+        batch_tokens = [['The', 'quick', ',', 'brown', 'fox', '...'], ['FOX', '()', 'jumps']]
+        self.assertEqual([[1, 3, 5], [2]], index.get_eligible_idxes(batch_tokens))
+        self.assertEqual([[1, 2, 3, 5], [1, 2]], index.get_eligible_idxes(batch_tokens, skip_punctuation=False))
+
+    def test_augmenter_stopwords(self):
+        aug = naw.RandomWordAug(stopwords=['the', 'fox'])
+        tokens = ['The', 'quick', ',', 'brown', 'fox']
+        self.assertEqual([1, 3], aug.pre_skip_aug(tokens))
+        self.assertEqual([[1, 3], [0]], aug.pre_skip_aug_batch([tokens, ['jumps', 'the']]))
+        self.assertEqual([1, 3], aug.pre_skip_aug([(t, 'NN') for t in tokens], tuple_idx=0))
+
+        # Index is rebuilt when stopwords is changed
+        aug.stopwords = ['quick']
+        self.assertEqual([0, 3, 4], aug.pre_skip_aug(tokens))
+        aug.stopwords = None
+        self.assertEqual([0, 1, 3, 4], aug.pre_skip_aug(tokens))
+
+        aug = nac.KeyboardAug(stopwords=['quick', 'brown', 'fox'], aug_word_p=1)
+        for seed in range(5):
+            augmented_tokens = aug.augment('The quick brown fox', seed=seed).split(' ')
+            self.assertEqual(['quick', 'brown', 'fox'], augmented_tokens[1:])
@@ -0,0 +1,23 @@
+import unittest
+
+from nlpaug.util.text.token_sequence import TokenSequence, is_token_mode, use_token_sequence
+
+
+class TestTokenSequence(unittest.TestCase):
+    def test_text(self):
+        texts = ['The quick brown fox', ' The  quick\tbrown fox\n ', '', ' ', ' \t\n ', '\tx']
+        for text in texts:
+            tokens = TokenSequence.from_text(text)
+            self.assertEqual(text, tokens.to_text())
+            self.assertEqual(TokenSequence.from_text(text.strip()), tokens.strip())
+            self.assertEqual(text == '', tokens.is_empty())
+
+    def test_from_tokens(self):
+        for tokens in [['The', 'quick'], ['ice cream', '', 'x '], [], ['']]:
+            self.assertEqual(TokenSequence.from_text(' '.join(tokens)), TokenSequence.from_tokens(tokens))
+
+    def test_token_mode(self):
+        self.assertFalse(is_token_mode())
+        with use_token_sequence():
+            self.assertTrue(is_token_mode())
+        self.assertFalse(is_token_mode())